@@ -5,7 +5,7 @@ import json
 from typing import Callable, Optional, Any, Tuple
 from optics_framework.common.logging_config import internal_logger
 from optics_framework.common.optics_builder import OpticsBuilder
-from optics_framework.common.strategies import StrategyManager
+from optics_framework.common.strategies import StrategyManager, DEFAULT_FRAME_MAX_AGE
 from optics_framework.common.base_factory import InstanceFallback
 from optics_framework.common import utils
 from optics_framework.common.ai_self_heal import AISelfHealHandler, HealContext
@@ -19,6 +19,13 @@ def _parse_aoi_param(param: Any, default_value: float) -> float:
     return float(param)
 
 
+def _frame_max_age(session_config: Any) -> float:
+    max_age = getattr(session_config, "frame_reuse_max_age", DEFAULT_FRAME_MAX_AGE)
+    if isinstance(max_age, bool) or not isinstance(max_age, (int, float)):
+        return DEFAULT_FRAME_MAX_AGE
+    return float(max_age)
+
+
 def _parse_aoi_from_kwargs(kwargs: dict) -> Tuple[float, float, float, float, int, bool]:
     aoi_x = _parse_aoi_param(kwargs.pop('aoi_x', '0'), 0)
     aoi_y = _parse_aoi_param(kwargs.pop('aoi_y', '0'), 0)
@@ -79,9 +86,9 @@ def _save_annotated_for_result(
     # Element bbox is in the driver's window coordinate space; scale it to the
     # screenshot's pixel space before drawing (no-op when the two already match).
     bbox = utils.scale_bboxes_for_screenshot([bbox], element_source, screenshot_np)[0]
-    framed = utils.annotate(screenshot_np.copy(), [bbox])
-    utils.save_screenshot(
-        framed,
+    utils.save_annotated_screenshot(
+        screenshot_np,
+        [bbox],
         f"{func_name}_element_detection_result",
         output_dir=execution_dir,
         time_stamp=utils.get_timestamp(),
@@ -146,14 +153,16 @@ def with_self_healing(func: Callable) -> Callable:
                 self.execution_dir, func.__name__,
             )
         self._save_screenshot_if_available(screenshot_np, f"pre-{func.__name__}")
-        results = _locate_element(
-            self.strategy_manager, element,
-            aoi_x, aoi_y, aoi_width, aoi_height, index, is_aoi_used,
-        )
-        return _try_results_until_success(
-            results, func, self, element, args, kwargs,
-            screenshot_np, self.execution_dir, func.__name__,
-        )
+        # Vision strategies reuse the pre-action frame while it is fresh instead of capturing again.
+        with self.strategy_manager.step_frame(screenshot_np):
+            results = _locate_element(
+                self.strategy_manager, element,
+                aoi_x, aoi_y, aoi_width, aoi_height, index, is_aoi_used,
+            )
+            return _try_results_until_success(
+                results, func, self, element, args, kwargs,
+                screenshot_np, self.execution_dir, func.__name__,
+            )
     return wrapper
 
 
@@ -204,7 +213,10 @@ class ActionKeyword:
         # Unwrap InstanceFallback to pass current_instance to StrategyManager
 
         self.strategy_manager = StrategyManager(
-            self.element_source, self.text_detection, self.image_detection
+            self.element_source, self.text_detection, self.image_detection,
+            capture_service=builder.get_screenshot_service(),
+            racing=getattr(builder.session_config, "strategy_racing", False) is True,
+            frame_max_age=_frame_max_age(builder.session_config),
         )
         self.execution_dir = builder.session_config.execution_output_path
         # AI self-heal (last-resort fallback). Inert unless explicitly toggled on AND an
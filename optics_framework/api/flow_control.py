@@ -1,5 +1,7 @@
 import re
-from typing import Optional, Any, Union, Tuple, Callable, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Union, Tuple, Callable, List, Dict, Set
 from urllib.parse import urlparse, parse_qsl
 import os.path
 import ast
@@ -16,11 +18,13 @@ from optics_framework.common.logging_config import internal_logger, execution_lo
 from optics_framework.common.session_manager import Session
 from optics_framework.common.models import ApiData, ElementData
 from optics_framework.common.error import OpticsError, Code
+from optics_framework.common.har_writer import create_har_structure, append_har_entry
 
 
 NO_SESSION_PRESENT = "Session is None after ensure_session call."
 NO_SESSION_ELEMENT_PRESENT = "Session elements is not an ElementData instance or is None."
 VAR_PATTERN = r"\$\{([^}]+)\}"
+API_BATCH_MAX_WORKERS = 8  # concurrent requests per invoke_apis wave
 
 
 def raw_params(*indices):
@@ -50,6 +54,9 @@ class FlowControl:
         self.modules = self.session.modules
         self.keyword_map = keyword_map
         self.config_handler: ConfigHandler = self.session.config_handler
+        # Serialises extraction into session.elements while invoke_apis runs calls in parallel.
+        self._elements_lock = threading.Lock()
+        self._api_log_lock = threading.Lock()
 
     def _ensure_session(self) -> None:
         """Ensures a Session instance is set."""
@@ -1021,6 +1028,71 @@ class FlowControl:
         self._process_response(response, api_def)
         internal_logger.debug(f"[INVOKE_API] Finished processing response for API: {api_name}")
 
+    def invoke_apis(self, *api_identifiers: str) -> None:
+        """Invokes several API definitions, running independent calls in parallel.
+
+        An API that uses a ``${variable}`` extracted by another API of the same
+        batch waits for it; all others are sent concurrently over the session's
+        pooled HTTP client. Calls run in waves of mutually independent APIs, and
+        the first failure is raised once its wave has finished.
+        """
+        self._ensure_session()
+        identifiers = [identifier.strip() for identifier in api_identifiers if identifier and identifier.strip()]
+        if not identifiers:
+            raise OpticsError(Code.E0403, message="Invoke APIs requires at least one API identifier.")
+        definitions = {}
+        for identifier in identifiers:
+            collection_name, api_name = self._parse_api_identifier(identifier)
+            collection = self._get_api_collection(collection_name)
+            definitions[identifier] = (collection, self._get_api_definition(collection, api_name))
+
+        waves = self._plan_api_waves(definitions)
+        internal_logger.debug(f"[INVOKE_APIS] Execution waves: {waves}")
+        with ThreadPoolExecutor(max_workers=min(API_BATCH_MAX_WORKERS, len(identifiers)),
+                                thread_name_prefix="optics-api") as pool:
+            for wave in waves:
+                futures = [pool.submit(self._invoke_definition, *definitions[identifier]) for identifier in wave]
+                errors = [future.exception() for future in futures]
+                first_error = next((error for error in errors if error is not None), None)
+                if first_error is not None:
+                    raise first_error
+
+    def _invoke_definition(self, collection, api_def) -> None:
+        """Prepares, sends and processes one API definition."""
+        url, headers, body = self._prepare_request_details(collection, api_def)
+        response = self._execute_request(url, headers, body, api_def.request.method)
+        with self._elements_lock:
+            self._process_response(response, api_def)
+
+    def _plan_api_waves(self, definitions: Dict[str, Tuple[Any, Any]]) -> List[List[str]]:
+        """Groups APIs into waves so each runs after the APIs extracting the variables it uses."""
+        produces: Dict[str, Set[str]] = {}
+        consumes: Dict[str, Set[str]] = {}
+        for identifier, (collection, api_def) in definitions.items():
+            expected = getattr(api_def, "expected_result", None)
+            produces[identifier] = set(getattr(expected, "extract", None) or {})
+            request_parts = [api_def.endpoint, collection.global_headers, api_def.request.headers, api_def.request.body]
+            consumes[identifier] = set(re.findall(VAR_PATTERN, json.dumps(request_parts, default=str)))
+            consumes[identifier] = {name.strip() for name in consumes[identifier]}
+
+        depends_on = {
+            identifier: {
+                other for other in definitions
+                if other != identifier and produces[other] & consumes[identifier]
+            }
+            for identifier in definitions
+        }
+        waves: List[List[str]] = []
+        done: Set[str] = set()
+        while len(done) < len(definitions):
+            wave = [i for i in definitions if i not in done and depends_on[i] <= done]
+            if not wave:
+                pending = sorted(set(definitions) - done)
+                raise OpticsError(Code.E0403, message=f"Circular extract dependencies between APIs: {pending}")
+            waves.append(wave)
+            done.update(wave)
+        return waves
+
     def _parse_api_identifier(self, identifier: str) -> Tuple[str, str]:
         """Parses 'collection.api' into a tuple."""
         parts = identifier.split(".", 1)
@@ -1092,15 +1164,16 @@ class FlowControl:
                 api_har_file_path = os.path.join(api_log_dir, "api_details.har")
 
             start_time = datetime.now(timezone.utc)
-            response = requests.request(
+            response = self.session.get_http_session().request(
                 method, url, headers=headers, json=body, timeout=30
             )
             time_taken = response.elapsed.total_seconds() * 1000
 
             if api_log_dir and api_log_file_path is not None:
-                self._write_api_log(
-                    api_log_file_path, method, url, headers, body, response
-                )
+                with self._api_log_lock:
+                    self._write_api_log(
+                        api_log_file_path, method, url, headers, body, response
+                    )
                 self._write_api_har(
                     api_har_file_path,
                     start_time,
@@ -1143,7 +1216,11 @@ class FlowControl:
         body,
         response,
     ):
-        """Writes API request/response details to a HAR file."""
+        """Records API request/response details in a HAR file.
+
+        The entry is appended to the file's journal by the shared HAR writer; the
+        HAR document itself is written when the session ends (see ``har_writer``).
+        """
         parsed_url = urlparse(url)
         query_string = [{"name": k, "value": v} for k, v in parse_qsl(parsed_url.query)]
 
@@ -1193,32 +1270,12 @@ class FlowControl:
             },
         }
 
-        if har_file_path is not None and os.path.exists(har_file_path):
-            with open(har_file_path, "r", encoding="utf-8") as f:
-                try:
-                    har_data = json.load(f)
-                    if "log" not in har_data or "entries" not in har_data["log"]:
-                        har_data = self._create_har_structure()
-                except json.JSONDecodeError:
-                    har_data = self._create_har_structure()
-        else:
-            har_data = self._create_har_structure()
-
-        har_data["log"]["entries"].append(har_entry)
-
         if har_file_path is not None:
-            with open(har_file_path, "w", encoding="utf-8") as f:
-                json.dump(har_data, f, indent=2)
+            append_har_entry(har_file_path, har_entry)
 
     def _create_har_structure(self) -> dict:
         """Creates a basic HAR file structure."""
-        return {
-            "log": {
-                "version": "1.2",
-                "creator": {"name": "Optics Framework", "version": "1.0"},
-                "entries": [],
-            }
-        }
+        return create_har_structure()
 
     def _process_response(self, response: requests.Response, api_def) -> None:
         """Extracts data from the response and saves it to session elements."""
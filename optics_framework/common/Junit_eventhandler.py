@@ -180,7 +180,7 @@ class JUnitEventHandler(EventSubscriber):
             # cleanup
             del self.testcase_cases[event.entity_id]
             del self.start_times[event.entity_id]
-            del self.keyword_elements[event.entity_id]
+            self.keyword_elements.pop(event.entity_id, None)
             if event.entity_id in self.module_names:
                 del self.module_names[event.entity_id]
 
@@ -0,0 +1,202 @@
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from optics_framework.common.artifact_writer import get_artifact_writer, write_artifact
+from optics_framework.common.events import Event, EventStatus, EventSubscriber
+from optics_framework.common.logging_config import internal_logger
+
+CAPTURE_LEVELS = ("none", "on_failure", "sampled", "full")
+DEFAULT_RING_SIZE = 20
+DEFAULT_SAMPLE_EVERY = 10
+
+# (path, callable, args, droppable)
+_Artifact = Tuple[str, Callable[..., Any], Tuple[Any, ...], bool]
+
+
+class ArtifactPolicy:
+    """
+    Decides which automatically captured artifacts reach the output directory.
+
+    Screenshots (pre-action frames, detection annotations) and page source
+    snapshots are governed by ``level``:
+
+    - ``full``: write everything (the default).
+    - ``none``: write nothing.
+    - ``on_failure``: keep the last ``ring_size`` artifacts in memory and write
+      them only when a step fails (:meth:`step_failed`).
+    - ``sampled``: write every ``sample_every``-th artifact of each kind and
+      keep the others in the failure ring like ``on_failure``.
+
+    The ring holds frames in memory, so its size bounds the memory spent on
+    failure evidence (roughly one decoded frame per screenshot entry).
+    """
+
+    def __init__(self, level: str = "full", ring_size: int = DEFAULT_RING_SIZE,
+                 sample_every: int = DEFAULT_SAMPLE_EVERY):
+        if level not in CAPTURE_LEVELS:
+            raise ValueError(
+                f"Unsupported artifact capture level '{level}'. Available: {', '.join(CAPTURE_LEVELS)}")
+        self.level = level
+        self.sample_every = max(1, int(sample_every))
+        self._ring: Deque[_Artifact] = deque(maxlen=max(1, int(ring_size)))
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def should_write(self, kind: str) -> Optional[bool]:
+        """``True`` to write now, ``False`` to keep in the failure ring, ``None`` to discard."""
+        if self.level == "full":
+            return True
+        if self.level == "none":
+            return None
+        if self.level == "sampled":
+            with self._lock:
+                count = self._counts.get(kind, 0)
+                self._counts[kind] = count + 1
+            if count % self.sample_every == 0:
+                return True
+        return False
+
+    def keep(self, path: str, fn: Callable[..., Any], args: Tuple[Any, ...], droppable: bool) -> None:
+        """Hold an artifact until the next failure; the oldest entry falls out when the ring is full."""
+        with self._lock:
+            self._ring.append((path, fn, args, droppable))
+
+    def step_failed(self, output_dir: str, reason: str = "") -> int:
+        """Write every artifact held in the ring; returns how many were written."""
+        with self._lock:
+            held = list(self._ring)
+            self._ring.clear()
+        if held:
+            internal_logger.info(
+                f"Writing {len(held)} buffered artifacts for failed step {reason}".rstrip())
+        for path, fn, args, droppable in held:
+            write_artifact(output_dir, path, fn, *args, droppable=droppable)
+        return len(held)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ring.clear()
+            self._counts.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ring)
+
+
+class ArtifactFailureSubscriber(EventSubscriber):
+    """
+    Writes the failure ring of an output directory when a keyword fails.
+
+    With a ``session_id`` only keyword failures of that session count, so
+    several sessions can subscribe on one event manager (parallel device
+    runs) and each flushes only its own directory.
+    """
+
+    def __init__(self, output_dir: str, session_id: Optional[str] = None):
+        self.output_dir = output_dir
+        self.session_id = session_id
+
+    async def on_event(self, event: Event) -> None:
+        if event.entity_type != "keyword" or event.status != EventStatus.FAIL:
+            return
+        if self.session_id is not None and (event.extra or {}).get("session_id") != self.session_id:
+            return
+        record_step_failure(self.output_dir, event.name)
+
+
+_policies: Dict[str, ArtifactPolicy] = {}
+_refs: Dict[str, int] = {}
+_policies_lock = threading.Lock()
+
+
+def _key(output_dir: str) -> str:
+    return os.path.abspath(output_dir)
+
+
+def set_artifact_policy(output_dir: str, policy: Optional[ArtifactPolicy]) -> None:
+    """Install ``policy`` for ``output_dir``; ``None`` restores the default of writing everything."""
+    with _policies_lock:
+        if policy is None:
+            _policies.pop(_key(output_dir), None)
+        else:
+            _policies[_key(output_dir)] = policy
+
+
+def open_artifact_policy(output_dir: str, policy: ArtifactPolicy) -> ArtifactPolicy:
+    """
+    Install ``policy`` for ``output_dir`` on behalf of one session.
+
+    Sessions sharing an output directory share the first session's policy; it
+    is removed when the last of them calls :func:`close_artifact_policy`.
+    """
+    key = _key(output_dir)
+    with _policies_lock:
+        current = _policies.get(key)
+        if current is None:
+            current = policy
+            _policies[key] = current
+        elif current.level != policy.level:
+            internal_logger.warning(
+                f"Artifact capture for {output_dir} stays '{current.level}'; "
+                f"another session already set it (requested '{policy.level}')")
+        _refs[key] = _refs.get(key, 0) + 1
+        return current
+
+
+def close_artifact_policy(output_dir: str) -> None:
+    """Release one reference to the policy of ``output_dir``; the last release removes it."""
+    key = _key(output_dir)
+    with _policies_lock:
+        remaining = _refs.get(key, 0) - 1
+        if remaining > 0:
+            _refs[key] = remaining
+        else:
+            _refs.pop(key, None)
+            _policies.pop(key, None)
+
+
+def get_artifact_policy(output_dir: Optional[str]) -> Optional[ArtifactPolicy]:
+    if output_dir is None:
+        return None
+    with _policies_lock:
+        return _policies.get(_key(output_dir))
+
+
+def record_step_failure(output_dir: Optional[str], reason: str = "") -> int:
+    """Tell the policy of ``output_dir`` that a step failed, writing its buffered artifacts."""
+    policy = get_artifact_policy(output_dir)
+    if policy is None or output_dir is None:
+        return 0
+    return policy.step_failed(output_dir, reason)
+
+
+def emit_artifact(
+    output_dir: str,
+    kind: str,
+    path: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    detach: Optional[Callable[[Tuple[Any, ...]], Tuple[Any, ...]]] = None,
+    droppable: bool = True,
+) -> None:
+    """
+    Write ``fn(*args)`` to ``path`` subject to the policy and writer of ``output_dir``.
+
+    :param kind: Artifact kind the policy samples by (``"screenshot"``, ``"page_source"``).
+    :param detach: Makes ``args`` safe to use after the caller returns (e.g. copies a
+        frame); only applied when the write is deferred to a worker or the ring.
+    """
+    policy = get_artifact_policy(output_dir)
+    decision = True if policy is None else policy.should_write(kind)
+    if decision is None:
+        return
+    if decision and get_artifact_writer(output_dir) is None:
+        fn(*args)
+        return
+    if detach is not None:
+        args = detach(args)
+    if decision:
+        write_artifact(output_dir, path, fn, *args, droppable=droppable)
+    elif policy is not None:
+        policy.keep(path, fn, args, droppable)
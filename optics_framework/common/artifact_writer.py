@@ -0,0 +1,265 @@
+import atexit
+import os
+import queue
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from optics_framework.common.logging_config import internal_logger
+
+ARTIFACT_MODES = ("async", "sync")
+DROP_POLICIES = ("block", "drop_newest", "drop_oldest")
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_BLOCK_TIMEOUT = 5.0
+
+# (callable, args, droppable)
+_Job = Tuple[Callable[..., Any], Tuple[Any, ...], bool]
+
+
+class ArtifactWriter:
+    """
+    Background writer for the screenshots and logs saved into one output directory.
+
+    Keywords hand over a write (encoding included) and return immediately;
+    worker threads perform it. Each job carries a key, normally the target file
+    path, and jobs with the same key always run on the same worker in
+    submission order, so appends to ``page_sources_log.xml`` stay ordered while
+    independent screenshots are written in parallel.
+
+    The queue is bounded (``queue_size`` jobs across all workers). When it is
+    full, ``drop_policy`` decides what happens to a droppable job such as a
+    screenshot:
+
+    - ``block``: wait up to ``block_timeout`` seconds for room, then drop it.
+    - ``drop_newest``: drop the job being submitted.
+    - ``drop_oldest``: discard the oldest queued screenshot to make room.
+
+    Jobs submitted with ``droppable=False`` (page source and element logs) are
+    never dropped; they wait for room instead. :meth:`flush` blocks until
+    everything queued so far is on disk.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        drop_policy: str = "block",
+        block_timeout: float = DEFAULT_BLOCK_TIMEOUT,
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Unsupported artifact drop policy '{drop_policy}'. Available: {', '.join(DROP_POLICIES)}")
+        self.output_dir = output_dir
+        self.workers = max(1, int(workers))
+        self.drop_policy = drop_policy
+        self.block_timeout = float(block_timeout)
+        per_worker = max(1, int(queue_size) // self.workers)
+        self._queues: List["queue.Queue[Optional[_Job]]"] = [
+            queue.Queue(maxsize=per_worker) for _ in range(self.workers)
+        ]
+        self._stats_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._closed = False
+        # Guards _closed against in-flight submissions so none lands behind the stop sentinel.
+        self._state = threading.Condition()
+        self._submitting = 0
+        self._threads = [
+            threading.Thread(target=self._run, args=(i,), name=f"optics-artifacts-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _shard(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % self.workers
+
+    def _count(self, field: str) -> None:
+        with self._stats_lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def _execute(self, job: _Job) -> None:
+        fn, args, _ = job
+        try:
+            fn(*args)
+            self._count("written")
+        except Exception as e:
+            self._count("failed")
+            internal_logger.error(f"Failed to write artifact in {self.output_dir}: {e}")
+
+    def _run(self, shard: int) -> None:
+        jobs = self._queues[shard]
+        while True:
+            job = jobs.get()
+            try:
+                if job is None:
+                    return
+                self._execute(job)
+            finally:
+                jobs.task_done()
+
+    @staticmethod
+    def _evict_oldest_droppable(jobs: "queue.Queue[Optional[_Job]]") -> bool:
+        """Remove the oldest droppable job from ``jobs``; ``False`` if every queued job must be kept."""
+        with jobs.mutex:
+            for i, queued in enumerate(jobs.queue):
+                if queued is not None and queued[2]:
+                    del jobs.queue[i]
+                    jobs.unfinished_tasks -= 1
+                    if jobs.unfinished_tasks == 0:
+                        jobs.all_tasks_done.notify_all()
+                    jobs.not_full.notify()
+                    return True
+        return False
+
+    def _drop(self, what: str) -> None:
+        self._count("dropped")
+        internal_logger.warning(f"Artifact queue for {self.output_dir} is full; dropped {what}")
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any, droppable: bool = True) -> bool:
+        """
+        Queue ``fn(*args)`` for a worker.
+
+        :param key: Ordering key, normally the path being written.
+        :param fn: Callable doing the encoding and I/O; its arguments must not be
+            mutated by the caller afterwards.
+        :param droppable: Whether the job may be discarded when the queue is full.
+        :return: ``False`` if the job was dropped.
+        """
+        with self._state:
+            closed = self._closed
+            if not closed:
+                self._submitting += 1
+        if closed:
+            fn(*args)
+            return True
+        try:
+            return self._enqueue(key, (fn, args, droppable))
+        finally:
+            with self._state:
+                self._submitting -= 1
+                if self._submitting == 0:
+                    self._state.notify_all()
+
+    def _enqueue(self, key: str, job: _Job) -> bool:
+        droppable = job[2]
+        shard = self._shard(key)
+        jobs = self._queues[shard]
+        if not droppable:
+            jobs.put(job)
+            return True
+        if self.drop_policy == "drop_oldest":
+            while True:
+                try:
+                    jobs.put_nowait(job)
+                    return True
+                except queue.Full:
+                    if not self._evict_oldest_droppable(jobs):
+                        break
+                    self._drop("the oldest queued artifact")
+        try:
+            if self.drop_policy == "drop_newest":
+                jobs.put_nowait(job)
+            else:
+                jobs.put(job, timeout=self.block_timeout)
+            return True
+        except queue.Full:
+            self._drop(os.path.basename(key))
+            return False
+
+    def flush(self) -> None:
+        """Block until every job submitted so far has been written (or dropped)."""
+        for jobs in self._queues:
+            jobs.join()
+
+    def close(self) -> None:
+        """Flush and stop the workers; later submissions are written synchronously."""
+        with self._state:
+            if self._closed:
+                return
+            self._closed = True
+            while self._submitting:
+                self._state.wait()
+        self.flush()
+        for jobs in self._queues:
+            jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+
+_writers: Dict[str, ArtifactWriter] = {}
+_refs: Dict[str, int] = {}
+_writers_lock = threading.Lock()
+
+
+def _key(output_dir: str) -> str:
+    return os.path.abspath(output_dir)
+
+
+def open_artifact_writer(
+    output_dir: str,
+    workers: int = DEFAULT_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    drop_policy: str = "block",
+) -> ArtifactWriter:
+    """
+    Start writing artifacts for ``output_dir`` in the background.
+
+    Sessions sharing an output directory share one writer; it is closed when
+    the last of them calls :func:`close_artifact_writer`.
+    """
+    key = _key(output_dir)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = ArtifactWriter(key, workers=workers, queue_size=queue_size, drop_policy=drop_policy)
+            _writers[key] = writer
+        _refs[key] = _refs.get(key, 0) + 1
+        return writer
+
+
+def get_artifact_writer(output_dir: Optional[str]) -> Optional[ArtifactWriter]:
+    """Return the open writer for ``output_dir``, or ``None`` when artifacts there are written synchronously."""
+    if output_dir is None:
+        return None
+    with _writers_lock:
+        return _writers.get(_key(output_dir))
+
+
+def write_artifact(output_dir: str, path: str, fn: Callable[..., Any], *args: Any, droppable: bool = True) -> None:
+    """Run ``fn(*args)`` on the writer for ``output_dir``, or right away if none is open."""
+    writer = get_artifact_writer(output_dir)
+    if writer is None:
+        fn(*args)
+        return
+    writer.submit(path, fn, *args, droppable=droppable)
+
+
+def close_artifact_writer(output_dir: str) -> None:
+    """Release one reference to the writer for ``output_dir``; the last release flushes and stops it."""
+    key = _key(output_dir)
+    with _writers_lock:
+        remaining = _refs.get(key, 0) - 1
+        if remaining > 0:
+            _refs[key] = remaining
+            writer = None
+        else:
+            _refs.pop(key, None)
+            writer = _writers.pop(key, None)
+    if writer is not None:
+        writer.close()
+
+
+def close_artifact_writers() -> None:
+    """Flush and stop every writer; registered to run at interpreter exit."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+        _refs.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_artifact_writers)
@@ -0,0 +1,164 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+import cv2
+import numpy as np
+from skimage.metrics import structural_similarity as ssim
+from optics_framework.common.logging_config import internal_logger
+
+DEFAULT_SSIM_THRESHOLD = 0.75
+
+
+def _to_gray(frame: np.ndarray) -> np.ndarray:
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+
+
+def _ssim(reference: np.ndarray, gray: np.ndarray) -> float:
+    data_range = int(gray.max()) - int(gray.min())
+    if data_range == 0:
+        # Flat frame: identical only if the reference is the same flat colour.
+        return 1.0 if np.array_equal(reference, gray) else 0.0
+    return float(ssim(reference, gray, data_range=data_range))
+
+
+class ChangeDetector(ABC):
+    """
+    Decides whether a frame differs enough from the last distinct frame to be kept.
+
+    Implementations cache whatever they need from the reference frame, so the
+    previous frame is never re-processed. The reference only advances when a
+    frame is reported as changed.
+    """
+
+    @abstractmethod
+    def is_duplicate(self, frame: np.ndarray) -> bool:
+        """Return True if ``frame`` matches the reference; otherwise make it the new reference."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget the reference frame."""
+
+
+class SSIMChangeDetector(ChangeDetector):
+    """Full-resolution grayscale SSIM against the last distinct frame (the original behaviour)."""
+
+    def __init__(self, threshold: float = DEFAULT_SSIM_THRESHOLD):
+        self.threshold = threshold
+        self._reference: Optional[np.ndarray] = None
+
+    def is_duplicate(self, frame: np.ndarray) -> bool:
+        gray = _to_gray(frame)
+        if self._reference is not None and self._reference.shape == gray.shape:
+            if _ssim(self._reference, gray) >= self.threshold:
+                return True
+        self._reference = gray
+        return False
+
+    def reset(self) -> None:
+        self._reference = None
+
+
+class TieredChangeDetector(ChangeDetector):
+    """
+    Cheap-first change detection on a cached thumbnail of the reference frame.
+
+    Each frame is shrunk once (``cv2.INTER_AREA``) to at most ``thumbnail_size``
+    pixels on its longest side and converted to grayscale. It is then compared
+    with the reference thumbnail in tiers, stopping at the first decisive one:
+
+    1. difference hash: a Hamming distance above ``hash_distance`` means changed;
+    2. mean absolute difference: at most ``mad_same`` means duplicate, at least
+       ``mad_changed`` means changed;
+    3. SSIM on the thumbnails against ``threshold``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_SSIM_THRESHOLD,
+        thumbnail_size: int = 160,
+        hash_distance: int = 24,
+        mad_same: float = 1.0,
+        mad_changed: float = 48.0,
+    ):
+        self.threshold = threshold
+        self.thumbnail_size = thumbnail_size
+        self.hash_distance = hash_distance
+        self.mad_same = mad_same
+        self.mad_changed = mad_changed
+        self._reference: Optional[np.ndarray] = None
+        self._reference_hash: Optional[np.ndarray] = None
+        self._reference_shape: Optional[tuple] = None
+
+    def thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale first, then convert to grayscale, so colour conversion runs on few pixels."""
+        h, w = frame.shape[:2]
+        scale = self.thumbnail_size / float(max(h, w))
+        if scale < 1.0:
+            size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return _to_gray(frame)
+
+    @staticmethod
+    def difference_hash(thumb: np.ndarray) -> np.ndarray:
+        """64-bit dHash: sign of horizontal gradients on a 9x8 reduction."""
+        small = cv2.resize(thumb, (9, 8), interpolation=cv2.INTER_AREA)
+        return small[:, 1:] > small[:, :-1]
+
+    def _set_reference(self, frame: np.ndarray, thumb: np.ndarray, frame_hash: np.ndarray) -> None:
+        self._reference = thumb
+        self._reference_hash = frame_hash
+        self._reference_shape = frame.shape
+
+    def is_duplicate(self, frame: np.ndarray) -> bool:
+        thumb = self.thumbnail(frame)
+        frame_hash = self.difference_hash(thumb)
+        if self._reference is None or self._reference_shape != frame.shape:
+            self._set_reference(frame, thumb, frame_hash)
+            return False
+
+        distance = int(np.count_nonzero(frame_hash != self._reference_hash))
+        if distance > self.hash_distance:
+            self._set_reference(frame, thumb, frame_hash)
+            return False
+
+        mad = float(cv2.absdiff(self._reference, thumb).mean())
+        if mad <= self.mad_same:
+            return True
+        if mad >= self.mad_changed:
+            self._set_reference(frame, thumb, frame_hash)
+            return False
+
+        similarity = _ssim(self._reference, thumb)
+        if similarity >= self.threshold:
+            internal_logger.debug(f"Duplicate frame (thumbnail SSIM: {similarity:.4f}, MAD: {mad:.2f})")
+            return True
+        self._set_reference(frame, thumb, frame_hash)
+        return False
+
+    def reset(self) -> None:
+        self._reference = None
+        self._reference_hash = None
+        self._reference_shape = None
+
+
+CHANGE_DETECTORS = {
+    "tiered": TieredChangeDetector,
+    "ssim": SSIMChangeDetector,
+}
+
+
+def create_change_detector(
+    detector: Union[str, ChangeDetector, None] = None, threshold: float = DEFAULT_SSIM_THRESHOLD
+) -> ChangeDetector:
+    """
+    Resolve a change detector from an instance, a registered name or ``None`` (tiered).
+
+    :param detector: A :class:`ChangeDetector`, one of ``CHANGE_DETECTORS`` or ``None``.
+    :param threshold: SSIM threshold for detectors created by name.
+    :raises ValueError: If the name is not registered.
+    """
+    if isinstance(detector, ChangeDetector):
+        return detector
+    name = (detector or "tiered").lower()
+    if name not in CHANGE_DETECTORS:
+        raise ValueError(f"Unknown change detector '{detector}'. Available: {', '.join(CHANGE_DETECTORS)}")
+    return CHANGE_DETECTORS[name](threshold=threshold)
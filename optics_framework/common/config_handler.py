@@ -39,7 +39,23 @@ class Config(BaseModel):
     event_attributes_json: Optional[str] = None
     halt_duration: float = 0.1
     max_attempts: int = 3
+    screenshot_stream_fps: float = 4.0
+    screenshot_stream_max_backoff: float = 2.0
+    screenshot_change_detector: str = "tiered"
+    strategy_racing: bool = False
+    frame_reuse_max_age: float = 0.5
     ai_self_heal: bool = False
+    artifact_writer: str = "async"
+    artifact_writer_workers: int = 2
+    artifact_queue_size: int = 64
+    artifact_drop_policy: str = "block"
+    artifact_capture: str = "full"
+    artifact_ring_size: int = 20
+    artifact_sample_every: int = 10
+    session_pool_size: int = 0
+    devices: List[Dict[str, Any]] = Field(default_factory=list)
+    test_affinity: Dict[str, str] = Field(default_factory=dict)
+    work_stealing: bool = True
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -87,6 +87,25 @@ class ElementSourceInterface(ABC):
             f"{self.__class__.__name__} does not support get_page_source"
         )
 
+    def capture_region(
+        self, aoi_x: float, aoi_y: float, aoi_width: float, aoi_height: float
+    ) -> Tuple[numpy.ndarray, Tuple[int, int, int, int]]:
+        """
+        Capture only an Area of Interest of the screen.
+        Optional: raise NotImplementedError if this element source cannot clip natively;
+        callers then crop a full :meth:`capture` instead.
+
+        :param aoi_x: X percentage of AOI top-left corner (0-100).
+        :param aoi_y: Y percentage of AOI top-left corner (0-100).
+        :param aoi_width: Width percentage of AOI (0-100).
+        :param aoi_height: Height percentage of AOI (0-100).
+        :return: Tuple of (region image, (x1, y1, x2, y2)) with bounds in full-screenshot pixels.
+        :rtype: Tuple[numpy.ndarray, Tuple[int, int, int, int]]
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support capture_region"
+        )
+
     @abstractmethod
     def get_interactive_elements(self, filter_config: Optional[List[str]] = None) -> list:
         """
@@ -4,12 +4,13 @@ import os
 import json
 import inspect
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Callable
+from typing import Optional, List, Any, Callable, Dict
 from pydantic import BaseModel, Field, ConfigDict
 from optics_framework.common.session_manager import SessionManager, Session
 from optics_framework.common.runner.keyword_register import KeywordRegistry
 from optics_framework.common.runner.printers import TreeResultPrinter, TerminalWidthProvider, NullResultPrinter
 from optics_framework.common.runner.test_runnner import TestRunner, PytestRunner, Runner, KeywordRunner
+from optics_framework.common.runner.scheduler import ParallelTestRunner
 from optics_framework.common.logging_config import LoggerContext, internal_logger
 from optics_framework.common.models import TestCaseNode
 from optics_framework.common.error import OpticsError, Code
@@ -29,6 +30,8 @@ class ExecutionParams(BaseModel):
     # test_cases, modules, elements, apis are now part of Session
     runner_type: str = "test_runner"
     use_printer: bool = True
+    # Device name -> session id; with more than one device, test cases run in parallel
+    device_sessions: Dict[str, str] = Field(default_factory=dict)
 
 
 class Executor(ABC):
@@ -211,13 +214,7 @@ class KeywordExecutor(Executor):
 class RunnerFactory:
     """Creates runners with dependency injection."""
     @staticmethod
-    def create_runner(
-        session: Session,
-        runner_type: str,
-        use_printer: bool,
-        event_manager: EventManager
-    ) -> Runner:
-
+    def _build_keyword_map(session: Session) -> Dict[str, Callable[..., Any]]:
         registry = KeywordRegistry()
         action_keyword = session.optics.build(ActionKeyword)
         app_management = session.optics.build(AppManagement)
@@ -226,23 +223,71 @@ class RunnerFactory:
         registry.register(app_management)
         registry.register(verifier)
         registry.register(FlowControl(session=session, keyword_map=registry.keyword_map))
+        return registry.keyword_map
+
+    @staticmethod
+    def create_runner(
+        session: Session,
+        runner_type: str,
+        use_printer: bool,
+        event_manager: EventManager
+    ) -> Runner:
+
+        keyword_map = RunnerFactory._build_keyword_map(session)
 
         if runner_type == "test_runner":
             result_printer = TreeResultPrinter.get_instance(
                 TerminalWidthProvider()) if use_printer else NullResultPrinter()
             runner = TestRunner(
-                session, registry.keyword_map, result_printer, event_manager=event_manager
+                session, keyword_map, result_printer, event_manager=event_manager
             )
         elif runner_type == "pytest":
             runner = PytestRunner(
-                session, registry.keyword_map, event_manager=event_manager
+                session, keyword_map, event_manager=event_manager
             )
         elif runner_type == "keyword_runner":
-            runner = KeywordRunner(registry.keyword_map)
+            runner = KeywordRunner(keyword_map)
         else:
             raise OpticsError(Code.E0601, message=f"Unknown runner type: {runner_type}")
         return runner
 
+    @staticmethod
+    def create_parallel_runner(
+        sessions: Dict[str, Session],
+        use_printer: bool,
+        event_manager: EventManager,
+    ) -> ParallelTestRunner:
+        """
+        Build one TestRunner per device session, all reporting to ``event_manager``.
+
+        The first session supplies the scheduling options (``test_affinity``,
+        ``work_stealing``) and, through ``event_manager``, the merged JUnit output.
+        Each session's artifact failure subscriber is moved onto ``event_manager``
+        too, since that is where its keyword failures are now published.
+        """
+        for session in sessions.values():
+            subscriber = getattr(session, "artifact_subscriber", None)
+            if subscriber is not None:
+                event_manager.subscribe(f"artifacts_{session.session_id}", subscriber)
+        result_printer = TreeResultPrinter.get_instance(
+            TerminalWidthProvider()) if use_printer else NullResultPrinter()
+        runners = {
+            device: TestRunner(
+                session,
+                RunnerFactory._build_keyword_map(session),
+                result_printer,
+                event_manager=event_manager,
+            )
+            for device, session in sessions.items()
+        }
+        config = next(iter(sessions.values())).config
+        return ParallelTestRunner(
+            runners,
+            result_printer,
+            affinity=config.test_affinity,
+            work_stealing=config.work_stealing,
+        )
+
 
 def _execution_event(
     session_id: str, status: EventStatus, message: str
@@ -362,6 +407,19 @@ class ExecutionEngine:
             await asyncio.sleep(0.1)
         event_manager.shutdown()
 
+    def _device_sessions(self, params: ExecutionParams, runner_type: str) -> Dict[str, Session]:
+        """Sessions to spread test cases across; empty unless a multi-device batch or dry run was requested."""
+        if len(params.device_sessions) < 2 or runner_type != "test_runner" \
+                or params.mode not in ("batch", "dry_run"):
+            return {}
+        sessions: Dict[str, Session] = {}
+        for device, session_id in params.device_sessions.items():
+            device_session = self.session_manager.get_session(session_id)
+            if device_session is None:
+                raise OpticsError(Code.E0702, message=f"Session for device '{device}' not found")
+            sessions[device] = device_session
+        return sessions
+
     async def execute(self, params: ExecutionParams) -> Any:
         event_manager = get_event_manager(params.session_id)
         session = self.session_manager.get_session(params.session_id)
@@ -379,9 +437,15 @@ class ExecutionEngine:
         runner_type = "keyword_runner" if params.mode == "keyword" else params.runner_type
 
         with LoggerContext(params.session_id):
-            runner = RunnerFactory.create_runner(
-                session, runner_type, use_printer, event_manager=event_manager
-            )
+            device_sessions = self._device_sessions(params, runner_type)
+            if device_sessions:
+                runner: Runner = RunnerFactory.create_parallel_runner(
+                    device_sessions, use_printer, event_manager=event_manager
+                )
+            else:
+                runner = RunnerFactory.create_runner(
+                    session, runner_type, use_printer, event_manager=event_manager
+                )
             if hasattr(runner, "result_printer") and runner.result_printer and use_printer:
                 internal_logger.debug("Starting result printer live display")
                 runner.result_printer.start_live()
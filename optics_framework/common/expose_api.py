@@ -12,9 +12,11 @@ import pkgutil
 import asyncio
 import warnings
 import hashlib
+import threading
+from contextlib import asynccontextmanager
 from itertools import product
 from typing import Annotated, Optional, Dict, Any, List, Union, cast, Callable, Tuple, NamedTuple
-from fastapi import FastAPI, HTTPException, Query, Body
+from fastapi import FastAPI, HTTPException, Query, Body, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import status
 from pydantic import BaseModel, ValidationError
@@ -29,16 +31,39 @@ from optics_framework.common.logging_config import internal_logger, reconfigure_
 from optics_framework.common.error import OpticsError, Code
 from optics_framework.common.config_handler import Config, DependencyConfig
 from optics_framework.common.runner.keyword_register import KeywordRegistry
-from optics_framework.common.utils import _is_list_type
+from optics_framework.common.artifact_policy import record_step_failure
+from optics_framework.common.utils import _is_list_type, encode_numpy_to_base64
+from optics_framework.common.workspace_delta import (
+    WorkspaceDelta,
+    discard_workspace_images,
+    find_workspace_image,
+    frame_fingerprint,
+    get_workspace_images,
+    text_fingerprint,
+)
+from optics_framework.common.workspace_stream import (
+    STREAM_CLOSED,
+    WorkspaceProducer,
+    close_workspace_producers,
+    get_workspace_producer,
+)
 from optics_framework.api import ActionKeyword, AppManagement, FlowControl, Verifier
 from optics_framework.helper.execute import discover_templates
 from optics_framework.helper.version import VERSION
 
-app = FastAPI(title="Optics Framework API", version="1.0")
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Build the keyword catalog once at startup rather than on the first request
+    keyword_catalog()
+    yield
+
+
+app = FastAPI(title="Optics Framework API", version="1.0", lifespan=_lifespan)
 session_manager = SessionManager()
 
-# Store last workspace hash per session for change detection
-workspace_hashes: Dict[str, str] = {}
+# Idle OCR engines / LLM clients kept per engine config for the next sessions
+SESSION_POOL_SIZE = int(os.getenv("OPTICS_SESSION_POOL_SIZE", "2"))
 
 # --- API / HTTP messages ---
 SESSION_NOT_FOUND = "Session not found"
@@ -91,6 +116,10 @@ STATUS_TERMINATED = "terminated"
 STATUS_OK = "ok"
 WORKSPACE_TYPE_HEARTBEAT = "heartbeat"
 WORKSPACE_TYPE_ERROR = "error"
+WORKSPACE_PROTOCOL_FULL = "full"
+WORKSPACE_PROTOCOL_DELTA = "delta"
+WORKSPACE_IMAGE_NOT_FOUND = "Workspace image not found"
+WORKSPACE_BUFFER_SIZE = 4
 
 # --- Other ---
 HEALTH_STATUS_RUNNING = "Optics Framework API is running"
@@ -378,6 +407,26 @@ def discover_keywords() -> List[KeywordInfo]:
         keywords.extend(_extract_keywords_from_module(module))
     return keywords
 
+
+_keyword_catalog: Optional[List[KeywordInfo]] = None
+_keyword_catalog_lock = threading.Lock()
+
+
+def keyword_catalog() -> List[KeywordInfo]:
+    """
+    Keyword signatures of the API classes, discovered once per process.
+
+    The API classes do not change while the server runs, so the result of
+    :func:`discover_keywords` is built on first use (at startup) and shared by
+    every request.
+    """
+    global _keyword_catalog
+    with _keyword_catalog_lock:
+        if _keyword_catalog is None:
+            _keyword_catalog = discover_keywords()
+            internal_logger.debug(f"Keyword catalog built with {len(_keyword_catalog)} keywords")
+        return _keyword_catalog
+
 @app.get("/", response_model=HealthCheckResponse, status_code=status.HTTP_200_OK)
 async def health_check():
     """
@@ -432,7 +481,8 @@ async def create_session(config: SessionConfig):
             text_detection=text_detection,
             image_detection=image_detection,
             project_path=config.project_path,
-            log_level=LOG_LEVEL_DEBUG
+            log_level=LOG_LEVEL_DEBUG,
+            session_pool_size=SESSION_POOL_SIZE,
         )
         templates = (
             discover_templates(config.project_path) if config.project_path else None
@@ -794,6 +844,7 @@ async def _handle_execution_failure(
     e: Exception, session: Session, execution_id: str, keyword: str
 ) -> None:
     """Put FAIL event and raise HTTPException. Never returns."""
+    record_step_failure(session.config.execution_output_path, keyword)
     await session.event_queue.put(ExecutionEvent(
         execution_id=execution_id,
         status=STATUS_FAIL,
@@ -1035,29 +1086,58 @@ async def stream_workspace(
     session_id: str,
     interval_ms: int = Query(2000, description="Polling interval in milliseconds (minimum 500ms)"),
     include_source: bool = Query(False, description="Include page source in workspace data"),
-    filter_config: Optional[List[str]] = Query(None, description="Filter types for elements: all, interactive, buttons, inputs, images, text")
+    filter_config: Optional[List[str]] = Query(None, description="Filter types for elements: all, interactive, buttons, inputs, images, text"),
+    protocol: str = Query(WORKSPACE_PROTOCOL_FULL, description="full: whole workspace on every change; delta: element patches and screenshot references"),
 ):
     """
     Stream workspace data (screenshot, elements, optionally source) for the specified session using Server-Sent Events (SSE).
     Only emits updates when workspace data actually changes, reducing load on the driver.
+
+    With ``protocol=delta`` the first message is a snapshot and later ones only
+    carry what changed: element add/remove/modify patches keyed by stable ids,
+    and screenshots as references to ``/workspace/images/{image_id}``.
     """
     session = session_manager.get_session(session_id)
     if not session:
         internal_logger.error(f"Session not found for workspace streaming: {session_id}")
         raise HTTPException(status_code=404, detail=SESSION_NOT_FOUND)
+    if protocol not in (WORKSPACE_PROTOCOL_FULL, WORKSPACE_PROTOCOL_DELTA):
+        raise HTTPException(status_code=400, detail=f"Unsupported workspace protocol: {protocol}")
 
     # Enforce minimum interval to prevent tight loops
     interval_seconds = max(0.5, interval_ms / 1000.0)
 
-    internal_logger.info(f"Starting workspace stream for session {session_id}, interval={interval_seconds}s, include_source={include_source}")
+    internal_logger.info(f"Starting workspace stream for session {session_id}, interval={interval_seconds}s, include_source={include_source}, protocol={protocol}")
+    if protocol == WORKSPACE_PROTOCOL_DELTA:
+        return EventSourceResponse(workspace_delta_generator(session, interval_seconds, include_source, filter_config))
     return EventSourceResponse(workspace_generator(session, interval_seconds, include_source, filter_config))
 
+@app.get(
+    "/v1/sessions/{session_id}/workspace/images/{image_id}",
+    responses={
+        404: {"description": "Session or image not found"},
+    },
+)
+async def get_workspace_image(session_id: str, image_id: str):
+    """
+    Return a screenshot referenced by the delta workspace stream as PNG.
+    Images are addressed by content, so responses never change and may be cached.
+    """
+    png = find_workspace_image(session_id, image_id)
+    if png is None:
+        raise HTTPException(status_code=404, detail=WORKSPACE_IMAGE_NOT_FOUND)
+    return Response(
+        content=png,
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=31536000, immutable", "ETag": f'"{image_id}"'},
+    )
+
 @app.get("/v1/keywords", response_model=List[KeywordInfo])
 async def list_keywords():
     """
     List all available keywords and their parameters.
     """
-    return discover_keywords()
+    return keyword_catalog()
 
 
 def _empty_workspace_data(include_source: bool) -> Dict[str, Any]:
@@ -1082,53 +1162,94 @@ async def _capture_source_safe(verifier: Verifier) -> str:
         return ""
 
 
-async def _gather_workspace_data(
+class _WorkspaceCapture(NamedTuple):
+    frame: Any  # Optional[np.ndarray]
+    elements: List[Any]
+    source: Optional[Any]
+    frame_id: Optional[str] = None
+
+
+def _grab_workspace_frame(session: Session, verifier: Verifier) -> Tuple[Any, Optional[str]]:
+    """
+    Raw frame and its fingerprint. A frame the session's screenshot service took
+    within its last tick (e.g. while a keyword waits on the screen) is reused
+    instead of asking the device for another one.
+    """
+    service = session.optics.get_screenshot_service()
+    frame = service.get_recent_screenshot(service.interval)
+    if frame is None:
+        frame = verifier.strategy_manager.capture_screenshot()
+    return frame, frame_fingerprint(frame) if frame is not None else None
+
+
+async def _capture_workspace(
     session: Session,
     include_source: bool = False,
     filter_config: Optional[List[str]] = None
-) -> Dict[str, Any]:
+) -> _WorkspaceCapture:
     """
-    Gather workspace data (screenshot, elements, optionally source) from a session.
-    Returns a dict with screenshot, elements, and optionally source.
+    Capture the raw screenshot, interactive elements and optionally page source of a session.
+    The frame stays decoded so change detection can fingerprint pixels instead of base64 text.
     """
-    try:
-        verifier = session.optics.build(Verifier)
+    verifier = session.optics.build(Verifier)
 
-        screenshot_task = asyncio.create_task(asyncio.to_thread(verifier.capture_screenshot))
-        elements_task = asyncio.create_task(asyncio.to_thread(verifier.get_interactive_elements, filter_config))
+    screenshot_task = asyncio.create_task(asyncio.to_thread(_grab_workspace_frame, session, verifier))
+    elements_task = asyncio.create_task(asyncio.to_thread(verifier.get_interactive_elements, filter_config))
 
-        screenshot, elements = await asyncio.gather(screenshot_task, elements_task)
+    (frame, frame_id), elements = await asyncio.gather(screenshot_task, elements_task)
+    source = await _capture_source_safe(verifier) if include_source else None
+    return _WorkspaceCapture(frame, elements or [], source, frame_id)
 
-        workspace_data: Dict[str, Any] = {
-            KEY_SCREENSHOT: screenshot or "",
-            KEY_ELEMENTS: elements or [],
-            KEY_SCREENSHOT_FAILED: not screenshot,
-        }
 
-        if include_source:
-            workspace_data[KEY_SOURCE] = await _capture_source_safe(verifier)
+def _workspace_data(capture: _WorkspaceCapture, include_source: bool) -> Dict[str, Any]:
+    """Full workspace payload of a capture, with the screenshot as base64 PNG."""
+    screenshot = encode_numpy_to_base64(capture.frame) if capture.frame is not None else ""
+    workspace_data: Dict[str, Any] = {
+        KEY_SCREENSHOT: screenshot,
+        KEY_ELEMENTS: capture.elements,
+        KEY_SCREENSHOT_FAILED: not screenshot,
+    }
+    if include_source:
+        workspace_data[KEY_SOURCE] = capture.source or ""
+    return workspace_data
 
-        return workspace_data
-    except Exception as e:
-        internal_logger.error(f"Error gathering workspace data: {e}")
-        return _empty_workspace_data(include_source)
 
-def _compute_workspace_hash(workspace_data: Dict[str, Any]) -> str:
+def _compute_workspace_hash(capture: _WorkspaceCapture) -> str:
     """
-    Compute a hash of workspace data for change detection.
-    Uses screenshot and elements, optionally source if included.
+    Compute a fingerprint of a workspace capture for change detection.
+    The screenshot contributes a digest of its raw pixels; the page source only its text,
+    not its capture timestamp.
     """
-    # Create a canonical representation for hashing
+    source = capture.source
+    if isinstance(source, dict):
+        source = source.get("page_source", "")
+    frame_id = capture.frame_id
+    if frame_id is None and capture.frame is not None:
+        frame_id = frame_fingerprint(capture.frame)
     hash_data = {
-        KEY_SCREENSHOT: workspace_data.get(KEY_SCREENSHOT, ""),
-        KEY_ELEMENTS: json.dumps(workspace_data.get(KEY_ELEMENTS, []), sort_keys=True),
+        KEY_SCREENSHOT: frame_id or "",
+        KEY_ELEMENTS: capture.elements,
+        KEY_SOURCE: text_fingerprint(str(source or "")),
     }
-    if KEY_SOURCE in workspace_data:
-        hash_data[KEY_SOURCE] = workspace_data.get(KEY_SOURCE, "")
-
-    hash_str = json.dumps(hash_data, sort_keys=True)
+    hash_str = json.dumps(hash_data, sort_keys=True, default=str)
     return hashlib.sha256(hash_str.encode()).hexdigest()
 
+
+def _workspace_producer(
+    session: Session,
+    include_source: bool = False,
+    filter_config: Optional[List[str]] = None
+) -> WorkspaceProducer:
+    """The capture loop shared by all workspace streams of this session with the same options."""
+    key = (session.session_id, include_source, tuple(sorted(filter_config or [])))
+    return get_workspace_producer(key, lambda: WorkspaceProducer(
+        key,
+        capture=lambda: _capture_workspace(session, include_source, filter_config),
+        fingerprint=_compute_workspace_hash,
+        alive=lambda: session_manager.get_session(session.session_id) is not None,
+    ))
+
+
 async def workspace_generator(
     session: Session,
     interval_seconds: float,
@@ -1137,56 +1258,87 @@ async def workspace_generator(
 ):
     """
     Generator for streaming workspace updates with change detection.
-    Only emits when workspace data actually changes.
+    Subscribes to the session's shared workspace producer, which only publishes
+    captures that differ from the previous one; the payload of a capture is
+    encoded once for all clients.
     """
     HEARTBEAT_INTERVAL = 15.0  # seconds
-    last_heartbeat = asyncio.get_event_loop().time()
+    producer = _workspace_producer(session, include_source, filter_config)
+    subscriber = producer.subscribe(interval_seconds, WORKSPACE_BUFFER_SIZE)
+    try:
+        while True:
+            try:
+                item = await subscriber.get(HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                internal_logger.debug(f"Heartbeat for workspace stream session {session.session_id}")
+                now = asyncio.get_event_loop().time()
+                yield {KEY_DATA: json.dumps({KEY_TYPE: WORKSPACE_TYPE_HEARTBEAT, KEY_TIMESTAMP: now})}
+                continue
 
-    while True:
-        try:
-            # Check if session still exists
-            if not session_manager.get_session(session.session_id):
+            if item is STREAM_CLOSED:
                 internal_logger.warning(f"Session {session.session_id} no longer exists, ending workspace stream")
                 break
+            if isinstance(item, Exception):
+                yield {KEY_DATA: json.dumps({
+                    KEY_TYPE: WORKSPACE_TYPE_ERROR,
+                    KEY_MESSAGE: str(item),
+                    KEY_SCREENSHOT: "",
+                    KEY_ELEMENTS: [],
+                    KEY_SCREENSHOT_FAILED: True
+                })}
+                continue
 
-            # Gather workspace data
-            workspace_data = await _gather_workspace_data(session, include_source, filter_config)
+            internal_logger.debug(f"Workspace data changed for session {session.session_id}, emitting update")
+            yield {KEY_DATA: producer.render(item, lambda capture: json.dumps(_workspace_data(capture, include_source)))}
+    except asyncio.CancelledError:
+        internal_logger.warning(f"Workspace stream cancelled for session {session.session_id}")
+        raise
+    finally:
+        producer.unsubscribe(subscriber)
 
-            # Compute hash for change detection
-            current_hash = _compute_workspace_hash(workspace_data)
-            last_hash = workspace_hashes.get(session.session_id)
+def _workspace_image_url(session_id: str) -> Callable[[str], str]:
+    return lambda image_id: f"/v1/sessions/{session_id}/workspace/images/{image_id}"
 
-            # Only emit if data changed
-            if last_hash is None or current_hash != last_hash:
-                workspace_hashes[session.session_id] = current_hash
-                internal_logger.debug(f"Workspace data changed for session {session.session_id}, emitting update")
-                yield {KEY_DATA: json.dumps(workspace_data)}
-                last_heartbeat = asyncio.get_event_loop().time()
-            else:
-                # No change, check if we need to send heartbeat
+async def workspace_delta_generator(
+    session: Session,
+    interval_seconds: float,
+    include_source: bool = False,
+    filter_config: Optional[List[str]] = None
+):
+    """
+    Generator for the differential workspace stream: a snapshot, then only what changed.
+    Captures come from the session's shared workspace producer; the delta state is kept
+    per client, so every subscriber gets a consistent sequence of patches even when it
+    skipped captures while falling behind.
+    """
+    HEARTBEAT_INTERVAL = 15.0  # seconds
+    delta = WorkspaceDelta(get_workspace_images(session.session_id), _workspace_image_url(session.session_id))
+    producer = _workspace_producer(session, include_source, filter_config)
+    subscriber = producer.subscribe(interval_seconds, WORKSPACE_BUFFER_SIZE)
+    try:
+        while True:
+            try:
+                item = await subscriber.get(HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
                 now = asyncio.get_event_loop().time()
-                if now - last_heartbeat >= HEARTBEAT_INTERVAL:
-                    internal_logger.debug(f"Heartbeat for workspace stream session {session.session_id}")
-                    yield {KEY_DATA: json.dumps({KEY_TYPE: WORKSPACE_TYPE_HEARTBEAT, KEY_TIMESTAMP: now})}
-                    last_heartbeat = now
+                yield {KEY_DATA: json.dumps({KEY_TYPE: WORKSPACE_TYPE_HEARTBEAT, KEY_TIMESTAMP: now})}
+                continue
 
-            # Wait for next interval
-            await asyncio.sleep(interval_seconds)
+            if item is STREAM_CLOSED:
+                internal_logger.warning(f"Session {session.session_id} no longer exists, ending workspace stream")
+                break
+            if isinstance(item, Exception):
+                yield {KEY_DATA: json.dumps({KEY_TYPE: WORKSPACE_TYPE_ERROR, KEY_MESSAGE: str(item)})}
+                continue
 
-        except asyncio.CancelledError:
-            internal_logger.warning(f"Workspace stream cancelled for session {session.session_id}")
-            raise
-        except Exception as e:
-            internal_logger.error(f"Error in workspace stream for session {session.session_id}: {e}")
-            yield {KEY_DATA: json.dumps({
-                KEY_TYPE: WORKSPACE_TYPE_ERROR,
-                KEY_MESSAGE: str(e),
-                KEY_SCREENSHOT: "",
-                KEY_ELEMENTS: [],
-                KEY_SCREENSHOT_FAILED: True
-            })}
-            # Wait before retrying to avoid tight error loops
-            await asyncio.sleep(interval_seconds)
+            message = await asyncio.to_thread(delta.update, item.frame, item.elements, item.source, item.frame_id)
+            if message is not None:
+                yield {KEY_DATA: json.dumps(message, default=str)}
+    except asyncio.CancelledError:
+        internal_logger.warning(f"Workspace stream cancelled for session {session.session_id}")
+        raise
+    finally:
+        producer.unsubscribe(subscriber)
 
 async def event_generator(session: Session):
     """
@@ -1267,7 +1419,8 @@ async def delete_session(session_id: str):
         internal_logger.error(f"Failed to terminate session {session_id}: {e}")
         raise HTTPException(status_code=500, detail=f"{MSG_SESSION_TERMINATION_FAILED} {e}") from e
     session_manager.terminate_session(session_id)
-    # Clean up workspace hash entry to prevent memory leak
-    workspace_hashes.pop(session_id, None)
+    # End workspace streams and drop streamed images to prevent memory leak
+    close_workspace_producers(session_id)
+    discard_workspace_images(session_id)
     internal_logger.info(f"Terminated session: {session_id}")
     return TerminationResponse()
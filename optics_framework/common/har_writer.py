@@ -0,0 +1,226 @@
+import atexit
+import json
+import os
+import queue
+import threading
+from typing import Dict, Iterator, Optional
+from optics_framework.common.logging_config import internal_logger
+
+HAR_CREATOR = {"name": "Optics Framework", "version": "1.0"}
+
+
+def create_har_structure() -> dict:
+    """Creates a basic HAR file structure."""
+    return {
+        "log": {
+            "version": "1.2",
+            "creator": dict(HAR_CREATOR),
+            "entries": [],
+        }
+    }
+
+
+def journal_path_for(har_path: str) -> str:
+    """Path of the append-only journal that backs ``har_path``."""
+    return f"{har_path}.journal"
+
+
+def _read_journal(journal_path: str) -> Iterator[str]:
+    """Yield each complete JSON entry line; a line torn by a crash is skipped."""
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                json.loads(line)
+            except json.JSONDecodeError:
+                internal_logger.warning(f"Skipping unreadable HAR journal line in {journal_path}")
+                continue
+            yield line
+
+
+def write_har_from_journal(har_path: str, journal_path: Optional[str] = None) -> int:
+    """
+    Write a complete HAR document from the journal, streaming entry by entry.
+
+    The document is written to a temporary file and moved into place, so readers
+    never see a half-written HAR. Returns the number of entries written.
+    """
+    journal_path = journal_path or journal_path_for(har_path)
+    tmp_path = f"{har_path}.{os.getpid()}.tmp"
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        header = json.dumps({"version": "1.2", "creator": HAR_CREATOR})
+        out.write('{"log": ' + header[:-1] + ', "entries": [\n')
+        if os.path.exists(journal_path):
+            for line in _read_journal(journal_path):
+                if count:
+                    out.write(",\n")
+                out.write(line)
+                count += 1
+        out.write("\n]}}\n")
+    os.replace(tmp_path, har_path)
+    return count
+
+
+def recover_har(har_path: str) -> int:
+    """Finalize the HAR left behind by a crashed run from its journal; returns the entry count."""
+    journal_path = journal_path_for(har_path)
+    if not os.path.exists(journal_path):
+        return 0
+    count = write_har_from_journal(har_path, journal_path)
+    os.remove(journal_path)
+    return count
+
+
+class HarWriter:
+    """
+    Append-only HAR recorder for one ``.har`` file.
+
+    Entries are serialized by the caller and appended by a background thread as
+    one JSON line each to ``<har>.journal``, so recording an API call costs a
+    queue put instead of re-reading and rewriting the whole HAR. :meth:`finalize`
+    streams the journal into a valid HAR document; :meth:`close` does the same
+    and removes the journal.
+
+    Entries of an existing HAR file are carried over into a new journal, so
+    runs sharing an output directory keep appending as before. A journal found
+    on open is left over from a crashed run; its entries are kept and end up in
+    the next finalized document.
+    """
+
+    def __init__(self, har_path: str):
+        self.har_path = har_path
+        self.journal_path = journal_path_for(har_path)
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._file_lock = threading.Lock()
+        self._closed = False
+        self._seed_journal()
+        self._thread = threading.Thread(target=self._run, name="optics-har-writer", daemon=True)
+        self._thread.start()
+
+    def _seed_journal(self) -> None:
+        if os.path.exists(self.journal_path):
+            internal_logger.info(f"Recovering HAR entries from journal {self.journal_path}")
+            return
+        entries = []
+        if os.path.exists(self.har_path):
+            try:
+                with open(self.har_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("log", {}).get("entries", [])
+            except (OSError, json.JSONDecodeError, AttributeError) as e:
+                internal_logger.warning(f"Ignoring unreadable HAR file {self.har_path}: {e}")
+                entries = []
+        with open(self.journal_path, "w", encoding="utf-8") as journal:
+            for entry in entries:
+                journal.write(json.dumps(entry) + "\n")
+
+    def append(self, entry: dict) -> None:
+        """Serialize one HAR entry and queue it for the journal."""
+        if self._closed:
+            raise RuntimeError(f"HAR writer for {self.har_path} is closed")
+        self._queue.put(json.dumps(entry))
+
+    def _run(self) -> None:
+        while True:
+            # Block for the first line, then take whatever else is queued so
+            # bursts of API calls share one journal write.
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    with self._file_lock:
+                        with open(self.journal_path, "a", encoding="utf-8") as journal:
+                            journal.write("\n".join(lines) + "\n")
+            except OSError as e:
+                internal_logger.error(f"Failed to write HAR journal {self.journal_path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(lines) != len(batch):
+                return
+
+    def flush(self) -> None:
+        """Block until every queued entry is in the journal."""
+        self._queue.join()
+
+    def finalize(self) -> int:
+        """Flush and write the full HAR document; the writer stays usable."""
+        self.flush()
+        with self._file_lock:
+            return write_har_from_journal(self.har_path, self.journal_path)
+
+    def close(self) -> int:
+        """Finalize, stop the flush thread and remove the journal."""
+        if self._closed:
+            return 0
+        count = self.finalize()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        try:
+            os.remove(self.journal_path)
+        except OSError:
+            pass
+        return count
+
+
+_writers: Dict[str, HarWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_har_writer(har_path: str) -> HarWriter:
+    """Return the process-wide writer for ``har_path``, creating it on first use."""
+    key = os.path.abspath(har_path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._closed:
+            writer = HarWriter(key)
+            _writers[key] = writer
+        return writer
+
+
+def append_har_entry(har_path: str, entry: dict) -> None:
+    """Queue ``entry`` on the writer for ``har_path``; safe against a concurrent :func:`close_har_writer`."""
+    key = os.path.abspath(har_path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._closed:
+            writer = HarWriter(key)
+            _writers[key] = writer
+        writer.append(entry)
+
+
+def close_har_writer(har_path: str) -> None:
+    """Finalize and close the writer for ``har_path`` (e.g. when its session ends), if one is open."""
+    key = os.path.abspath(har_path)
+    # Held while closing so a concurrent append cannot open a second writer on the same journal.
+    with _writers_lock:
+        writer = _writers.pop(key, None)
+        if writer is None:
+            return
+        try:
+            writer.close()
+        except OSError as e:
+            internal_logger.error(f"Failed to close HAR file {writer.har_path}: {e}")
+
+
+def close_har_writers() -> None:
+    """Finalize and close every writer; registered to run at interpreter exit."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        try:
+            writer.close()
+        except OSError as e:
+            internal_logger.error(f"Failed to close HAR file {writer.har_path}: {e}")
+
+
+atexit.register(close_har_writers)
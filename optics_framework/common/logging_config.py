@@ -1,12 +1,14 @@
 import logging
 import queue
+import contextvars
 import time
 import re
 import atexit
 from logging.handlers import QueueHandler, RotatingFileHandler
 from rich.logging import RichHandler
 from pydantic import BaseModel
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
 from pathlib import Path
 
 class LoggingConfig(BaseModel):
@@ -131,6 +133,11 @@ class SessionLoggerAdapter(logging.LoggerAdapter):
         kwargs["extra"]["session_id"] = session_id
         return msg, kwargs
 
+_active_capture: contextvars.ContextVar[Optional["LogCaptureBuffer"]] = contextvars.ContextVar(
+    "optics_log_capture", default=None
+)
+
+
 class LogCaptureBuffer(logging.Handler):
     """
     Custom log handler to capture logs emitted during keyword execution.
@@ -138,10 +145,33 @@ class LogCaptureBuffer(logging.Handler):
     def __init__(self):
         super().__init__()
         self.records = []
+        self._scoped = False
+
+    def filter(self, record):
+        if self._scoped and _active_capture.get() is not self:
+            return False
+        return super().filter(record)
 
     def emit(self, record):
         self.records.append(record)
 
+    @contextmanager
+    def capture(self, logger: logging.Logger) -> Iterator["LogCaptureBuffer"]:
+        """
+        Attach to ``logger`` for the duration of the block, keeping only the
+        records logged from the current context: the calling task and the
+        threads it starts with ``asyncio.to_thread``. Records of keywords that
+        other runners execute at the same time are left out.
+        """
+        self._scoped = True
+        token = _active_capture.set(self)
+        logger.addHandler(self)
+        try:
+            yield self
+        finally:
+            logger.removeHandler(self)
+            _active_capture.reset(token)
+
     def clear(self):
         self.records.clear()
 
@@ -1,4 +1,4 @@
-from typing import Union, List, Dict, Optional, Type, TypeVar, Any
+from typing import Union, List, Dict, Optional, Type, TypeVar, Any, Callable
 from pydantic import BaseModel
 from optics_framework.common.base_factory import InstanceFallback
 from optics_framework.common.driver_interface import DriverInterface
@@ -7,6 +7,9 @@ from optics_framework.common.image_interface import ImageInterface
 from optics_framework.common.text_interface import TextInterface
 from optics_framework.common.llm_interface import LLMInterface
 from optics_framework.common.error import OpticsError, Code
+from optics_framework.common.screenshot_stream import ScreenshotCaptureService
+from optics_framework.common.session_pool import config_fingerprint, get_component_pool
+from optics_framework.common.logging_config import internal_logger
 from optics_framework.common.factories import (
     DeviceFactory,
     ElementSourceFactory,
@@ -18,6 +21,17 @@ from optics_framework.common.factories import (
 T = TypeVar("T")  # Generic type for the build method
 
 
+def _close_component(component: Any) -> None:
+    """Call ``close()`` on every engine of ``component`` that has one (e.g. to release shared models)."""
+    for instance in component.instances if isinstance(component, InstanceFallback) else [component]:
+        close = getattr(instance, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                internal_logger.warning(f"Failed to close {type(instance).__name__}: {e}")
+
+
 class OpticsConfig(BaseModel):
     """Configuration for OpticsBuilder."""
 
@@ -36,6 +50,8 @@ class OpticsBuilder:
     def __init__(self, session) -> None:
         self.config: OpticsConfig = OpticsConfig()
         self._instances: Dict[str, Any] = {}
+        # Instance name -> pool key of components taken from the session pool
+        self._pooled: Dict[str, str] = {}
         self.session = session
         self.event_sdk = session.event_sdk
         self.session_config = session.config
@@ -149,8 +165,8 @@ class OpticsBuilder:
         if not self.config.text_config:
             return None
         normalized_config = self.normalise_config(self.config.text_config)
-        text_detection: InstanceFallback[TextInterface] = TextFactory.get_driver(
-            normalized_config
+        text_detection: InstanceFallback[TextInterface] = self._from_pool(
+            "text_detection", normalized_config, lambda: TextFactory.get_driver(normalized_config)
         )
         self._instances["text_detection"] = text_detection
         return text_detection
@@ -159,10 +175,56 @@ class OpticsBuilder:
         if not self.config.llm_config:
             return None
         normalized_config = self.normalise_config(self.config.llm_config)
-        llm: InstanceFallback[LLMInterface] = LLMFactory.get_driver(normalized_config)
+        llm: InstanceFallback[LLMInterface] = self._from_pool(
+            "llm", normalized_config, lambda: LLMFactory.get_driver(normalized_config)
+        )
         self._instances["llm"] = llm
         return llm
 
+    def _from_pool(self, name: str, normalized_config: List[Dict[Any, Any]], build: Callable[[], Any]) -> Any:
+        """
+        Take a component matching ``normalized_config`` from the session pool, or build one.
+
+        Only stateless heavy components (OCR engines, LLM clients) go through
+        the pool; drivers, element sources and image detection hold per-session
+        state. Does nothing when ``session_pool_size`` is 0.
+        """
+        size = getattr(self.session_config, "session_pool_size", 0)
+        if size <= 0:
+            return build()
+        pool = get_component_pool()
+        key = config_fingerprint(name, normalized_config)
+        component = pool.acquire(key)
+        if component is None:
+            component = build()
+        else:
+            internal_logger.debug(f"Reusing pooled {name} component for session")
+            for instance in getattr(component, "instances", [component]):
+                if hasattr(instance, "execution_output_dir"):
+                    instance.execution_output_dir = self.session_config.execution_output_path
+            if isinstance(component, InstanceFallback):
+                component.current_instance = component.instances[0] if component.instances else None
+        self._pooled[name] = key
+        # Keep spare components warm for the next sessions with this config
+        pool.prewarm(key, build, size)
+        return component
+
+    def release_components(self) -> None:
+        """
+        Return pooled components to the session pool and close the rest of the
+        heavy ones (OCR engines, LLM clients); called when the session terminates.
+        """
+        size = getattr(self.session_config, "session_pool_size", 0)
+        pool = get_component_pool()
+        for name in ("text_detection", "llm"):
+            component = self._instances.pop(name, None)
+            if component is None:
+                continue
+            key = self._pooled.get(name)
+            if key is None or not pool.release(key, component, size):
+                _close_component(component)
+        self._pooled.clear()
+
     # Retrieval methods
     def get_driver(self) -> InstanceFallback[DriverInterface]:
         if "driver" not in self._instances:
@@ -189,6 +251,16 @@ class OpticsBuilder:
             self.instantiate_llm()
         return self._instances.get("llm", None)
 
+    def get_screenshot_service(self) -> ScreenshotCaptureService:
+        """Return the session's shared screenshot capture service, creating it on first use."""
+        if "screenshot_service" not in self._instances:
+            self._instances["screenshot_service"] = ScreenshotCaptureService(
+                target_fps=self.session_config.screenshot_stream_fps,
+                max_backoff=self.session_config.screenshot_stream_max_backoff,
+                change_detector=self.session_config.screenshot_change_detector,
+            )
+        return self._instances["screenshot_service"]
+
     def build(self, cls: Type[T]) -> T:
         """
         Build an instance of the specified class using the stored configurations.
@@ -0,0 +1,22 @@
+from typing import Any, Optional
+from lxml import etree
+from optics_framework.common import utils
+
+
+class PageSourceSnapshot:
+    """
+    One fetched page source, parsed once and shared by every lookup of a locate attempt.
+
+    Holds the raw XML, the parsed lxml tree and root, a SHA-256 content hash and
+    the event-style capture timestamp.
+    """
+
+    __slots__ = ("xml", "tree", "root", "content_hash", "time_stamp")
+
+    def __init__(self, xml: str, time_stamp: Optional[str] = None):
+        self.xml: str = xml
+        self.time_stamp: Optional[str] = time_stamp if time_stamp is not None else utils.get_timestamp()
+        self.tree: Any = etree.ElementTree(etree.fromstring(xml.encode("utf-8")))
+        self.root: Any = self.tree.getroot()
+        self.content_hash: str = utils.compute_hash(xml)
+
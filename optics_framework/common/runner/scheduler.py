@@ -0,0 +1,252 @@
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+from optics_framework.common.config_handler import Config
+from optics_framework.common.error import OpticsError, Code
+from optics_framework.common.events import EventStatus
+from optics_framework.common.logging_config import internal_logger
+from optics_framework.common.runner.printers import IResultPrinter
+from optics_framework.common.runner.test_runnner import Runner, TestRunner
+
+# (test case name, pinned to this device by affinity)
+_Entry = Tuple[str, bool]
+
+
+def device_config(config: Config, device: Mapping[str, Any], primary: bool = True) -> Config:
+    """
+    Build the configuration of one device from the shared project ``config``.
+
+    ``device`` is an entry of ``Config.devices``: its ``capabilities`` are
+    merged into every enabled driver source and its optional ``url`` replaces
+    the driver URL. Each device writes its artifacts (screenshots, page
+    sources, HAR, logs) into its own ``<execution_output_path>/<name>``
+    directory. Secondary devices report into the JUnit file of the primary
+    session, so their own JUnit output is switched off.
+    """
+    name = device.get("name")
+    if not name:
+        raise OpticsError(Code.E0501, message="Every entry in 'devices' needs a 'name'")
+    data = config.model_dump()
+    for source in data["driver_sources"]:
+        for details in source.values():
+            if not details.get("enabled"):
+                continue
+            details["capabilities"] = {**(details.get("capabilities") or {}), **(device.get("capabilities") or {})}
+            if device.get("url"):
+                details["url"] = device["url"]
+    output_root = data.get("execution_output_path")
+    if not output_root and data.get("project_path"):
+        output_root = os.path.join(data["project_path"], "execution_output")
+    if output_root:
+        data["execution_output_path"] = os.path.join(output_root, name)
+        os.makedirs(data["execution_output_path"], exist_ok=True)
+    if not primary:
+        data["json_log"] = False
+    return Config(**data)
+
+
+class _DeviceWorker:
+    """Queue and counters of one device taking part in a parallel run."""
+
+    def __init__(self, name: str, runner: TestRunner):
+        self.name = name
+        self.runner = runner
+        self.queue: Deque[_Entry] = deque()
+        self.executed = 0
+        self.stolen = 0
+        self.retired = False
+        self.driving = False
+
+    def stealable(self) -> int:
+        return sum(1 for _, pinned in self.queue if not pinned)
+
+    def steal_from_tail(self) -> Optional[str]:
+        """Remove and return the last test case that is not pinned to this device."""
+        for index in range(len(self.queue) - 1, -1, -1):
+            name, pinned = self.queue[index]
+            if not pinned:
+                del self.queue[index]
+                return name
+        return None
+
+
+class ParallelTestRunner(Runner):
+    """
+    Runs the test cases of a suite across several devices at once.
+
+    Each device is driven by its own :class:`TestRunner` (one session per
+    device), all sharing one result printer and one event manager, so the
+    result tree, events and JUnit output of the run are merged; JUnit groups
+    test cases into one suite per device session.
+
+    Test cases are dealt round-robin into per-device queues, except those
+    named in ``affinity``, which are pinned to their device. A device that
+    runs out of work steals from the tail of the queue with the most unpinned
+    test cases left, so long and short test cases even out across the farm.
+    A device whose runner raises (e.g. a lost driver connection) is retired:
+    the test case it was running fails, its unpinned work moves to the other
+    devices (with or without stealing), and test cases pinned to it, or left
+    when no device is up, are reported as skipped.
+    """
+
+    def __init__(
+        self,
+        runners: Dict[str, TestRunner],
+        result_printer: IResultPrinter,
+        affinity: Optional[Dict[str, str]] = None,
+        work_stealing: bool = True,
+    ) -> None:
+        if not runners:
+            raise OpticsError(Code.E0702, message="Parallel execution needs at least one device")
+        self.workers = [_DeviceWorker(name, runner) for name, runner in runners.items()]
+        for worker in self.workers:
+            worker.runner.offload_keywords = True
+        first = self.workers[0].runner
+        self.test_case = first.test_cases
+        self.keyword_map = first.keyword_map
+        self.elements = first.elements
+        self.apis = first.apis
+        self.result_printer = result_printer
+        self.affinity = dict(affinity or {})
+        self.work_stealing = work_stealing
+        self.assignments: Dict[str, str] = {}
+
+    def _test_case_names(self) -> List[str]:
+        names = []
+        current = self.test_case
+        while current:
+            names.append(current.name)
+            current = current.next
+        return names
+
+    def _plan(self) -> None:
+        """Fill the device queues: pinned test cases first go to their device, the rest round-robin."""
+        by_name = {worker.name: worker for worker in self.workers}
+        for worker in self.workers:
+            worker.queue.clear()
+            worker.executed = worker.stolen = 0
+            worker.retired = worker.driving = False
+        self.assignments.clear()
+        next_worker = 0
+        for name in self._test_case_names():
+            device = self.affinity.get(name)
+            if device is not None:
+                if device in by_name:
+                    by_name[device].queue.append((name, True))
+                    continue
+                internal_logger.warning(
+                    f"Test case '{name}' has affinity to unknown device '{device}'; scheduling it on any device")
+            self.workers[next_worker % len(self.workers)].queue.append((name, False))
+            next_worker += 1
+
+    def _next_test_case(self, worker: _DeviceWorker) -> Optional[str]:
+        if worker.queue:
+            return worker.queue.popleft()[0]
+        if not self.work_stealing:
+            return None
+        victim = max(
+            (other for other in self.workers if other is not worker),
+            key=lambda other: other.stealable(),
+            default=None,
+        )
+        if victim is None:
+            return None
+        name = victim.steal_from_tail()
+        if name is not None:
+            worker.stolen += 1
+            internal_logger.debug(f"Device '{worker.name}' stole test case '{name}' from '{victim.name}'")
+        return name
+
+    def _retire(self, worker: _DeviceWorker) -> None:
+        """
+        Take ``worker`` out of the run and hand its unpinned test cases to the
+        devices still up, preferring those still driving their queue. Pinned
+        test cases stay queued on the retired device and are reported as
+        skipped at the end of the run.
+        """
+        worker.retired = True
+        active = [other for other in self.workers if not other.retired]
+        if not active:
+            return
+        active.sort(key=lambda other: not other.driving)
+        kept: Deque[_Entry] = deque()
+        moved = 0
+        for name, pinned in worker.queue:
+            if pinned:
+                kept.append((name, pinned))
+                continue
+            target = active[moved % len(active)]
+            target.queue.append((name, False))
+            moved += 1
+            internal_logger.debug(f"Moved test case '{name}' from retired device '{worker.name}' to '{target.name}'")
+        worker.queue = kept
+
+    async def _drive(self, worker: _DeviceWorker, dry_run: bool) -> None:
+        worker.driving = True
+        try:
+            while not worker.retired:
+                name = self._next_test_case(worker)
+                if name is None:
+                    return
+                self.assignments[name] = worker.name
+                try:
+                    if dry_run:
+                        await worker.runner.dry_run_test_case(name)
+                    else:
+                        await worker.runner.execute_test_case(name)
+                    worker.executed += 1
+                except Exception as e:
+                    internal_logger.error(
+                        f"Device '{worker.name}' failed on test case '{name}' and is retired: {e}")
+                    self._retire(worker)
+                    await worker.runner.end_test_case(
+                        name, EventStatus.FAIL, f"Device '{worker.name}' failed: {e}")
+        finally:
+            worker.driving = False
+
+    async def _skip_leftovers(self) -> None:
+        """Report every test case still queued after the run as skipped."""
+        for worker in self.workers:
+            left = [name for name, _ in worker.queue]
+            worker.queue.clear()
+            if not left:
+                continue
+            internal_logger.warning(
+                f"Device '{worker.name}' left {len(left)} test cases not run: {', '.join(left)}")
+            for name in left:
+                await worker.runner.end_test_case(
+                    name, EventStatus.SKIPPED, f"No device left to run it (assigned to '{worker.name}')")
+
+    async def _run(self, dry_run: bool) -> None:
+        self._plan()
+        self.result_printer.start_run(len(self.result_printer.test_state))
+        self.result_printer.start_live()
+        start_time = time.time()
+        try:
+            # Work moved off a retired device may land on a device that had
+            # already finished, so drive again until the live queues are empty.
+            while any(worker.queue for worker in self.workers if not worker.retired):
+                await asyncio.gather(
+                    *(self._drive(worker, dry_run) for worker in self.workers if not worker.retired))
+            await self._skip_leftovers()
+        finally:
+            self.result_printer.stop_live()
+        for worker in self.workers:
+            internal_logger.info(
+                f"Device '{worker.name}' ran {worker.executed} test cases ({worker.stolen} stolen)")
+        internal_logger.info(
+            f"Parallel run on {len(self.workers)} devices finished in {time.time() - start_time:.2f}s")
+
+    async def execute_test_case(self, test_case: str) -> Any:
+        return await self.workers[0].runner.execute_test_case(test_case)
+
+    async def dry_run_test_case(self, test_case: str) -> Any:
+        return await self.workers[0].runner.dry_run_test_case(test_case)
+
+    async def run_all(self) -> None:
+        await self._run(dry_run=False)
+
+    async def dry_run_all(self) -> None:
+        await self._run(dry_run=True)
@@ -104,6 +104,9 @@ class TestRunner(Runner):
         self.result_printer = result_printer
         self.config = session.config
         self.event_manager = event_manager
+        # Run keyword calls in a worker thread so other runners sharing the
+        # event loop (parallel device runs) keep going while a driver blocks.
+        self.offload_keywords = False
         if hasattr(self.modules, "modules"):
             execution_logger.debug(
                 "Initialized test_state: %s with %d modules",
@@ -315,8 +318,19 @@ class TestRunner(Runner):
         extra: Dict[str, str],
     ) -> bool:
         capture_handler = LogCaptureBuffer()
-        execution_logger.addHandler(capture_handler)
+        with capture_handler.capture(execution_logger):
+            return await self._execute_captured_keyword(
+                keyword_node, module_node, test_case_result, extra, capture_handler
+            )
 
+    async def _execute_captured_keyword(
+        self,
+        keyword_node: KeywordNode,
+        module_node: ModuleNode,
+        test_case_result: TestCaseResult,
+        extra: Dict[str, str],
+        capture_handler: LogCaptureBuffer,
+    ) -> bool:
         keyword_result = self._find_result(
             test_case_result.name, module_node.name, keyword_node.id
         )
@@ -419,7 +433,10 @@ class TestRunner(Runner):
                 break
             try:
                 resolved_positional_params, resolved_kw_params = self._resolve_candidate_params(candidate_args)
-                method(*resolved_positional_params, **resolved_kw_params)
+                if self.offload_keywords:
+                    await asyncio.to_thread(method, *resolved_positional_params, **resolved_kw_params)
+                else:
+                    method(*resolved_positional_params, **resolved_kw_params)
                 keyword_node.state = State.COMPLETED_PASSED
                 await self._send_event(
                     "keyword",
@@ -725,6 +742,38 @@ class TestRunner(Runner):
     async def dry_run_test_case(self, test_case: str) -> TestCaseResult:
         return await self._process_test_case(test_case, dry_run=True)
 
+    async def end_test_case(
+        self, test_case: str, status: EventStatus, reason: str
+    ) -> TestCaseResult:
+        """
+        Record ``status`` for a test case that cannot run to completion, e.g.
+        because its device was lost. A test case that never started is
+        reported as started first, so it shows up in the result tree, the
+        events and the JUnit output.
+        """
+        now = time.time()
+        test_case_result = self._init_test_case(test_case)
+        self.result_printer.test_state[test_case] = test_case_result
+        current = self.test_cases
+        while current and current.name != test_case:
+            current = current.next
+        node = current or TestCaseNode(name=test_case)
+        if node.state != State.RUNNING:
+            node.id = str(uuid.uuid4())
+            await self._send_event("test_case", node, EventStatus.RUNNING, start_time=now)
+        node.state = State.SKIPPED if status == EventStatus.SKIPPED else State.COMPLETED_FAILED
+        await self._send_event(
+            "test_case",
+            node,
+            status,
+            reason=reason,
+            start_time=now,
+            end_time=time.time(),
+            elapsed=time.time() - now,
+        )
+        self._update_status(test_case_result, status.value, None, test_case_result.name)
+        return test_case_result
+
     async def run_all(self) -> None:
         current = self.test_cases
         self.result_printer.start_run(len(self.result_printer.test_state))
@@ -1,13 +1,12 @@
-import cv2
 import time
 import threading
 import queue
-from skimage.metrics import structural_similarity as ssim
 from optics_framework.common import utils
+from optics_framework.common.change_detector import create_change_detector, DEFAULT_SSIM_THRESHOLD
 from optics_framework.common.logging_config import internal_logger
 
 class ScreenshotStream:
-    def __init__(self, capture_screenshot_callable, max_queue_size=100, debug_folder=None):
+    def __init__(self, capture_screenshot_callable, max_queue_size=100, debug_folder=None, change_detector=None):
         """
         Initializes the screenshot stream helper.
 
@@ -15,6 +14,8 @@ class ScreenshotStream:
             capture_screenshot_callable (Callable): Function that captures a single screenshot.
             max_queue_size (int): Maximum size of the screenshot and filtered queues.
             debug_folder (str, optional): Folder to save debug images if needed.
+            change_detector (ChangeDetector | str, optional): Deduplication strategy
+                ("tiered" by default, or "ssim" for full-resolution SSIM).
         """
         self.capture_screenshot = capture_screenshot_callable
         self.screenshot_queue = queue.Queue(maxsize=max_queue_size)
@@ -22,6 +23,7 @@ class ScreenshotStream:
         self.stop_event = threading.Event()
         self.debug_folder = debug_folder
         self.MAX_REMAINING_ITEMS = 10  # Maximum items to process after stop event
+        self.change_detector = create_change_detector(change_detector)
 
         # Thread references for proper cleanup
         self.capture_thread = None
@@ -62,15 +64,11 @@ class ScreenshotStream:
 
     def _process_frame_for_deduplication(self, frame, timestamp, last_processed_frame):
         """Helper method to process a single frame for deduplication."""
-        gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-        if last_processed_frame is not None:
-            gray_last_frame = cv2.cvtColor(last_processed_frame, cv2.COLOR_BGR2GRAY)
-            similarity = ssim(gray_last_frame, gray_frame, data_range=gray_frame.max() - gray_frame.min())
-
-            if similarity >= 0.75:
-                internal_logger.debug(f"Skipping duplicate frame at {timestamp} (SSIM: {similarity:.4f})")
-                return last_processed_frame
+        if last_processed_frame is None:
+            self.change_detector.reset()
+        if self.change_detector.is_duplicate(frame):
+            internal_logger.debug(f"Skipping duplicate frame at {timestamp}")
+            return last_processed_frame
 
         # Frame is unique, add to filtered queue
         try:
@@ -245,3 +243,272 @@ class ScreenshotStream:
             'screenshot_queue_size': self.screenshot_queue.qsize(),
             'filtered_queue_size': self.filtered_queue.qsize()
         }
+
+
+DEFAULT_TARGET_FPS = 4.0
+DEFAULT_MAX_BACKOFF = 2.0
+
+
+class FrameSubscription:
+    """
+    One consumer's view of a :class:`ScreenshotCaptureService`.
+
+    Exposes the read side of :class:`ScreenshotStream` (``get_latest_screenshot``,
+    ``get_all_available_screenshots``, ``fetch_frames_from_queue``,
+    ``stop_capture``) so callers can switch between the two. Each subscription
+    has its own bounded queue; a slow consumer loses its oldest frames instead
+    of holding back the capture loop or other subscribers.
+    """
+
+    def __init__(self, service, max_queue_size=10, deduplication=True, timeout=None):
+        self.service = service
+        self.deduplication = deduplication
+        self.filtered_queue = queue.Queue(maxsize=max_queue_size)
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.received_frames = 0
+        self.dropped_frames = 0
+        self.closed = False
+
+    def expired(self, now=None):
+        """Return True once the subscription outlived its timeout."""
+        return self.deadline is not None and (now or time.monotonic()) >= self.deadline
+
+    def _offer(self, frame, timestamp):
+        """Queue a frame, dropping the oldest one if the consumer is behind."""
+        try:
+            if self.filtered_queue.full():
+                self.filtered_queue.get_nowait()
+                self.dropped_frames += 1
+            self.filtered_queue.put_nowait((frame, timestamp))
+            self.received_frames += 1
+        except (queue.Full, queue.Empty):
+            internal_logger.debug("Subscription queue contention. Dropping frame.")
+
+    def get_latest_screenshot(self, wait_time=1):
+        """
+        Fetches the oldest unread screenshot, waiting up to ``wait_time`` seconds.
+
+        Returns:
+            tuple: (frame, timestamp) or (None, None) if unavailable.
+        """
+        try:
+            return self.filtered_queue.get(timeout=wait_time)
+        except queue.Empty:
+            return None, None
+
+    def get_all_available_screenshots(self, wait_time=0.1) -> list:
+        """
+        Retrieves all unread screenshots, waiting up to ``wait_time`` for the first one.
+
+        Returns:
+            List of (frame, timestamp) tuples.
+        """
+        frames = []
+        try:
+            frames.append(self.filtered_queue.get(timeout=wait_time))
+        except queue.Empty:
+            return frames
+        while True:
+            try:
+                frames.append(self.filtered_queue.get_nowait())
+            except queue.Empty:
+                break
+        return frames
+
+    def fetch_frames_from_queue(self, num_frames):
+        """Fetches up to ``num_frames`` unread frames without waiting."""
+        frames = []
+        while len(frames) < num_frames:
+            try:
+                frames.append(self.filtered_queue.get_nowait())
+            except queue.Empty:
+                break
+        return frames
+
+    def clear_queues(self):
+        """Discard unread frames."""
+        while True:
+            try:
+                self.filtered_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def stop_capture(self, wait_for_threads=True, timeout=5):
+        """Unsubscribe; the shared capture loop stops once no subscribers remain."""
+        self.service.unsubscribe(self)
+
+
+class ScreenshotCaptureService:
+    """
+    Paced, shared screenshot capture for one session.
+
+    A single background thread captures frames at up to ``target_fps`` while at
+    least one :class:`FrameSubscription` is active and fans each frame out to
+    every subscriber, so concurrent waits (OCR asserts, image asserts, workspace
+    streaming, recording) cost one device screenshot per tick instead of one
+    per consumer. Failed or empty captures back off exponentially up to
+    ``max_backoff`` seconds. Duplicate detection runs once per frame and is
+    shared by all subscribers that asked for deduplication.
+    """
+
+    def __init__(self, capture_screenshot_callable=None, target_fps=DEFAULT_TARGET_FPS,
+                 max_backoff=DEFAULT_MAX_BACKOFF, duplicate_threshold=DEFAULT_SSIM_THRESHOLD,
+                 change_detector=None):
+        """
+        Args:
+            capture_screenshot_callable (Callable, optional): Captures one frame; may be bound later via :meth:`bind`.
+            target_fps (float): Upper bound on captures per second.
+            max_backoff (float): Longest delay (seconds) between attempts after repeated failures.
+            duplicate_threshold (float): SSIM at or above which a frame counts as unchanged.
+            change_detector (ChangeDetector | str, optional): Deduplication strategy, "tiered" by default.
+        """
+        if target_fps <= 0:
+            raise ValueError("target_fps must be greater than 0")
+        self.capture_screenshot = capture_screenshot_callable
+        self.target_fps = float(target_fps)
+        self.max_backoff = max(float(max_backoff), 1.0 / self.target_fps)
+        self.change_detector = create_change_detector(change_detector, threshold=duplicate_threshold)
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._latest = (None, None, 0.0)
+        self.consecutive_failures = 0
+        self.frames_captured = 0
+
+    @property
+    def interval(self):
+        """Target seconds between two captures."""
+        return 1.0 / self.target_fps
+
+    def bind(self, capture_screenshot_callable):
+        """Set the capture callable if none has been bound yet."""
+        with self._lock:
+            if self.capture_screenshot is None:
+                self.capture_screenshot = capture_screenshot_callable
+
+    def subscribe(self, timeout=None, max_queue_size=10, deduplication=True) -> FrameSubscription:
+        """
+        Register a consumer and make sure the capture loop is running.
+
+        A frame captured within the last interval is handed to the new
+        subscriber straight away; older frames are never replayed.
+
+        Args:
+            timeout (float, optional): Auto-unsubscribe after this many seconds.
+            max_queue_size (int): Frames buffered for this subscriber before the oldest is dropped.
+            deduplication (bool): Only deliver frames that differ from the previous distinct frame.
+        """
+        if self.capture_screenshot is None:
+            raise RuntimeError("ScreenshotCaptureService has no capture callable bound.")
+        subscription = FrameSubscription(self, max_queue_size, deduplication, timeout)
+        with self._lock:
+            frame, timestamp, captured_at = self._latest
+            if frame is not None and self.is_running() and time.monotonic() - captured_at <= self.interval:
+                subscription._offer(frame, timestamp)
+            self._subscribers.append(subscription)
+            if not self.is_running():
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True, name="optics-screenshot-capture")
+                self._thread.start()
+        internal_logger.debug(f"Screenshot subscriber added ({len(self._subscribers)} active).")
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription):
+        with self._lock:
+            subscription.closed = True
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+        internal_logger.debug(f"Screenshot subscriber removed ({len(self._subscribers)} active).")
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_latest_screenshot(self):
+        """Return the most recently captured (frame, timestamp), or (None, None)."""
+        frame, timestamp, _ = self._latest
+        return frame, timestamp
+
+    def get_recent_screenshot(self, max_age):
+        """Return the latest frame if the capture loop is running and took it within ``max_age`` seconds, else None."""
+        frame, _, captured_at = self._latest
+        if frame is None or not self.is_running() or time.monotonic() - captured_at > max_age:
+            return None
+        return frame
+
+    def stop(self, timeout=5):
+        """Drop all subscribers and stop the capture thread."""
+        with self._lock:
+            for subscription in self._subscribers:
+                subscription.closed = True
+            self._subscribers.clear()
+            thread, self._thread = self._thread, None
+        self._stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def _active_subscribers(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._thread is not threading.current_thread():
+                return []  # superseded by a thread started after stop()
+            for subscription in [s for s in self._subscribers if s.expired(now)]:
+                subscription.closed = True
+                self._subscribers.remove(subscription)
+            if not self._subscribers:
+                # Cleared under the lock so a concurrent subscribe() starts a new thread.
+                self._thread = None
+            return list(self._subscribers)
+
+    def _is_duplicate(self, frame):
+        return self.change_detector.is_duplicate(frame)
+
+    def _capture_once(self):
+        try:
+            frame = self.capture_screenshot()
+        except Exception as e:
+            internal_logger.debug(f"ERROR: Failed to capture screenshot: {e}")
+            return None
+        if frame is None:
+            internal_logger.debug("Screenshot capture returned no frame.")
+        return frame
+
+    def _next_delay(self, elapsed):
+        if self.consecutive_failures:
+            delay = min(self.max_backoff, self.interval * (2 ** self.consecutive_failures))
+        else:
+            delay = self.interval
+        return max(0.0, delay - elapsed)
+
+    def _run(self):
+        internal_logger.debug(f"Screenshot capture service started at {self.target_fps} fps.")
+        while True:
+            subscribers = self._active_subscribers()
+            if not subscribers:
+                break
+            started = time.monotonic()
+            frame = self._capture_once()
+            if frame is None:
+                self.consecutive_failures += 1
+            else:
+                self.consecutive_failures = 0
+                self.frames_captured += 1
+                timestamp = utils.get_timestamp()
+                self._latest = (frame, timestamp, time.monotonic())
+                duplicate = None
+                for subscription in subscribers:
+                    if subscription.deduplication and subscription.received_frames:
+                        if duplicate is None:
+                            duplicate = self._is_duplicate(frame)
+                        if duplicate:
+                            continue
+                    subscription._offer(frame, timestamp)
+                if duplicate is None and any(s.deduplication for s in subscribers):
+                    self._is_duplicate(frame)  # keep the reference frame current
+            if self._stop_event.wait(self._next_delay(time.monotonic() - started)):
+                break
+        internal_logger.debug("Screenshot capture service stopped.")
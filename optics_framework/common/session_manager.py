@@ -1,19 +1,33 @@
+import os
 import shutil
 import tempfile
+import threading
 import uuid
 import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Optional
 from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
 from optics_framework.common.Junit_eventhandler import setup_junit, cleanup_junit
 from optics_framework.common.config_handler import Config, ConfigHandler
 from optics_framework.common.optics_builder import OpticsBuilder
 from optics_framework.common.models import TestCaseNode, ElementData, ApiData, ModuleData, TemplateData
 from optics_framework.common.eventSDK import EventSDK
 from optics_framework.common.error import OpticsError, Code
-from optics_framework.common.events import get_event_manager_registry
+from optics_framework.common.events import get_event_manager, get_event_manager_registry
+from optics_framework.common.har_writer import close_har_writer
+from optics_framework.common.artifact_writer import ARTIFACT_MODES, open_artifact_writer, close_artifact_writer
+from optics_framework.common.artifact_policy import (
+    ArtifactFailureSubscriber,
+    ArtifactPolicy,
+    close_artifact_policy,
+    open_artifact_policy,
+)
 from optics_framework.common.logging_config import internal_logger
 
+API_POOL_SIZE = 16  # keep-alive connections per host for invoke_api / invoke_apis
+
 
 def _to_dict_list(configs: list) -> list:
     """Convert list of config item dicts to dicts, using model_dump() where available."""
@@ -108,6 +122,10 @@ class Session:
         self.session_id = session_id
         self.config_handler = ConfigHandler(config)
         self.config = self.config_handler.config
+        if self.config.artifact_writer not in ARTIFACT_MODES:
+            raise ValueError(
+                f"Unsupported artifact writer mode '{self.config.artifact_writer}'. "
+                f"Available: {', '.join(ARTIFACT_MODES)}")
         self.test_cases = test_cases
         self.modules = modules
         self.elements = elements
@@ -117,6 +135,8 @@ class Session:
         self.inline_templates: Dict[str, str] = {}
         self._inline_templates_dir: str = tempfile.mkdtemp(prefix="optics_session_")
         self._template_resolver = SessionTemplateResolver(self)
+        self._http_session: Optional[requests.Session] = None
+        self._http_lock = threading.Lock()
 
         enabled_driver_configs = _get_enabled_config_list(self.config, "driver_sources")
         enabled_element_configs = _get_enabled_config_list(self.config, "elements_sources")
@@ -140,6 +160,45 @@ class Session:
 
         self.driver = self.optics.get_driver()
         self.event_queue = asyncio.Queue()
+        self._artifact_dir: Optional[str] = None
+        if self.config.execution_output_path and self.config.artifact_writer == "async":
+            open_artifact_writer(
+                self.config.execution_output_path,
+                workers=self.config.artifact_writer_workers,
+                queue_size=self.config.artifact_queue_size,
+                drop_policy=self.config.artifact_drop_policy,
+            )
+            self._artifact_dir = self.config.execution_output_path
+        self._artifact_policy_dir: Optional[str] = None
+        self.artifact_subscriber: Optional[ArtifactFailureSubscriber] = None
+        if self.config.execution_output_path and self.config.artifact_capture != "full":
+            open_artifact_policy(self.config.execution_output_path, ArtifactPolicy(
+                self.config.artifact_capture,
+                ring_size=self.config.artifact_ring_size,
+                sample_every=self.config.artifact_sample_every,
+            ))
+            self._artifact_policy_dir = self.config.execution_output_path
+            self.artifact_subscriber = ArtifactFailureSubscriber(
+                self.config.execution_output_path, session_id=session_id)
+            get_event_manager(session_id).subscribe(f"artifacts_{session_id}", self.artifact_subscriber)
+
+    def get_http_session(self) -> requests.Session:
+        """Return this session's keep-alive HTTP client for API keywords, creating it on first use."""
+        with self._http_lock:
+            if self._http_session is None:
+                http_session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=API_POOL_SIZE, pool_maxsize=API_POOL_SIZE)
+                http_session.mount("http://", adapter)
+                http_session.mount("https://", adapter)
+                self._http_session = http_session
+            return self._http_session
+
+    def close_http_session(self) -> None:
+        """Close the pooled API connections, if any were opened."""
+        with self._http_lock:
+            http_session, self._http_session = self._http_session, None
+        if http_session is not None:
+            http_session.close()
 
 
 class SessionManager(SessionHandler):
@@ -169,6 +228,12 @@ class SessionManager(SessionHandler):
         if session:
             if session.driver:
                 session.driver.terminate()
+            optics = getattr(session, "optics", None)
+            if optics is not None:
+                optics.release_components()
+            close_http_session = getattr(session, "close_http_session", None)
+            if close_http_session is not None:
+                close_http_session()
             session.inline_templates.clear()
             base_dir = getattr(session, "_inline_templates_dir", None)
             if base_dir:
@@ -176,5 +241,14 @@ class SessionManager(SessionHandler):
                     shutil.rmtree(base_dir)
                 except OSError as e:
                     internal_logger.warning("Failed to remove inline templates directory %s: %s", base_dir, e)
+            policy_dir = getattr(session, "_artifact_policy_dir", None)
+            if policy_dir:
+                close_artifact_policy(policy_dir)
+            artifact_dir = getattr(session, "_artifact_dir", None)
+            if artifact_dir:
+                close_artifact_writer(artifact_dir)
+            output_dir = getattr(getattr(session, "config", None), "execution_output_path", None)
+            if output_dir:
+                close_har_writer(os.path.join(output_dir, "api_details.har"))
         cleanup_junit(session_id)
         get_event_manager_registry().remove_session(session_id)
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set
+from optics_framework.common.logging_config import internal_logger
+
+# Config keys injected per session that do not change what a component is
+SESSION_SCOPED_KEYS = frozenset({"execution_output_path"})
+
+
+def _strip_session_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_session_keys(v) for k, v in value.items() if k not in SESSION_SCOPED_KEYS}
+    if isinstance(value, list):
+        return [_strip_session_keys(v) for v in value]
+    return value
+
+
+def config_fingerprint(kind: str, config: List[Dict[str, Any]]) -> str:
+    """
+    Pool key of a component built from a normalized factory config.
+
+    Session-scoped keys such as the execution output path are left out, so
+    sessions whose engine settings match share a key; the output path is
+    re-pointed when a pooled component is handed out.
+    """
+    payload = json.dumps(_strip_session_keys(config), sort_keys=True, default=str)
+    return f"{kind}:{hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()}"
+
+
+class ComponentPool:
+    """
+    Idle heavy session components (OCR engines, LLM clients) keyed by config fingerprint.
+
+    A component is held by one session at a time: :meth:`acquire` hands out
+    an idle one and :meth:`release` takes it back when the session ends, up
+    to ``capacity`` idle components per key. :meth:`prewarm` builds missing
+    ones in a background thread, so a burst of sessions with the same
+    config finds them ready instead of each loading models from scratch.
+    """
+
+    def __init__(self):
+        self._idle: Dict[str, List[Any]] = {}
+        self._warming: Set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, key: str) -> Optional[Any]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.hits += 1
+                return idle.pop()
+            self.misses += 1
+            return None
+
+    def release(self, key: str, component: Any, capacity: int) -> bool:
+        """Park ``component`` for reuse; returns False (the caller drops it) when the key is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) >= capacity or any(c is component for c in idle):
+                return False
+            idle.append(component)
+            return True
+
+    def idle_count(self, key: str) -> int:
+        with self._lock:
+            return len(self._idle.get(key, ()))
+
+    def prewarm(self, key: str, build: Callable[[], Any], capacity: int) -> Optional[threading.Thread]:
+        """Fill ``key`` up to ``capacity`` idle components in a background thread, unless one is already running."""
+        with self._lock:
+            if capacity <= 0 or key in self._warming or len(self._idle.get(key, ())) >= capacity:
+                return None
+            self._warming.add(key)
+        thread = threading.Thread(target=self._warm, args=(key, build, capacity), name=f"optics-prewarm-{key}", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm(self, key: str, build: Callable[[], Any], capacity: int) -> None:
+        try:
+            while self.idle_count(key) < capacity:
+                component = build()
+                if not self.release(key, component, capacity):
+                    break
+                internal_logger.debug(f"Pre-warmed session component {key}")
+        except Exception as e:
+            internal_logger.warning(f"Failed to pre-warm session component {key}: {e}")
+        finally:
+            with self._lock:
+                self._warming.discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+
+
+_pool = ComponentPool()
+
+
+def get_component_pool() -> ComponentPool:
+    """Return the process-wide pool shared by every session."""
+    return _pool
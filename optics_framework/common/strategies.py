@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import contextvars
 import inspect
+import threading
 import time
 import math
-from typing import List, NamedTuple, Union, Tuple, Generator, Set, Optional, Any
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from typing import Dict, Iterator, List, NamedTuple, Union, Tuple, Generator, Set, Optional, Any
 import numpy as np
 from optics_framework.common.base_factory import InstanceFallback
 from optics_framework.common.elementsource_interface import ElementSourceInterface
 from optics_framework.common import utils
-from optics_framework.common.screenshot_stream import ScreenshotStream
+from optics_framework.common.screenshot_stream import ScreenshotCaptureService, FrameSubscription
 from optics_framework.common.logging_config import internal_logger, execution_logger
 from optics_framework.common.execution_tracer import execution_tracer
 from optics_framework.engines.vision_models.base_methods import match_and_annotate
@@ -15,6 +20,151 @@ from optics_framework.common.error import OpticsError, Code
 
 # Constants
 TEXT_DETECTION_NOT_AVAILABLE_MSG = "Text detection is not available."
+RACE_POLL_SLICE_SECONDS = 1  # assert timeout per poll for strategies that cannot observe cancellation
+# Element types returned by utils.determine_element_type; StrategyManager pre-builds a strategy list for each.
+ELEMENT_TYPES = ("XPath", "Text", "Image", "CSS", "ID", "Class")
+DEFAULT_FRAME_MAX_AGE = 0.5  # seconds a step's pre-action screenshot may be reused by strategies
+# Element-source methods whose availability is resolved once per element-source class.
+CAPABILITY_METHODS = (
+    "locate", "capture", "capture_region", "get_page_source", "assert_elements", "get_interactive_elements",
+)
+
+
+class StepFrame:
+    """
+    Screenshot taken at the start of a keyword step, offered to its locator strategies.
+
+    Only strategies on the element source that produced the frame may use it,
+    and only while it is younger than ``max_age`` seconds; after that they
+    capture a fresh frame as before. Each use gets a copy, because some OCR
+    engines draw on the frame they are given.
+    """
+
+    def __init__(self, frame: Any, element_source: ElementSourceInterface, max_age: float,
+                 captured_at: Optional[float] = None):
+        self.frame = frame
+        self.element_source = element_source
+        self.max_age = max_age
+        self.captured_at = time.monotonic() if captured_at is None else captured_at
+
+    def frame_for(self, element_source: ElementSourceInterface) -> Any:
+        """The step frame for ``element_source`` if it is still fresh, else ``None``."""
+        if element_source is not self.element_source:
+            return None
+        if time.monotonic() - self.captured_at > self.max_age:
+            return None
+        return self.frame.copy() if isinstance(self.frame, np.ndarray) else self.frame
+
+
+_step_frame: contextvars.ContextVar[Optional[StepFrame]] = contextvars.ContextVar(
+    "optics_step_frame", default=None
+)
+
+
+class RaceContext:
+    """
+    State shared by strategies racing each other in one locate/assert call.
+
+    Holds the cancellation flag set once a winner is found, and captures at
+    most one screenshot per element source so all vision strategies in the
+    race work on the same frame. A fresh step frame of the calling thread
+    seeds that capture.
+    """
+
+    def __init__(self, step_frame: Optional[StepFrame] = None):
+        self.cancelled = threading.Event()
+        self._frames: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self._step_frame = step_frame
+
+    def capture(self, element_source: ElementSourceInterface) -> Any:
+        with self._lock:
+            key = id(element_source)
+            if key not in self._frames:
+                frame = self._step_frame.frame_for(element_source) if self._step_frame else None
+                self._frames[key] = element_source.capture() if frame is None else frame
+            return self._frames[key]
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+_race_context: contextvars.ContextVar[Optional[RaceContext]] = contextvars.ContextVar(
+    "optics_race_context", default=None
+)
+
+
+def _run_in_race(race: RaceContext, fn, *args):
+    """Run ``fn`` in a worker thread with ``race`` as the current race context."""
+    token = _race_context.set(race)
+    try:
+        return fn(*args)
+    finally:
+        _race_context.reset(token)
+
+
+def race_cancelled() -> bool:
+    """True if the current thread runs inside a race that already has a winner."""
+    race = _race_context.get()
+    return race is not None and race.cancelled.is_set()
+
+
+def capture_frame(element_source: ElementSourceInterface) -> Any:
+    """Capture a screenshot, sharing one frame per source across a race and reusing a fresh step frame."""
+    race = _race_context.get()
+    if race is not None:
+        return race.capture(element_source)
+    step = _step_frame.get()
+    if step is not None:
+        frame = step.frame_for(element_source)
+        if frame is not None:
+            internal_logger.debug("Reusing the step's pre-action screenshot")
+            return frame
+    return element_source.capture()
+
+
+def capture_aoi(
+    element_source: ElementSourceInterface, aoi_x: float, aoi_y: float, aoi_width: float, aoi_height: float
+) -> Tuple[Any, Tuple[int, int, int, int], Optional[Any]]:
+    """
+    Capture the AOI region of the screen for a vision strategy.
+
+    A frame already at hand (race or fresh step frame) is cropped. Otherwise a
+    source that implements ``capture_region`` is asked for the region alone,
+    so only that strip is transferred, decoded and searched; anything else
+    falls back to cropping a full capture.
+
+    :return: Tuple of (region, (x1, y1, x2, y2) full-screenshot pixel bounds,
+        full frame or ``None`` when only the region was captured).
+    :raises ValueError: If the AOI parameters are invalid.
+    """
+    full = None
+    if _race_context.get() is not None:
+        full = capture_frame(element_source)
+    else:
+        step = _step_frame.get()
+        if step is not None:
+            full = step.frame_for(element_source)
+    if full is None and LocatorStrategy._is_method_implemented(element_source, "capture_region"):
+        utils.calculate_aoi_bounds((100, 100), aoi_x, aoi_y, aoi_width, aoi_height)  # validate before capturing
+        try:
+            region, bounds = element_source.capture_region(aoi_x, aoi_y, aoi_width, aoi_height)
+            return region, tuple(bounds), None
+        except Exception as e:
+            internal_logger.debug(f"Region capture failed, cropping a full screenshot instead: {e}")
+    if full is None:
+        full = element_source.capture()
+    region, bounds = utils.crop_screenshot_to_aoi(full, aoi_x, aoi_y, aoi_width, aoi_height)
+    return region, bounds, full
+
+
+def _annotate_aoi_match(full: Optional[Any], region: Any, bbox: Any, aoi_bounds: Tuple[int, int, int, int]) -> Any:
+    """Draw a match found in ``region`` on the full frame, or on the region when only it was captured."""
+    if full is None:
+        return utils.annotate(region.copy(), [bbox])
+    adjusted_tl = utils.adjust_coordinates_for_aoi(bbox[0], aoi_bounds)
+    adjusted_br = utils.adjust_coordinates_for_aoi(bbox[1], aoi_bounds)
+    return utils.annotate(full.copy(), [(adjusted_tl, adjusted_br)])
 
 
 class LocateValueWithFrame(NamedTuple):
@@ -26,6 +176,14 @@ class LocateValueWithFrame(NamedTuple):
 class LocatorStrategy(ABC):
     """Abstract base class for element location strategies."""
 
+    # True if assert_elements polls race_cancelled() and stops early once a race is won.
+    observes_race_cancellation = False
+
+    # Element-source class -> {method name: implemented?}. Filled on first use of each class,
+    # so source introspection never runs on the locate/assert hot path.
+    _capability_table: "weakref.WeakKeyDictionary[type, Dict[str, bool]]" = weakref.WeakKeyDictionary()
+    _capability_lock = threading.Lock()
+
     @property
     @abstractmethod
     def element_source(self) -> ElementSourceInterface:
@@ -66,10 +224,31 @@ class LocatorStrategy(ABC):
     def _is_method_implemented(element_source: ElementSourceInterface, method_name: str) -> bool:
         """Checks if the method is implemented and not a stub.
 
+        The answer is looked up in the capability table, so the source of each
+        element-source class is inspected at most once per method.
+
         :param element_source: The source to inspect.
         :param method_name: The name of the method to check.
         :return: True if implemented, False if abstract or a stub.
         """
+        source_class = type(element_source)
+        with LocatorStrategy._capability_lock:
+            capabilities = LocatorStrategy._capability_table.get(source_class)
+            if capabilities is not None and method_name in capabilities:
+                return capabilities[method_name]
+        implemented = LocatorStrategy._inspect_method(element_source, method_name)
+        with LocatorStrategy._capability_lock:
+            LocatorStrategy._capability_table.setdefault(source_class, {})[method_name] = implemented
+        return implemented
+
+    @staticmethod
+    def source_capabilities(element_source: ElementSourceInterface) -> Dict[str, bool]:
+        """Return which of ``CAPABILITY_METHODS`` the element source's class really implements."""
+        return {name: LocatorStrategy._is_method_implemented(element_source, name) for name in CAPABILITY_METHODS}
+
+    @staticmethod
+    def _inspect_method(element_source: ElementSourceInterface, method_name: str) -> bool:
+        """Uncached check behind :meth:`_is_method_implemented`; reads the method source."""
         if not hasattr(element_source, method_name):
             # The method is not implemented at all
             return False
@@ -185,6 +364,8 @@ class TextElementStrategy(LocatorStrategy):
 class TextDetectionStrategy(LocatorStrategy):
     """Strategy for locating text elements using text detection."""
 
+    observes_race_cancellation = True
+
     def __init__(self, element_source: ElementSourceInterface, text_detection, strategy_manager):
         self._element_source = element_source
         self.text_detection = text_detection
@@ -198,7 +379,7 @@ class TextDetectionStrategy(LocatorStrategy):
     def locate(self, element: str, index: int = 0) -> Optional[LocateValueWithFrame]:
         if self.text_detection is None:
             raise OpticsError(Code.E0201, message=TEXT_DETECTION_NOT_AVAILABLE_MSG)
-        screenshot = self.element_source.capture()
+        screenshot = capture_frame(self.element_source)
         found = self.text_detection.find_element(screenshot, element, index=index)
         if found is None:
             return None
@@ -225,13 +406,10 @@ class TextDetectionStrategy(LocatorStrategy):
         """
         if self.text_detection is None:
             raise OpticsError(Code.E0201, message=TEXT_DETECTION_NOT_AVAILABLE_MSG)
-        # Capture full screenshot
-        full_screenshot = self.element_source.capture()
-
-        # Crop screenshot to AOI
+        # Capture only the AOI when the source can, else crop a full screenshot
         try:
-            cropped_screenshot, aoi_bounds = utils.crop_screenshot_to_aoi(
-                full_screenshot, aoi_x, aoi_y, aoi_width, aoi_height
+            cropped_screenshot, aoi_bounds, full_screenshot = capture_aoi(
+                self.element_source, aoi_x, aoi_y, aoi_width, aoi_height
             )
         except ValueError as e:
             internal_logger.debug(f"AOI cropping failed for TextDetectionStrategy: {e}")
@@ -254,9 +432,7 @@ class TextDetectionStrategy(LocatorStrategy):
             internal_logger.debug(f"Text element '{element}' found at AOI coordinates {coor}, adjusted to full screenshot coordinates {adjusted_coor}")
             annotated_frame = None
             if bbox is not None and len(bbox) == 2 and bbox[0] is not None and bbox[1] is not None:
-                adjusted_tl = utils.adjust_coordinates_for_aoi(bbox[0], aoi_bounds)
-                adjusted_br = utils.adjust_coordinates_for_aoi(bbox[1], aoi_bounds)
-                annotated_frame = utils.annotate(full_screenshot.copy(), [(adjusted_tl, adjusted_br)])
+                annotated_frame = _annotate_aoi_match(full_screenshot, cropped_screenshot, bbox, aoi_bounds)
             return LocateValueWithFrame(adjusted_coor, annotated_frame)
         except ValueError as e:
             internal_logger.debug(f"Coordinate adjustment failed for TextDetectionStrategy: {e}")
@@ -274,7 +450,7 @@ class TextDetectionStrategy(LocatorStrategy):
         timestamp = None
         ss_stream = self.strategy_manager.capture_screenshot_stream(timeout=timeout)
         try:
-            while time.time() < end_time:
+            while time.time() < end_time and not race_cancelled():
                 time.sleep(self.screenshot_timeout)  # Allow some time for screenshots to be captured
                 frames = ss_stream.get_all_available_screenshots(wait_time=1)
                 if not frames:
@@ -306,6 +482,8 @@ class TextDetectionStrategy(LocatorStrategy):
 class ImageDetectionStrategy(LocatorStrategy):
     """Strategy for locating image elements using image detection."""
 
+    observes_race_cancellation = True
+
     def __init__(self, element_source: ElementSourceInterface, image_detection, strategy_manager):
         self._element_source = element_source
         self.image_detection = image_detection
@@ -317,7 +495,7 @@ class ImageDetectionStrategy(LocatorStrategy):
         return self._element_source
 
     def locate(self, element: str, index: int = 0) -> Optional[LocateValueWithFrame]:
-        screenshot = self.element_source.capture()
+        screenshot = capture_frame(self.element_source)
         found = self.image_detection.find_element(screenshot, element, index)
         if found is None:
             return None
@@ -341,13 +519,10 @@ class ImageDetectionStrategy(LocatorStrategy):
         :param index: Zero-based index when multiple matches exist (default 0)
         :return: Coordinates relative to the full screenshot, or (coords, annotated_frame)
         """
-        # Capture full screenshot
-        full_screenshot = self.element_source.capture()
-
-        # Crop screenshot to AOI
+        # Capture only the AOI when the source can, else crop a full screenshot
         try:
-            cropped_screenshot, aoi_bounds = utils.crop_screenshot_to_aoi(
-                full_screenshot, aoi_x, aoi_y, aoi_width, aoi_height
+            cropped_screenshot, aoi_bounds, full_screenshot = capture_aoi(
+                self.element_source, aoi_x, aoi_y, aoi_width, aoi_height
             )
         except ValueError as e:
             internal_logger.debug(f"AOI cropping failed for ImageDetectionStrategy: {e}")
@@ -368,9 +543,7 @@ class ImageDetectionStrategy(LocatorStrategy):
             internal_logger.debug(f"Image element '{element}' found at AOI coordinates {centre}, adjusted to full screenshot coordinates {adjusted_centre}")
             annotated_frame = None
             if bbox is not None and len(bbox) == 2 and bbox[0] is not None and bbox[1] is not None:
-                adjusted_tl = utils.adjust_coordinates_for_aoi(bbox[0], aoi_bounds)
-                adjusted_br = utils.adjust_coordinates_for_aoi(bbox[1], aoi_bounds)
-                annotated_frame = utils.annotate(full_screenshot.copy(), [(adjusted_tl, adjusted_br)])
+                annotated_frame = _annotate_aoi_match(full_screenshot, cropped_screenshot, bbox, aoi_bounds)
             return LocateValueWithFrame(adjusted_centre, annotated_frame)
         except ValueError as e:
             internal_logger.debug(f"Coordinate adjustment failed for ImageDetectionStrategy: {e}")
@@ -385,7 +558,7 @@ class ImageDetectionStrategy(LocatorStrategy):
         annotated_frame = None
         timestamp = None
         try:
-            while time.time() < end_time:
+            while time.time() < end_time and not race_cancelled():
                 time.sleep(self.screenshot_timeout)  # Allow some time for screenshots to be captured
                 frames = ss_stream.get_all_available_screenshots(wait_time=1)
                 if not frames:
@@ -524,7 +697,9 @@ class LocateResult:
 
 
 class StrategyManager:
-    def __init__(self, element_source: InstanceFallback[ElementSourceInterface], text_detection, image_detection):
+    def __init__(self, element_source: InstanceFallback[ElementSourceInterface], text_detection, image_detection,
+                 capture_service: Optional[ScreenshotCaptureService] = None, racing: bool = False,
+                 frame_max_age: float = DEFAULT_FRAME_MAX_AGE):
         # Defensive: always wrap in InstanceFallback if not already
         if not isinstance(element_source, InstanceFallback):
             element_source = InstanceFallback([element_source])
@@ -532,10 +707,41 @@ class StrategyManager:
         self.locator_factory = StrategyFactory(text_detection, image_detection, strategy_manager=self)
         self.screenshot_factory = ScreenshotFactory()
         self.pagesource_factory = PagesourceFactory()
-        self.locator_strategies = self._build_locator_strategies()
+        self.locator_strategies = self._build_locator_strategies()  # also pre-builds the per-type lists
         self.screenshot_strategies = self._build_screenshot_strategies()
         self.pagesource_strategies = self._build_pagesource_strategies()
-        self.screenshot_stream = None
+        # Shared per session when the builder passes one in; every stream is a subscription to it.
+        self.capture_service = capture_service or ScreenshotCaptureService()
+        self.capture_service.bind(self.capture_screenshot)
+        self.screenshot_stream: Optional[FrameSubscription] = None
+        # Opt-in: run eligible strategies concurrently instead of one after another.
+        self.racing = racing
+        # How long a step's pre-action screenshot stays usable by its strategies (0 disables reuse).
+        self.frame_max_age = frame_max_age
+        # Last frame returned by capture_screenshot on each thread and the source that produced it.
+        self._capture_origin = threading.local()
+
+    @property
+    def locator_strategies(self) -> List[LocatorStrategy]:
+        return self._locator_strategies
+
+    @locator_strategies.setter
+    def locator_strategies(self, strategies: List[LocatorStrategy]) -> None:
+        self._locator_strategies = list(strategies)
+        self._strategies_by_type: Dict[str, List[LocatorStrategy]] = {
+            element_type: self._supporting(element_type) for element_type in ELEMENT_TYPES
+        }
+
+    def _supporting(self, element_type: str) -> List[LocatorStrategy]:
+        return [s for s in self._locator_strategies if s.supports(element_type, s.element_source)]
+
+    def strategies_for(self, element_type: str) -> List[LocatorStrategy]:
+        """Locator strategies supporting ``element_type``, in priority order (built once per type)."""
+        strategies = self._strategies_by_type.get(element_type)
+        if strategies is None:
+            strategies = self._supporting(element_type)
+            self._strategies_by_type[element_type] = strategies
+        return strategies
 
     def _build_locator_strategies(self) -> List[LocatorStrategy]:
         strategies = []
@@ -613,8 +819,24 @@ class StrategyManager:
         internal_logger.info(f"Locating element: {element} of type: {element_type}...")
         use_aoi = self._validate_aoi(aoi_x, aoi_y, aoi_width, aoi_height)
 
+        if self.racing:
+            candidates = [
+                s for s in self.strategies_for(element_type)
+                if not (text_only and type(s).__name__ == "TextElementStrategy")
+            ]
+            if len(candidates) > 1:
+                yielded = False
+                for locate_result in self._race_locate(
+                    candidates, effective_element, element_type, use_aoi, aoi_x, aoi_y, aoi_width, aoi_height, index
+                ):
+                    yielded = True
+                    yield locate_result
+                if not yielded:
+                    raise OpticsError(Code.E0201, message=f"Element '{element}' not found.")
+                return
+
         yielded = False
-        for strategy in self.locator_strategies:
+        for strategy in self.strategies_for(element_type):
             if text_only and type(strategy).__name__ == "TextElementStrategy":
                 continue
             execution_logger.debug(f"Trying strategy: {type(strategy).__name__} for element: {effective_element}")
@@ -656,8 +878,8 @@ class StrategyManager:
         deadline = time.time() + timeout
         last_exception = None
         applicable_strategies = [
-            s for s in self.locator_strategies
-            if self._can_strategy_assert_elements(s, element_type)
+            s for s in self.strategies_for(element_type)
+            if hasattr(s, 'assert_elements')
         ]
         if has_text_only:
             applicable_strategies = [
@@ -667,6 +889,12 @@ class StrategyManager:
         if not applicable_strategies:
             raise OpticsError(Code.E0201, message=f"No strategies found for elements: {elements} with rule '{rule}'.")
 
+        if self.racing and len(applicable_strategies) > 1:
+            outcome = self._race_assert_presence(applicable_strategies, effective_elements, deadline, rule)
+            if outcome is not None:
+                return outcome
+            raise OpticsError(Code.E0201, message=f"{elements} not found based on rule '{rule}'.")
+
         for idx, strategy in enumerate(applicable_strategies):
             internal_logger.debug(f"Trying strategy: {type(strategy).__name__} for elements: {elements}")
             alloc_result = self._alloc_time_for_strategy(deadline, idx, applicable_strategies)
@@ -690,17 +918,90 @@ class StrategyManager:
             internal_logger.debug(f"assert_presence ended with last exception: {last_exception}")
         raise OpticsError(Code.E0201, message=f"{elements} not found based on rule '{rule}'.")
 
+    def _race_locate(
+        self,
+        strategies: List[LocatorStrategy],
+        element: str,
+        element_type: str,
+        use_aoi: bool,
+        aoi_x: Optional[float],
+        aoi_y: Optional[float],
+        aoi_width: Optional[float],
+        aoi_height: Optional[float],
+        index: int,
+    ) -> Generator[LocateResult, None, None]:
+        """Run locate on all strategies at once and yield hits in the order they finish."""
+        race = RaceContext(_step_frame.get())
+        pool = ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix="optics-race")
+        futures = [
+            pool.submit(
+                _run_in_race, race, self._try_strategy_locate,
+                strategy, element, element_type, use_aoi, aoi_x, aoi_y, aoi_width, aoi_height, index,
+            )
+            for strategy in strategies
+        ]
+        try:
+            for future in as_completed(futures):
+                locate_result = future.result()
+                if locate_result:
+                    internal_logger.debug(f"Race for '{element}' won by {type(locate_result.strategy).__name__}")
+                    yield locate_result
+        finally:
+            race.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _race_assert_one(
+        self, strategy: LocatorStrategy, elements: list, deadline: float, rule: str, race: RaceContext
+    ) -> Tuple[bool, Optional[str], Optional[Any]]:
+        """Assert with one racer until it succeeds, the deadline passes or another racer wins."""
+        if strategy.observes_race_cancellation:
+            remaining = int(math.ceil(max(0.0, deadline - time.time())))
+            return self._try_assert_with_strategy(strategy, elements, remaining, rule)
+        # Element-source polling loops cannot see the cancel flag; poll in short slices instead.
+        while not race.cancelled.is_set() and time.time() < deadline:
+            try:
+                result, timestamp, annotated_frame = strategy.assert_elements(elements, RACE_POLL_SLICE_SECONDS, rule)
+            except Exception as e:
+                internal_logger.debug(f"Strategy {strategy.__class__.__name__} failed during race: {e}")
+                result, timestamp, annotated_frame = False, None, None
+            if result:
+                execution_tracer.log_attempt(strategy, str(elements), "success")
+                return result, timestamp, annotated_frame
+        if not race.cancelled.is_set():
+            execution_tracer.log_attempt(strategy, str(elements), "fail", error="Elements not found.")
+        return False, None, None
+
+    def _race_assert_presence(
+        self, strategies: List[LocatorStrategy], elements: list, deadline: float, rule: str
+    ) -> Optional[Tuple[bool, Optional[str], Optional[Any]]]:
+        """Run assert_elements on all strategies at once; return the first positive result or None."""
+        race = RaceContext()
+        pool = ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix="optics-race")
+        futures = {
+            pool.submit(_run_in_race, race, self._race_assert_one, strategy, elements, deadline, rule, race): strategy
+            for strategy in strategies
+        }
+        # Racers stop on their own at the deadline; allow one poll slice for them to report.
+        wait = max(0.0, deadline - time.time()) + RACE_POLL_SLICE_SECONDS + 1
+        try:
+            for future in as_completed(futures, timeout=wait):
+                result, timestamp, annotated_frame = future.result()
+                if result:
+                    internal_logger.debug(f"Race for {elements} won by {type(futures[future]).__name__}")
+                    return result, timestamp, annotated_frame
+        except FutureTimeoutError:
+            internal_logger.debug(f"Strategy race for {elements} timed out.")
+        finally:
+            race.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
     def _validate_rule(self, rule: str):
         """Validate the rule parameter."""
         rule = rule.lower()
         if rule not in ("any", "all"):
             raise OpticsError(Code.E0205, message="Invalid rule. Use 'any' or 'all'.")
 
-    def _can_strategy_assert_elements(self, strategy, element_type: str) -> bool:
-        """Check if strategy can assert elements for the given element type."""
-        return (hasattr(strategy, 'assert_elements') and
-                strategy.supports(element_type, strategy.element_source))
-
     def _try_assert_with_strategy(self, strategy, elements: list, timeout: int, rule: str):
         """Try to assert elements using a specific strategy.
 
@@ -729,25 +1030,41 @@ class StrategyManager:
             try:
                 img = strategy.capture()
                 execution_tracer.log_attempt(strategy, "screenshot", "success")
+                self._capture_origin.value = (img, strategy.element_source, time.monotonic())
                 return img
             except Exception as e:
                 execution_tracer.log_attempt(strategy, "screenshot", "fail", error=str(e))
         internal_logger.debug("No screenshot captured.")
         raise OpticsError(Code.E0303, message="No screenshot captured using available strategies.")
 
-    def capture_screenshot_stream(self, timeout: int = 30):
-        """Capture a screenshot stream using the available strategies."""
-        execution_logger.debug("Starting screenshot stream with available strategies.")
-        for strategy in self.screenshot_strategies:
-            try:
-                self.screenshot_stream = ScreenshotStream(strategy.capture, max_queue_size=10)
-                self.screenshot_stream.start_capture(timeout, deduplication=True)
-            except NotImplementedError as e:
-                execution_logger.debug(
-                    f"Screenshot streaming not supported by {strategy.__class__.__name__}: {e}")
-            except Exception as e:
-                execution_logger.error(
-                    f"Screenshot streaming failed with {strategy.__class__.__name__}: {e}")
+    @contextmanager
+    def step_frame(self, frame: Any) -> Iterator[Optional[StepFrame]]:
+        """
+        Let locator strategies reuse ``frame`` within this block.
+
+        ``frame`` must be the last result of :meth:`capture_screenshot` on this
+        thread, so the element source it came from and its capture time are
+        known; any other frame (or ``frame_max_age <= 0``) leaves strategies
+        capturing as usual. The frame ages from its capture, not from this call.
+        """
+        origin = getattr(self._capture_origin, "value", None)
+        if frame is None or self.frame_max_age <= 0 or origin is None or origin[0] is not frame:
+            yield None
+            return
+        step = StepFrame(frame, origin[1], self.frame_max_age, captured_at=origin[2])
+        token = _step_frame.set(step)
+        try:
+            yield step
+        finally:
+            _step_frame.reset(token)
+
+    def capture_screenshot_stream(self, timeout: int = 30) -> Optional[FrameSubscription]:
+        """Subscribe to the session's paced screenshot capture for up to ``timeout`` seconds."""
+        execution_logger.debug("Subscribing to the shared screenshot stream.")
+        if not self.screenshot_strategies:
+            execution_logger.debug("Screenshot streaming not supported: no screenshot strategies available.")
+            return None
+        self.screenshot_stream = self.capture_service.subscribe(timeout=timeout, max_queue_size=10, deduplication=True)
         return self.screenshot_stream
 
     def stop_screenshot_stream(self):
@@ -0,0 +1,103 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple
+from optics_framework.common.logging_config import internal_logger
+
+# Image extensions treated as templates
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif"})
+
+
+class TemplateIndex:
+    """
+    Index of the template images under a project directory.
+
+    The tree is walked once; afterwards :meth:`templates` only stats the
+    indexed directories and rescans those whose mtime changed (a file or
+    subdirectory was added, removed or renamed in them). On a project with
+    thousands of images this replaces a recursive walk per session with one
+    ``stat`` per directory. Symlinked directories are not followed, matching
+    ``Path.rglob``.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.rescans = 0
+        # directory -> (mtime_ns, {file name: path}, subdirectories)
+        self._dirs: Dict[str, Tuple[int, Dict[str, str], Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def _scan(self, directory: str) -> Optional[Tuple[int, Dict[str, str], Tuple[str, ...]]]:
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            return None
+        files: Dict[str, str] = {}
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                    files[entry.name] = entry.path
+            except OSError:
+                continue
+        self.rescans += 1
+        return mtime, files, tuple(subdirs)
+
+    def _refresh(self, directory: str, seen: set) -> None:
+        seen.add(directory)
+        cached = self._dirs.get(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            mtime = None
+        if cached is None or mtime != cached[0]:
+            cached = self._scan(directory)
+            if cached is None:
+                self._dirs.pop(directory, None)
+                return
+            self._dirs[directory] = cached
+        for subdir in cached[2]:
+            self._refresh(subdir, seen)
+
+    def templates(self) -> Dict[str, str]:
+        """
+        Map of image file name to path, revalidated against the filesystem.
+
+        Directories are visited parent first, then subdirectories depth-first
+        in name order, like ``Path.rglob``; when several images share a name
+        the last one visited wins. Paths are built from ``root`` as given.
+        """
+        with self._lock:
+            seen: set = set()
+            self._refresh(self.root, seen)
+            for directory in [d for d in self._dirs if d not in seen]:
+                del self._dirs[directory]
+            return self._collect(self.root, {})
+
+    def _collect(self, directory: str, templates: Dict[str, str]) -> Dict[str, str]:
+        cached = self._dirs.get(directory)
+        if cached is None:
+            return templates
+        templates.update(cached[1])
+        for subdir in cached[2]:
+            self._collect(subdir, templates)
+        return templates
+
+
+_indexes: Dict[str, TemplateIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_template_index(project_path: str) -> TemplateIndex:
+    """Return the process-wide index of ``project_path``, creating it on first use."""
+    root = os.path.normpath(project_path)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            internal_logger.debug(f"Indexing templates under {root}")
+            index = TemplateIndex(root)
+            _indexes[root] = index
+        return index
@@ -13,6 +13,8 @@ from typing import Callable, List, Optional, Tuple, Any, Union, get_origin, get_
 import inspect
 from skimage.metrics import structural_similarity as ssim
 from optics_framework.common.logging_config import internal_logger
+from optics_framework.common.artifact_writer import write_artifact
+from optics_framework.common.artifact_policy import emit_artifact
 
 OUTPUT_PATH_NOT_SET_MSG = "output_dir is required. Pass it from the session's execution_output_path."
 TEXT_ONLY_PREFIX = "text_only:"
@@ -179,13 +181,20 @@ def get_timestamp():
         internal_logger.error('Unable to get current time', exc_info=e)
         return None
 
-def encode_numpy_to_png_bytes(image: np.ndarray) -> bytes:
+IMAGE_ENCODINGS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+
+def encode_numpy_image(image: np.ndarray, encoding: str = "png", quality: int = 90,
+                       png_compression: Optional[int] = None) -> bytes:
     """
-    Encodes a NumPy image (OpenCV BGR format) to raw PNG bytes.
+    Encodes a NumPy image (OpenCV BGR format) to PNG, JPEG or WebP bytes.
 
     :param image: The input image as a NumPy array (BGR format).
-    :return: PNG-encoded bytes.
-    :raises ValueError: If the image is not a valid, non-empty NumPy array.
+    :param encoding: One of ``IMAGE_ENCODINGS`` (``png``, ``jpeg``, ``webp``).
+    :param quality: 1-100 quality for JPEG and WebP; ignored for PNG.
+    :param png_compression: 0-9 zlib level for PNG (lower is faster); ``None`` keeps OpenCV's default.
+    :return: Encoded bytes.
+    :raises ValueError: If the image is invalid, the encoding unknown or encoding fails.
     """
     if image is None or not isinstance(image, np.ndarray):
         raise ValueError("Input image must be a valid NumPy array")
@@ -193,10 +202,34 @@ def encode_numpy_to_png_bytes(image: np.ndarray) -> bytes:
     if image.size == 0 or image.shape[0] == 0 or image.shape[1] == 0:
         raise ValueError("Input image is empty or has invalid dimensions")
 
-    _, buffer = cv2.imencode('.png', image)
+    extension = IMAGE_ENCODINGS.get(encoding.lower())
+    if extension is None:
+        raise ValueError(f"Unsupported image encoding '{encoding}'. Available: {', '.join(IMAGE_ENCODINGS)}")
+    params: List[int] = []
+    if extension == ".png" and png_compression is not None:
+        params = [cv2.IMWRITE_PNG_COMPRESSION, int(png_compression)]
+    elif extension == ".jpg":
+        params = [cv2.IMWRITE_JPEG_QUALITY, int(quality)]
+    elif extension == ".webp":
+        params = [cv2.IMWRITE_WEBP_QUALITY, int(quality)]
+
+    success, buffer = cv2.imencode(extension, image, params)
+    if not success:
+        raise ValueError(f"Failed to encode image as {encoding}")
     return buffer.tobytes()
 
 
+def encode_numpy_to_png_bytes(image: np.ndarray) -> bytes:
+    """
+    Encodes a NumPy image (OpenCV BGR format) to raw PNG bytes.
+
+    :param image: The input image as a NumPy array (BGR format).
+    :return: PNG-encoded bytes.
+    :raises ValueError: If the image is not a valid, non-empty NumPy array.
+    """
+    return encode_numpy_image(image, "png")
+
+
 def encode_numpy_to_base64(image: np.ndarray) -> str:
     """
     Encodes a NumPy image (OpenCV format) to a base64 string.
@@ -269,7 +302,27 @@ def save_screenshot(img, name, output_dir, time_stamp=None):
         name: Name for the screenshot file
         output_dir: Directory where to save the screenshot (required)
         time_stamp: Optional timestamp, will be generated if not provided
+
+    When the output directory has an artifact writer (see
+    :mod:`optics_framework.common.artifact_writer`), a copy of the image is
+    encoded and written in the background. Whether the screenshot is written
+    at all follows the directory's capture policy
+    (:mod:`optics_framework.common.artifact_policy`).
+    """
+    _submit_screenshot(img, name, output_dir, time_stamp, None)
+
+
+def save_annotated_screenshot(img, bboxes, name, output_dir, time_stamp=None):
+    """
+    Save a copy of ``img`` with ``bboxes`` drawn on it (see :func:`annotate`).
+
+    The original image is left untouched; with an artifact writer the drawing
+    happens in the background together with the encoding.
     """
+    _submit_screenshot(img, name, output_dir, time_stamp, bboxes)
+
+
+def _submit_screenshot(img, name, output_dir, time_stamp, bboxes):
     if img is None:
         internal_logger.debug("Image is empty. Cannot save screenshot.")
         raise ValueError("Image is empty. Cannot save screenshot.")
@@ -280,9 +333,27 @@ def save_screenshot(img, name, output_dir, time_stamp=None):
     if time_stamp is None:
         time_stamp = str(datetime.now().astimezone().strftime('%Y-%m-%dT%H-%M-%S-%f'))
     screenshot_file_path = os.path.join(output_dir, f"{time_stamp}-{name}.jpg")
+    emit_artifact(
+        output_dir, "screenshot", screenshot_file_path,
+        _write_screenshot, screenshot_file_path, img, bboxes, False,
+        detach=_detach_frame,
+    )
+
+
+def _detach_frame(args):
+    # Callers may annotate the frame in place after save_screenshot returns.
+    path, img, bboxes, _ = args
+    return path, img.copy() if isinstance(img, np.ndarray) else img, bboxes, True
+
+
+def _write_screenshot(screenshot_file_path, img, bboxes, owned):
     try:
+        if bboxes is not None:
+            # Never draw on the caller's frame; a detached frame is already ours.
+            if not owned and isinstance(img, np.ndarray):
+                img = img.copy()
+            img = annotate(img, bboxes)
         cv2.imwrite(screenshot_file_path, img)
-        internal_logger.debug(f'Screenshot saved as : {time_stamp}-{name}.jpg')
         internal_logger.debug(f"Screenshot saved to :{screenshot_file_path}")
 
     except Exception as e:
@@ -471,7 +542,11 @@ def save_page_source(tree, time_stamp, output_dir):
         internal_logger.info(OUTPUT_PATH_NOT_SET_MSG)
         return
     page_source_file_path = os.path.join(output_dir, "page_sources_log.xml")
+    emit_artifact(output_dir, "page_source", page_source_file_path,
+                  _append_page_source, page_source_file_path, tree, time_stamp, droppable=False)
 
+
+def _append_page_source(page_source_file_path, tree, time_stamp):
     # Remove any XML declaration
     cleaned_tree = re.sub(r'<\?xml[^>]+\?>', '', tree, flags=re.IGNORECASE).strip()
 
@@ -510,6 +585,11 @@ def save_page_source_html(html: str, time_stamp, output_dir):
         internal_logger.info(OUTPUT_PATH_NOT_SET_MSG)
         return
     page_source_file_path = os.path.join(output_dir, "page_sources_log.html")
+    emit_artifact(output_dir, "page_source", page_source_file_path,
+                  _append_page_source_html, page_source_file_path, html, time_stamp, droppable=False)
+
+
+def _append_page_source_html(page_source_file_path, html, time_stamp):
     # Prepare entry block with timestamp comment
     entry_block = f'\n<!-- timestamp: {time_stamp} -->\n{html}\n'
 
@@ -542,9 +622,14 @@ def save_interactable_elements(elements, output_dir):
         internal_logger.info(OUTPUT_PATH_NOT_SET_MSG)
         return
     output_path = os.path.join(output_dir, "interactable_elements.json")
+    # Serialize now: the caller keeps (and may modify) the elements list.
+    content = json.dumps(elements, indent=2, ensure_ascii=False)
+    write_artifact(output_dir, output_path, _write_text, output_path, content, droppable=False)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(elements, f, indent=2, ensure_ascii=False)
+
+def _write_text(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
 
 def load_config(default_config: dict) -> dict:
     """Load config from environment variable and override the default config."""
@@ -657,6 +742,43 @@ def crop_screenshot_to_aoi(screenshot, aoi_x, aoi_y, aoi_width, aoi_height):
     return cropped, (x1, y1, x2, y2)
 
 
+def aoi_clip_for_viewport(viewport_width, viewport_height, device_scale, aoi_x, aoi_y, aoi_width, aoi_height):
+    """
+    Map an AOI onto a browser viewport for a natively clipped screenshot.
+
+    The pixel bounds match what :func:`crop_screenshot_to_aoi` would return for a
+    full viewport screenshot, so coordinates found in the clipped image are
+    adjusted exactly as before.
+
+    :param viewport_width: Viewport width in CSS pixels
+    :param viewport_height: Viewport height in CSS pixels
+    :param device_scale: Device pixel ratio (screenshot pixels per CSS pixel)
+    :return: Tuple of ((x, y, width, height) clip in CSS pixels, (x1, y1, x2, y2) screenshot pixel bounds)
+    :raises ValueError: If the viewport or AOI parameters are invalid
+    """
+    if viewport_width <= 0 or viewport_height <= 0 or device_scale <= 0:
+        raise ValueError(f"Invalid viewport {viewport_width}x{viewport_height} at scale {device_scale}")
+    shape = (int(round(viewport_height * device_scale)), int(round(viewport_width * device_scale)))
+    x1, y1, x2, y2 = calculate_aoi_bounds(shape, aoi_x, aoi_y, aoi_width, aoi_height)
+    clip = (x1 / device_scale, y1 / device_scale, (x2 - x1) / device_scale, (y2 - y1) / device_scale)
+    return clip, (x1, y1, x2, y2)
+
+
+def fit_region_to_bounds(region, aoi_bounds):
+    """
+    Resize a natively captured region to the size of its AOI pixel bounds.
+
+    Clipped captures can come back a pixel larger or smaller than the bounds
+    because of CSS-to-device rounding; matching the size keeps coordinate
+    adjustment exact.
+    """
+    x1, y1, x2, y2 = aoi_bounds
+    width, height = x2 - x1, y2 - y1
+    if region.shape[1] == width and region.shape[0] == height:
+        return region
+    return cv2.resize(region, (width, height), interpolation=cv2.INTER_LINEAR)
+
+
 def adjust_coordinates_for_aoi(coordinates, aoi_bounds):
     """
     Adjust coordinates found in cropped AOI back to full screenshot coordinates.
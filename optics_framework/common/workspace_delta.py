@@ -0,0 +1,194 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from optics_framework.common.utils import encode_numpy_to_png_bytes
+from optics_framework.engines.vision_models.ocr_cache import frame_fingerprint
+
+DEFAULT_IMAGE_CACHE_SIZE = 8
+
+# Patch keys of the element list in a workspace delta
+KEY_ADDED = "added"
+KEY_REMOVED = "removed"
+KEY_MODIFIED = "modified"
+
+
+def text_fingerprint(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def element_id(element: Dict[str, Any]) -> str:
+    """
+    Stable id of an interactive element across captures.
+
+    Keyed by XPath when the element source provides one, so a label whose text
+    changes is reported as modified rather than removed and added; otherwise
+    by text and bounds.
+    """
+    xpath = element.get("xpath")
+    key = f"x:{xpath}" if xpath else f"t:{element.get('text')}|{json.dumps(element.get('bounds'), sort_keys=True)}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def index_elements(elements: List[Any]) -> Dict[str, Dict[str, Any]]:
+    """Map each element to its stable id (repeats get ``#n`` suffixes), with the id added to a copy of the element."""
+    indexed: Dict[str, Dict[str, Any]] = {}
+    for element in elements:
+        if not isinstance(element, dict):
+            element = {"text": str(element)}
+        base = element_id(element)
+        key, n = base, 1
+        while key in indexed:
+            key = f"{base}#{n}"
+            n += 1
+        indexed[key] = {**element, "id": key}
+    return indexed
+
+
+def diff_elements(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> Dict[str, List[Any]]:
+    """Patch turning ``previous`` into ``current``: added and modified elements in full, removed ones by id."""
+    return {
+        KEY_ADDED: [element for key, element in current.items() if key not in previous],
+        KEY_REMOVED: [key for key in previous if key not in current],
+        KEY_MODIFIED: [
+            element for key, element in current.items()
+            if key in previous and previous[key] != element
+        ],
+    }
+
+
+class WorkspaceImages:
+    """
+    Content-addressed PNG cache of the last frames streamed for one session.
+
+    Frames are encoded once, when a new fingerprint is first seen, and served
+    by id from the workspace image endpoint; the least recently stored frames
+    are evicted beyond ``capacity``.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_IMAGE_CACHE_SIZE):
+        self.capacity = max(1, int(capacity))
+        self._images: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, frame: np.ndarray, image_id: Optional[str] = None) -> str:
+        """Store ``frame`` (encoding it only if it is new) and return its id."""
+        image_id = image_id or frame_fingerprint(frame)
+        with self._lock:
+            if image_id in self._images:
+                self._images.move_to_end(image_id)
+                return image_id
+        png = encode_numpy_to_png_bytes(frame)
+        with self._lock:
+            self._images[image_id] = png
+            self._images.move_to_end(image_id)
+            while len(self._images) > self.capacity:
+                self._images.popitem(last=False)
+        return image_id
+
+    def get(self, image_id: str) -> Optional[bytes]:
+        with self._lock:
+            return self._images.get(image_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._images)
+
+
+_images: Dict[str, WorkspaceImages] = {}
+_images_lock = threading.Lock()
+
+
+def get_workspace_images(session_id: str) -> WorkspaceImages:
+    """Return the image cache of ``session_id``, creating it on first use."""
+    with _images_lock:
+        store = _images.get(session_id)
+        if store is None:
+            store = WorkspaceImages()
+            _images[session_id] = store
+        return store
+
+
+def find_workspace_image(session_id: str, image_id: str) -> Optional[bytes]:
+    """PNG bytes of a streamed frame, or ``None`` if the session or frame is gone."""
+    with _images_lock:
+        store = _images.get(session_id)
+    return store.get(image_id) if store is not None else None
+
+
+def discard_workspace_images(session_id: str) -> None:
+    with _images_lock:
+        _images.pop(session_id, None)
+
+
+class WorkspaceDelta:
+    """
+    Per-client state of a differential workspace stream.
+
+    :meth:`update` compares a capture with what this client has already been
+    sent and returns the message to send, or ``None`` when nothing changed:
+
+    - the first message has ``type`` ``snapshot`` (every element under ``added``);
+      later ones have ``type`` ``delta``;
+    - ``screenshot`` is present only when the frame changed and references the
+      frame by id and URL instead of embedding it;
+    - ``elements`` is an add/remove/modify patch keyed by stable element ids;
+    - ``source`` is present only when the page source text changed.
+    """
+
+    def __init__(self, images: WorkspaceImages, image_url: Callable[[str], str]):
+        self.images = images
+        self.image_url = image_url
+        self.seq = 0
+        self._frame_id: Optional[str] = None
+        self._screenshot_failed: Optional[bool] = None
+        self._elements: Dict[str, Dict[str, Any]] = {}
+        self._source_id: Optional[str] = None
+
+    def update(
+        self,
+        frame: Optional[np.ndarray],
+        elements: List[Any],
+        source: Optional[Any] = None,
+        frame_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """:param frame_id: Fingerprint of ``frame`` if the caller already computed it."""
+        message: Dict[str, Any] = {}
+        failed = frame is None
+        if failed != self._screenshot_failed:
+            message["screenshotFailed"] = failed
+            self._screenshot_failed = failed
+        if frame is not None:
+            frame_id = frame_id or frame_fingerprint(frame)
+            if frame_id != self._frame_id:
+                self.images.put(frame, frame_id)
+                height, width = frame.shape[:2]
+                message["screenshot"] = {
+                    "id": frame_id, "url": self.image_url(frame_id), "width": width, "height": height,
+                }
+                self._frame_id = frame_id
+
+        current = index_elements(elements)
+        patch = diff_elements(self._elements, current)
+        if any(patch.values()):
+            message["elements"] = patch
+        self._elements = current
+
+        if source is not None:
+            text = source.get("page_source", "") if isinstance(source, dict) else source
+            source_id = text_fingerprint(str(text))
+            if source_id != self._source_id:
+                message["source"] = source
+                self._source_id = source_id
+
+        if not message and self.seq:
+            return None
+        message["type"] = "snapshot" if self.seq == 0 else "delta"
+        message.setdefault("elements", diff_elements({}, {}))
+        message["seq"] = self.seq
+        self.seq += 1
+        return message
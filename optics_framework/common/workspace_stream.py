@@ -0,0 +1,171 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+from optics_framework.common.logging_config import internal_logger
+
+DEFAULT_BUFFER_SIZE = 4
+
+# Delivered to subscribers when the producer's session is gone
+STREAM_CLOSED = object()
+
+
+class WorkspaceSubscriber:
+    """
+    One stream client of a :class:`WorkspaceProducer`.
+
+    Captures are buffered in a bounded queue; when the client falls behind,
+    the oldest buffered capture is dropped. Every capture is a complete
+    workspace state, so a slow client skips intermediate screens rather than
+    holding back the producer or the other clients.
+    """
+
+    def __init__(self, interval: float, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.interval = interval
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, int(buffer_size)))
+        self.received = 0
+        self.dropped = 0
+
+    def offer(self, item: Any) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+        self.received += 1
+
+    async def get(self, timeout: float) -> Any:
+        """Next capture, error or :data:`STREAM_CLOSED`; raises ``asyncio.TimeoutError`` after ``timeout``."""
+        return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+
+
+class WorkspaceProducer:
+    """
+    Single capture loop shared by every stream client of one session and set of options.
+
+    The loop runs only while clients are subscribed, at the shortest interval
+    any of them asked for. Each capture is fingerprinted once and fanned out
+    only when it differs from the previous one; a new client immediately gets
+    the latest capture. Capture errors are fanned out as exceptions, and
+    :data:`STREAM_CLOSED` once ``alive()`` reports the session gone.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        capture: Callable[[], Awaitable[Any]],
+        fingerprint: Callable[[Any], str],
+        alive: Callable[[], bool],
+    ):
+        self.key = key
+        self.capture = capture
+        self.fingerprint = fingerprint
+        self.alive = alive
+        self.captures = 0
+        self._subscribers: List[WorkspaceSubscriber] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._latest: Any = None
+        self._latest_fingerprint: Optional[str] = None
+        self._rendered_for: Any = None
+        self._rendered: Any = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, interval: float, buffer_size: int = DEFAULT_BUFFER_SIZE) -> WorkspaceSubscriber:
+        subscriber = WorkspaceSubscriber(interval, buffer_size)
+        if self._latest is not None:
+            subscriber.offer(self._latest)
+        self._subscribers.append(subscriber)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        internal_logger.debug(f"Workspace subscriber added for {self.key} ({len(self._subscribers)} active)")
+        return subscriber
+
+    def unsubscribe(self, subscriber: WorkspaceSubscriber) -> None:
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+        if subscriber.dropped:
+            internal_logger.debug(
+                f"Workspace subscriber for {self.key} skipped {subscriber.dropped} of {subscriber.received} updates")
+        if not self._subscribers:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop the capture loop; remaining subscribers are told the stream closed."""
+        for subscriber in self._subscribers:
+            subscriber.offer(STREAM_CLOSED)
+        self._subscribers.clear()
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task is not _current_task():
+            task.cancel()
+        _forget(self)
+
+    def render(self, item: Any, renderer: Callable[[Any], Any]) -> Any:
+        """``renderer(item)``, computed once per capture however many clients send it."""
+        if self._rendered_for is not item:
+            self._rendered = renderer(item)
+            self._rendered_for = item
+        return self._rendered
+
+    def _broadcast(self, item: Any) -> None:
+        for subscriber in list(self._subscribers):
+            subscriber.offer(item)
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            if not self.alive():
+                internal_logger.warning(f"Session for workspace stream {self.key} no longer exists, ending stream")
+                self.stop()
+                return
+            try:
+                item = await self.capture()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                internal_logger.error(f"Error capturing workspace for {self.key}: {e}")
+                self._latest = self._latest_fingerprint = None
+                self._broadcast(e)
+            else:
+                self.captures += 1
+                fingerprint = self.fingerprint(item)
+                if fingerprint != self._latest_fingerprint:
+                    self._latest, self._latest_fingerprint = item, fingerprint
+                    self._broadcast(item)
+            if not self._subscribers:
+                return
+            await asyncio.sleep(min(subscriber.interval for subscriber in self._subscribers))
+
+
+def _current_task() -> Optional["asyncio.Task[Any]"]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+_producers: Dict[Hashable, WorkspaceProducer] = {}
+_producers_lock = threading.Lock()
+
+
+def _forget(producer: WorkspaceProducer) -> None:
+    with _producers_lock:
+        if _producers.get(producer.key) is producer:
+            del _producers[producer.key]
+
+
+def get_workspace_producer(key: Hashable, factory: Callable[[], WorkspaceProducer]) -> WorkspaceProducer:
+    """Return the producer for ``key`` (its first element being the session id), creating it with ``factory``."""
+    with _producers_lock:
+        producer = _producers.get(key)
+        if producer is None:
+            producer = factory()
+            _producers[key] = producer
+        return producer
+
+
+def close_workspace_producers(session_id: str) -> None:
+    """Stop every producer of ``session_id``; their clients receive :data:`STREAM_CLOSED`."""
+    with _producers_lock:
+        producers = [p for key, p in _producers.items() if isinstance(key, tuple) and key and key[0] == session_id]
+    for producer in producers:
+        producer.stop()
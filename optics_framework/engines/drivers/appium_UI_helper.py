@@ -1,9 +1,11 @@
 import re
-from typing import Any, List, Dict, Tuple, Optional, Union, cast
+from typing import Any, List, Dict, Tuple, Optional, Union
 from fuzzywuzzy import fuzz
 from lxml import etree
 from optics_framework.common.logging_config import internal_logger
 from optics_framework.common import utils
+from optics_framework.common.page_source_snapshot import PageSourceSnapshot
+from optics_framework.engines.drivers.xpath_index import XPathIndex
 ## Removed import of get_appium_driver (no longer needed)
 
 
@@ -23,20 +25,45 @@ class UIHelper:
         self.tree = None
         self.root = None
         self.prev_hash = None
+        self.snapshot: Optional[PageSourceSnapshot] = None
+        self._xpath_index: Optional[XPathIndex] = None
 
-    def get_page_source(self):
+    def capture_snapshot(self) -> PageSourceSnapshot:
         """
-        Fetch the current UI tree (page source) from the Appium driver.
+        Fetch the page source from the Appium driver once and parse it.
+
+        The returned snapshot becomes the helper's current tree and can be
+        passed to the lookup methods so a whole locate attempt shares a single
+        ``driver.page_source`` round trip.
         """
         time_stamp = utils.get_timestamp()
         page_source = self.driver.driver.page_source
-        self.tree = etree.ElementTree(etree.fromstring(page_source.encode("utf-8")))
-        self.root = self.tree.getroot()
+        snapshot = PageSourceSnapshot(page_source, time_stamp)
+        self._use_snapshot(snapshot)
         internal_logger.debug("\n\n========== PAGE SOURCE FETCHED ==========")
         internal_logger.debug(f"Page source fetched at: {time_stamp}")
         internal_logger.debug("\n==========================================")
         utils.save_page_source(page_source, time_stamp, self.driver.event_sdk.config_handler.config.execution_output_path)
-        return page_source, time_stamp
+        return snapshot
+
+    def _use_snapshot(self, snapshot: PageSourceSnapshot) -> None:
+        self.snapshot = snapshot
+        self.tree = snapshot.tree
+        self.root = snapshot.root
+
+    def _resolve_snapshot(self, snapshot: Optional[PageSourceSnapshot]) -> PageSourceSnapshot:
+        """Use the given snapshot for the following lookups, or fetch a fresh one."""
+        if snapshot is None:
+            return self.capture_snapshot()
+        self._use_snapshot(snapshot)
+        return snapshot
+
+    def get_page_source(self):
+        """
+        Fetch the current UI tree (page source) from the Appium driver.
+        """
+        snapshot = self.capture_snapshot()
+        return snapshot.xml, snapshot.time_stamp
 
     # fetching page source and handling UI tree
     def get_distinct_page_source(self):
@@ -62,33 +89,33 @@ class UIHelper:
         internal_logger.debug("\n==========================================")
         return page_source, time_stamp
 
-    def find_xpath_from_text(self, text):
+    def find_xpath_from_text(self, text, snapshot: Optional[PageSourceSnapshot] = None):
         """
         Find the XPath of an element based on the text content.
 
         Args:
             text (str): The text content to search for in the UI tree.
+            snapshot (PageSourceSnapshot, optional): Page source to search; fetched once if omitted.
 
         Returns:
             str: The XPath of the element containing the
             text content, or None if not found.
         """
-        locators = self.get_locator_and_strategy(text)
+        snapshot = self._resolve_snapshot(snapshot)
+        locators = self.get_locator_and_strategy(text, snapshot=snapshot)
         if locators:
             strategy = locators["strategy"]
             locator = locators["locator"]
-            xpath = self.get_view_locator(strategy=strategy, locator=locator)
+            xpath = self.get_view_locator(strategy=strategy, locator=locator, snapshot=snapshot)
             return xpath
         return None
 
-    def find_xpath(self, xpath):
+    def find_xpath(self, xpath, snapshot: Optional[PageSourceSnapshot] = None):
         """
         Process the given XPath and return the exact path from the UI tree after applying various matching strategies.
         """
         internal_logger.debug(f"Finding Xpath {xpath}...")
-        _, time_stamp = (
-            self.get_page_source()
-        )  # Fetch UI tree when processing the XPath
+        time_stamp = self._resolve_snapshot(snapshot).time_stamp
         try:
             # 1. Exact Match
             try:
@@ -434,12 +461,13 @@ class UIHelper:
                     }
         return None
 
-    def get_locator_and_strategy(self, element):
+    def get_locator_and_strategy(self, element, snapshot: Optional[PageSourceSnapshot] = None):
         """
         Determines the best strategy and locator for the given element identifier.
         """
-        _, time_stamp = self.get_page_source()
-        tree = self.tree
+        snapshot = self._resolve_snapshot(snapshot)
+        time_stamp = snapshot.time_stamp
+        tree = snapshot.tree
 
         strategies = [
             ("text", "//*[@text]", "text"),
@@ -488,14 +516,14 @@ class UIHelper:
         )
         return None
 
-    def get_view_locator(self, strategy, locator):
+    def get_view_locator(self, strategy, locator, snapshot: Optional[PageSourceSnapshot] = None):
         """
         Fetches the full XPath of the given element directly from the UI tree using the strategy found.
         Supports both Android and iOS attributes with prioritized attribute selection.
         """
         try:
-            self.get_page_source()
-            tree = self.tree
+            snapshot = self._resolve_snapshot(snapshot)
+            tree = snapshot.tree
             # Construct the XPath based on the strategy and platform-specific attributes
             if strategy in [
                 "text",
@@ -563,7 +591,7 @@ class UIHelper:
                 # Combine the parts to form the final simplified XPath
                 full_xpath = "//" + "/".join(xpath_parts)
                 # Find the XPath that is acceptable by Appium
-                final_xpath, _ = self.find_xpath(full_xpath)
+                final_xpath, _ = self.find_xpath(full_xpath, snapshot=snapshot)
                 return final_xpath
             internal_logger.debug(f"No element found for '{locator}' in the UI tree.")
             return None
@@ -572,7 +600,7 @@ class UIHelper:
             return None
 
     def get_locator_and_strategy_using_index(
-        self, element, index, strategy=None
+        self, element, index, strategy=None, snapshot: Optional[PageSourceSnapshot] = None
     ) -> dict:
         """
         Perform a linear search across all strategies (resource-id, text, content-desc, etc.) in the UI tree,
@@ -582,12 +610,12 @@ class UIHelper:
             element (str): The element identifier to search for.
             index (int): zero indexing
             strategy (str): supported attributes in string, 'resource-id', 'text', 'content-desc', 'name', 'value', 'label'
+            snapshot (PageSourceSnapshot, optional): Page source to search; fetched once if omitted.
 
         Returns:
             list: A list of dictionaries, each containing the strategy, value, and index of the match.
         """
-        self.get_page_source()
-        tree = self.tree
+        tree = self._resolve_snapshot(snapshot).tree
 
         # Collect all elements in positional order
         all_strategies = [
@@ -724,9 +752,9 @@ class UIHelper:
         else:
             internal_logger.debug(f"Bounds not available in attributes: {attributes}")
 
-    def get_bounding_box_for_xpath(self, xpath):
-        # refresh page source tree and root
-        self.get_page_source()
+    def get_bounding_box_for_xpath(self, xpath, snapshot: Optional[PageSourceSnapshot] = None):
+        # refresh page source tree and root unless a snapshot is supplied
+        self._resolve_snapshot(snapshot)
         if not xpath:
             internal_logger.debug("Invalid Xpath, bounding box cannot be fetched.")
             return None
@@ -808,7 +836,9 @@ class UIHelper:
             internal_logger.debug(f"Invalid XPath syntax: {xpath} - Error: {str(e)}")
 
     # element extraction
-    def get_interactive_elements(self, filter_config: Optional[List[str]] = None) -> List[Dict]:
+    def get_interactive_elements(
+        self, filter_config: Optional[List[str]] = None, snapshot: Optional[PageSourceSnapshot] = None
+    ) -> List[Dict]:
         """
         Cross-platform element extraction supporting both Android and iOS.
 
@@ -821,12 +851,11 @@ class UIHelper:
                 - "images": Only image elements
                 - "text": Only text elements
                 Can be combined: ["buttons", "inputs"]
+            snapshot: Optional page source snapshot; fetched once if omitted.
         """
-        page_source, _ = self.get_page_source()
-        root = etree.ElementTree(
-            etree.fromstring(page_source.encode("utf-8"))
-        ).getroot()
+        root = self._resolve_snapshot(snapshot).root
         elements = root.xpath(".//*")
+        xpath_index = self._xpath_index_for(root)
         results = []
 
         for node in elements:
@@ -843,7 +872,7 @@ class UIHelper:
                 # If no text-like attribute, use tag name
                 text, used_key = node.tag, None
 
-            xpath = self.get_xpath(node)
+            xpath = self.get_xpath(node, xpath_index)
             extra = self._build_extra_metadata(node.attrib, used_key, node.tag)
 
             results.append(
@@ -939,85 +968,80 @@ class UIHelper:
         extra["tag"] = tag  # e.g., XCUIElementTypeButton or android.widget.Button
         return extra
 
+    def _xpath_index_for(self, node: etree.Element) -> XPathIndex:
+        """Return the uniqueness index of ``node``'s document, building it once per tree."""
+        root = node.getroottree().getroot()
+        index = self._xpath_index
+        if index is None or index.root is not root or node not in index:
+            all_attrs = [*XPATH_UNIQUE_ATTRIBUTES, *XPATH_MAYBE_UNIQUE_ATTRIBUTES]
+            index = XPathIndex(root, all_attrs, self._xpath_attribute_pairs_permutations(all_attrs))
+            self._xpath_index = index
+        return index
+
     def _xpath_determine_uniqueness(
-        self, node: etree.Element, doc_tree: Any, xpath: str
+        self, node: etree.Element, index: XPathIndex, conditions: Tuple[Tuple[str, str], ...]
     ) -> Tuple[bool, Optional[int]]:
-        """Return (True, None) if xpath matches exactly one node, else (False, index or None)."""
-        try:
-            matches = doc_tree.xpath(xpath)
-        except (etree.XPathError, ValueError, TypeError):
+        """Return (True, None) if the conditions match exactly one node, else (False, index or None)."""
+        count, idx = index.match(node, conditions)
+        if count == 0:
             return False, None
-        if not matches:
-            return False, None
-        if len(matches) > 1:
-            try:
-                idx = matches.index(node)
-            except ValueError:
-                idx = 0
-            return False, idx
+        if count > 1:
+            return False, idx if idx is not None else 0
         return True, None
 
-    def _xpath_from_single_attr(
-        self, node: etree.Element, attr_name: str, tag_for_xpath: str
-    ) -> Optional[str]:
-        val = node.attrib.get(attr_name)
-        if not val:
+    def _xpath_conditions(
+        self, values: Dict[str, str], attrs: Union[str, Tuple[str, str]]
+    ) -> Optional[Tuple[Tuple[str, str], ...]]:
+        if isinstance(attrs, str):
+            return ((attrs, values[attrs]),) if attrs in values else None
+        a1, a2 = attrs
+        if a1 not in values or a2 not in values:
             return None
-        lit = self._escape_for_xpath_literal(val)
-        return f"//{tag_for_xpath}[@{attr_name}={lit}]"
-
-    def _xpath_from_attr_pair(
-        self, node: etree.Element, attr_pair: Tuple[str, str], tag_for_xpath: str
-    ) -> Optional[str]:
-        a1, a2 = attr_pair
-        v1, v2 = node.attrib.get(a1), node.attrib.get(a2)
-        if not v1 or not v2:
-            return None
-        lit1, lit2 = self._escape_for_xpath_literal(v1), self._escape_for_xpath_literal(v2)
-        return f"//{tag_for_xpath}[@{a1}={lit1} and @{a2}={lit2}]"
+        return ((a1, values[a1]), (a2, values[a2]))
+
+    def _xpath_from_conditions(self, tag_for_xpath: str, conditions: Tuple[Tuple[str, str], ...]) -> str:
+        predicate = " and ".join(f"@{name}={self._escape_for_xpath_literal(val)}" for name, val in conditions)
+        return f"//{tag_for_xpath}[{predicate}]"
 
     def _xpath_try_attributes_for_unique(
-        self, node: etree.Element, doc_tree: Any, attrs: List[Union[str, Tuple[str, str]]]
+        self, node: etree.Element, index: XPathIndex, attrs: List[Union[str, Tuple[str, str]]]
     ) -> Tuple[Optional[str], bool]:
         tag_for_xpath = node.tag or "*"
-        is_pairs = bool(attrs and isinstance(attrs[0], tuple))
         semi_unique_xpath: Optional[str] = None
+        values = {k: v for k, v in node.attrib.items() if v}
+        if not values:
+            return None, False
 
         for entry in attrs:
-            if is_pairs:
-                xpath = self._xpath_from_attr_pair(node, cast(Tuple[str, str], entry), tag_for_xpath)
-            else:
-                xpath = self._xpath_from_single_attr(node, cast(str, entry), tag_for_xpath)
-            if not xpath:
+            conditions = self._xpath_conditions(values, entry)
+            if not conditions:
                 continue
-            is_unique, idx = self._xpath_determine_uniqueness(node, doc_tree, xpath)
+            is_unique, idx = self._xpath_determine_uniqueness(node, index, conditions)
             if is_unique:
-                return xpath, True
+                return self._xpath_from_conditions(tag_for_xpath, conditions), True
             if semi_unique_xpath is None and idx is not None:
-                semi_unique_xpath = f"({xpath})[{idx + 1}]"
+                semi_unique_xpath = f"({self._xpath_from_conditions(tag_for_xpath, conditions)})[{idx + 1}]"
 
         if semi_unique_xpath:
             return semi_unique_xpath, False
         return None, False
 
     def _xpath_try_node_name(
-        self, node: etree.Element, doc_tree: Any
+        self, node: etree.Element, index: XPathIndex
     ) -> Tuple[Optional[str], bool]:
         tag = node.tag or "*"
-        xpath = f"//{tag}"
-        is_unique, _ = self._xpath_determine_uniqueness(node, doc_tree, xpath)
-        if not is_unique:
+        if index.tag_count(tag) != 1:
             return None, False
         if node.getparent() is None:
-            xpath = f"/{tag}"
-        return xpath, True
+            return f"/{tag}", True
+        return f"//{tag}", True
 
     def _xpath_attribute_pairs_permutations(
         self, attributes: List[str]
     ) -> List[Tuple[str, str]]:
         return [(v1, v2) for i, v1 in enumerate(attributes) for v2 in attributes[i + 1 :]]
 
-    def _xpath_try_cases_for_unique(self, node: etree.Element, doc_tree: Any) -> Optional[str]:
+    def _xpath_try_cases_for_unique(self, node: etree.Element, index: XPathIndex) -> Optional[str]:
         all_attrs = [*XPATH_UNIQUE_ATTRIBUTES, *XPATH_MAYBE_UNIQUE_ATTRIBUTES]
         cases: List[Any] = [
             XPATH_UNIQUE_ATTRIBUTES,
@@ -1028,44 +1052,48 @@ class UIHelper:
         semi_unique: Optional[str] = None
         for attrs in cases:
             if len(attrs) == 0:
-                xpath, is_unique = self._xpath_try_node_name(node, doc_tree)
+                xpath, is_unique = self._xpath_try_node_name(node, index)
             else:
-                xpath, is_unique = self._xpath_try_attributes_for_unique(node, doc_tree, attrs)
+                xpath, is_unique = self._xpath_try_attributes_for_unique(node, index, attrs)
             if is_unique and xpath:
                 return xpath
             if semi_unique is None and xpath:
                 semi_unique = xpath
         return semi_unique
 
-    def _xpath_build_hierarchical(self, node: etree.Element) -> str:
+    def _xpath_build_hierarchical(self, node: etree.Element, index: XPathIndex) -> str:
         tag = node.tag
         if not tag:
             return ""
         parent = node.getparent()
         segment = f"/{tag}"
         if parent is not None:
-            siblings_same_tag = [c for c in parent if c.tag == tag]
-            if len(siblings_same_tag) > 1:
-                idx = siblings_same_tag.index(node) + 1
+            idx, count = index.sibling_position(node)
+            if count > 1:
                 segment += f"[{idx}]"
         if parent is not None and hasattr(parent, "tag"):
-            return f"{self.get_xpath(parent)}{segment}"
+            return f"{self.get_xpath(parent, index)}{segment}"
         return segment
 
-    def get_xpath(self, node: etree.Element) -> str:
+    def get_xpath(self, node: etree.Element, index: Optional[XPathIndex] = None) -> str:
         """
         Generate an optimal XPath for a given node using attribute-based
         uniqueness checks and semi-unique indexing, falling back to a
         hierarchical path when required. Mirrors the behavior of the
         provided getOptimalXPath logic.
+
+        Uniqueness is answered from an :class:`XPathIndex` of the whole
+        document (built once per tree and reused) instead of evaluating
+        each candidate XPath against the document.
         """
         if node is None or not hasattr(node, "tag"):
             return ""
-        doc_tree = node.getroottree()
-        candidate = self._xpath_try_cases_for_unique(node, doc_tree)
+        if index is None or node not in index:
+            index = self._xpath_index_for(node)
+        candidate = self._xpath_try_cases_for_unique(node, index)
         if candidate:
             return candidate
-        return self._xpath_build_hierarchical(node) or self._build_structural_xpath(node)
+        return self._xpath_build_hierarchical(node, index) or self._build_structural_xpath(node)
 
     def _escape_for_xpath_literal(self, s: str) -> str:
         """
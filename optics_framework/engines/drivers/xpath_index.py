@@ -0,0 +1,108 @@
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from lxml import etree
+
+# Element names that can be used verbatim as an XPath name test. Anything else
+# (namespaced "{uri}local" tags, "$" in inner-class names, ...) would make the
+# generated XPath invalid, so such tags are never reported as matching.
+_XPATH_NAME_RE = re.compile(r"^[^\W\d][\w.\-]*$")
+
+Conditions = Tuple[Tuple[str, str], ...]
+
+
+class XPathIndex:
+    """
+    One-pass index answering XPath uniqueness questions without running XPath.
+
+    Built once per parsed page source, it records in document order:
+
+    - how many elements carry each tag (``//tag``),
+    - which elements match ``//tag[@a=v]`` for every indexed attribute and
+      ``//tag[@a1=v1 and @a2=v2]`` for every indexed attribute pair,
+    - each element's position among same-tag siblings of its parent.
+
+    Every lookup is then a dict access (plus a bisect for the semi-unique
+    position), so picking a locator for all N nodes of a hierarchy is O(N)
+    instead of one whole-document XPath query per candidate.
+    """
+
+    def __init__(
+        self,
+        root: Any,
+        attributes: Sequence[str],
+        attribute_pairs: Sequence[Tuple[str, str]] = (),
+    ):
+        self.root = root
+        self._order: Dict[Any, int] = {}
+        self._tag_counts: Dict[str, int] = {}
+        self._matches: Dict[Tuple[str, Conditions], List[int]] = {}
+        self._siblings: Dict[Any, Tuple[int, int]] = {}
+        self._build(attributes, attribute_pairs)
+
+    def _build(self, attributes: Sequence[str], attribute_pairs: Sequence[Tuple[str, str]]) -> None:
+        # root.iter() walks the subtree in document order, which is the order
+        # XPath returns matches in; order numbers therefore double as positions.
+        for order, node in enumerate(self.root.iter(etree.Element)):
+            self._order[node] = order
+            tag = node.tag
+            self._tag_counts[tag] = self._tag_counts.get(tag, 0) + 1
+
+            attrib = node.attrib
+            for attr in attributes:
+                val = attrib.get(attr)
+                if val:
+                    self._matches.setdefault((tag, ((attr, val),)), []).append(order)
+            for a1, a2 in attribute_pairs:
+                v1, v2 = attrib.get(a1), attrib.get(a2)
+                if v1 and v2:
+                    self._matches.setdefault((tag, ((a1, v1), (a2, v2))), []).append(order)
+
+            per_tag: Dict[str, int] = {}
+            children = [child for child in node if isinstance(child.tag, str)]
+            for child in children:
+                per_tag[child.tag] = per_tag.get(child.tag, 0) + 1
+            seen: Dict[str, int] = {}
+            for child in children:
+                seen[child.tag] = seen.get(child.tag, 0) + 1
+                self._siblings[child] = (seen[child.tag], per_tag[child.tag])
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self._order
+
+    @staticmethod
+    def is_valid_name(tag: Any) -> bool:
+        """Return True if ``tag`` can appear as a bare XPath name test."""
+        return isinstance(tag, str) and bool(_XPATH_NAME_RE.match(tag))
+
+    def tag_count(self, tag: str) -> int:
+        """Number of elements ``//tag`` would match."""
+        if not self.is_valid_name(tag):
+            return 0
+        return self._tag_counts.get(tag, 0)
+
+    def match(self, node: Any, conditions: Conditions) -> Tuple[int, Optional[int]]:
+        """
+        Evaluate ``//tag[@a=v and ...]`` for ``node``'s tag against the index.
+
+        :param node: Element the locator is being built for.
+        :param conditions: ``(attribute, value)`` pairs of an indexed attribute or pair.
+        :return: ``(match_count, position)`` where ``position`` is the 0-based index
+            of ``node`` within the matches, or ``None`` if it is not among them.
+        """
+        if not self.is_valid_name(node.tag):
+            return 0, None
+        orders = self._matches.get((node.tag, conditions))
+        if not orders:
+            return 0, None
+        order = self._order.get(node)
+        if order is None:
+            return len(orders), None
+        pos = bisect_left(orders, order)
+        if pos < len(orders) and orders[pos] == order:
+            return len(orders), pos
+        return len(orders), None
+
+    def sibling_position(self, node: Any) -> Tuple[int, int]:
+        """Return ``(1-based position, count)`` of ``node`` among same-tag siblings."""
+        return self._siblings.get(node, (1, 1))
@@ -6,6 +6,7 @@ from appium.webdriver.common.appiumby import AppiumBy
 from optics_framework.common.logging_config import internal_logger, execution_logger
 from optics_framework.common import utils
 from optics_framework.common.elementsource_interface import ElementSourceInterface
+from optics_framework.common.page_source_snapshot import PageSourceSnapshot
 
 APPIUM_NOT_INITIALISED_MSG = "Appium driver is not initialized for AppiumPageSource."
 
@@ -101,10 +102,12 @@ class AppiumPageSource(ElementSourceInterface):
             internal_logger.debug('Appium Page Source does not support finding images.')
             return None
         elif element_type == 'Text':
+            # One page-source fetch shared by every UIHelper lookup of this attempt.
+            snapshot = self._capture_snapshot()
             if index is not None:
-                xpath = self.find_xpath_from_text_index(element, index)
+                xpath = self.find_xpath_from_text_index(element, index, snapshot=snapshot)
             else:
-                xpath = self.find_xpath_from_text(element)
+                xpath = self.find_xpath_from_text(element, snapshot=snapshot)
             try:
                 execution_logger.debug(f"Finding element by text: {element} with xpath: {xpath}")
                 element_obj = driver.find_element(AppiumBy.XPATH, xpath)
@@ -157,11 +160,14 @@ class AppiumPageSource(ElementSourceInterface):
 
     def locate_using_index(self, element, index, strategy=None) -> Optional[Any]:
         if self.driver is not None and hasattr(self.driver, "ui_helper") and self.driver.ui_helper is not None:
-            locators = self.driver.ui_helper.get_locator_and_strategy_using_index(element, index, strategy)
+            snapshot = self.driver.ui_helper.capture_snapshot()
+            locators = self.driver.ui_helper.get_locator_and_strategy_using_index(
+                element, index, strategy, snapshot=snapshot
+            )
             if locators:
                 strategy = locators['strategy']
                 locator = locators['locator']
-                xpath = self.driver.ui_helper.get_view_locator(strategy=strategy, locator=locator)
+                xpath = self.driver.ui_helper.get_view_locator(strategy=strategy, locator=locator, snapshot=snapshot)
                 try:
                     element_obj = self._require_webdriver().find_element(AppiumBy.XPATH, xpath)
                 except Exception:
@@ -197,14 +203,19 @@ class AppiumPageSource(ElementSourceInterface):
             texts = [el for el in elements if utils.determine_element_type(el) == 'Text']
             xpaths = [el for el in elements if utils.determine_element_type(el) == 'XPath']
 
-            self.get_page_source()  # Refresh page source
+            # Refresh page source once per poll and share it across text and XPath checks
+            snapshot = self._capture_snapshot()
+            if snapshot is None:
+                self.get_page_source()
 
             # Check text-based elements
             text_found = self.ui_text_search(texts, rule) if texts else (rule == "all")
 
             # Check XPath-based elements
             if self.driver is not None and hasattr(self.driver, "ui_helper") and self.driver.ui_helper is not None and xpaths:
-                xpath_results = [self.driver.ui_helper.find_xpath(xpath)[0] for xpath in xpaths]
+                xpath_results = [
+                    self.driver.ui_helper.find_xpath(xpath, snapshot=snapshot)[0] for xpath in xpaths
+                ]
             else:
                 xpath_results = [rule == "all"]
             xpath_found = (all(xpath_results) if rule == "all" else any(xpath_results))
@@ -225,36 +236,51 @@ class AppiumPageSource(ElementSourceInterface):
         if rule not in ["any", "all"]:
             raise ValueError("Invalid rule. Use 'any' or 'all'.")
 
-    def find_xpath_from_text(self, text):
+    def _capture_snapshot(self) -> Optional[PageSourceSnapshot]:
+        """Fetch one page-source snapshot through the driver's UIHelper and mirror its tree."""
+        if self.driver is None or getattr(self.driver, "ui_helper", None) is None:
+            return None
+        snapshot = self.driver.ui_helper.capture_snapshot()
+        self.tree = snapshot.tree
+        self.root = snapshot.root
+        return snapshot
+
+    def find_xpath_from_text(self, text, snapshot: Optional[PageSourceSnapshot] = None):
         """
         Find the XPath of an element based on the text content.
 
         Args:
             text (str): The text content to search for in the UI tree.
+            snapshot (PageSourceSnapshot, optional): Page source shared by all lookups;
+                fetched once if omitted.
 
         Returns:
             str: The XPath of the element containing the
             text content, or None if not found.
         """
         if self.driver is not None and hasattr(self.driver, "ui_helper") and self.driver.ui_helper is not None:
-            locators = self.driver.ui_helper.get_locator_and_strategy(text)
+            snapshot = snapshot or self.driver.ui_helper.capture_snapshot()
+            locators = self.driver.ui_helper.get_locator_and_strategy(text, snapshot=snapshot)
             if locators:
                 strategy = locators['strategy']
                 locator = locators['locator']
-                xpath = self.driver.ui_helper.get_view_locator(strategy=strategy, locator=locator)
+                xpath = self.driver.ui_helper.get_view_locator(strategy=strategy, locator=locator, snapshot=snapshot)
                 return xpath
         else:
             internal_logger.error(APPIUM_NOT_INITIALISED_MSG)
             raise RuntimeError(APPIUM_NOT_INITIALISED_MSG)
         raise RuntimeError("Failed to find XPath from text.")
 
-    def find_xpath_from_text_index(self, text, index, strategy=None):
+    def find_xpath_from_text_index(self, text, index, strategy=None, snapshot: Optional[PageSourceSnapshot] = None):
         if self.driver is not None and hasattr(self.driver, "ui_helper") and self.driver.ui_helper is not None:
-            locators = self.driver.ui_helper.get_locator_and_strategy_using_index(text, index, strategy)
+            snapshot = snapshot or self.driver.ui_helper.capture_snapshot()
+            locators = self.driver.ui_helper.get_locator_and_strategy_using_index(
+                text, index, strategy, snapshot=snapshot
+            )
             if locators:
                 strategy = locators['strategy']
                 locator = locators['locator']
-                xpath = self.driver.ui_helper.get_view_locator(strategy=strategy, locator=locator)
+                xpath = self.driver.ui_helper.get_view_locator(strategy=strategy, locator=locator, snapshot=snapshot)
                 return xpath
             return None
         else:
@@ -1,5 +1,5 @@
 import time
-from typing import Optional, Any, Tuple, List, Dict
+from typing import Optional, Any, Tuple, List, Dict, NamedTuple
 from lxml import etree  # type: ignore
 
 from optics_framework.common.logging_config import internal_logger
@@ -13,6 +13,282 @@ PLAYWRIGHT_NOT_INITIALISED_MSG = (
     "Playwright driver is not initialized for PlaywrightPageSource."
 )
 
+# Walks the live DOM once and returns, for every element with a layout box, its
+# tag, attributes, bounding rect, visibility, display text and a unique XPath.
+# Text and XPath selection mirror _extract_display_text and get_xpath; XPath
+# uniqueness is answered from per-document match maps built in the same pass.
+_INTERACTIVE_ELEMENTS_JS = r"""
+() => {
+    const UNIQUE_ATTRS = ["id", "data-testid", "data-test", "data-qa", "data-cy", "data-automation", "name"];
+    const PAIR_ATTRS = UNIQUE_ATTRS.concat(["aria-label", "placeholder", "title", "alt", "role", "type"]);
+    const MAYBE_UNIQUE_ATTRS = ["aria-label", "placeholder", "title", "alt", "role", "type", "class"];
+    const SEP = "\u0000";
+
+    const root = document.documentElement;
+    if (!root) {
+        return [];
+    }
+    const all = [root].concat(Array.from(root.querySelectorAll("*")));
+    const order = new Map();
+    const matches = new Map();
+    const byTag = new Map();
+
+    const add = (key, idx) => {
+        let list = matches.get(key);
+        if (!list) {
+            list = [];
+            matches.set(key, list);
+        }
+        list.push(idx);
+    };
+    const attrOf = (el, name) => {
+        const v = el.getAttribute(name);
+        return v ? v : null;
+    };
+    const firstClassToken = (value) => {
+        const tokens = value.trim().split(/\s+/);
+        return tokens[0] || null;
+    };
+
+    // One pass: document order, per-tag lists and attribute/pair/class-token match lists.
+    all.forEach((el, idx) => {
+        const tag = el.localName;
+        order.set(el, idx);
+        if (!byTag.has(tag)) {
+            byTag.set(tag, []);
+        }
+        byTag.get(tag).push(el);
+        const present = [];
+        for (const name of PAIR_ATTRS) {
+            const v = attrOf(el, name);
+            if (v !== null) {
+                present.push([name, v]);
+                add(tag + SEP + name + SEP + v, idx);
+            }
+        }
+        for (let i = 0; i < present.length; i++) {
+            for (let j = i + 1; j < present.length; j++) {
+                add(tag + SEP + present[i].join(SEP) + SEP + present[j].join(SEP), idx);
+            }
+        }
+        const cls = el.getAttribute("class");
+        if (cls) {
+            for (const token of new Set(cls.trim().split(/\s+/))) {
+                if (token) {
+                    add(tag + SEP + "class-token" + SEP + token, idx);
+                }
+            }
+        }
+    });
+
+    // normalize-space(.) per tag, computed only for tags that reach the text step.
+    const normalize = (s) => s.replace(/[ \t\r\n]+/g, " ").trim();
+    const textMatches = new Map();
+    const textIndexFor = (tag) => {
+        let index = textMatches.get(tag);
+        if (!index) {
+            index = new Map();
+            for (const el of byTag.get(tag) || []) {
+                const key = normalize(el.textContent || "");
+                if (!index.has(key)) {
+                    index.set(key, []);
+                }
+                index.get(key).push(order.get(el));
+            }
+            textMatches.set(tag, index);
+        }
+        return index;
+    };
+
+    const literal = (s) => {
+        if (!s.includes('"')) {
+            return '"' + s + '"';
+        }
+        if (!s.includes("'")) {
+            return "'" + s + "'";
+        }
+        const parts = s.split('"');
+        const escaped = [];
+        parts.forEach((p, i) => {
+            escaped.push('"' + p + '"');
+            if (i < parts.length - 1) {
+                escaped.push("'\"'");
+            }
+        });
+        return "concat(" + escaped.join(", ") + ")";
+    };
+
+    // Unique xpath as-is, semi-unique as "(xpath)[n]", or null when it matches nothing.
+    const resolve = (xpath, list, el) => {
+        if (!list || list.length === 0) {
+            return null;
+        }
+        if (list.length === 1) {
+            return xpath;
+        }
+        const pos = list.indexOf(order.get(el));
+        return "(" + xpath + ")[" + ((pos < 0 ? 0 : pos) + 1) + "]";
+    };
+
+    const singleAttrXPath = (el, tag, name) => {
+        const v = attrOf(el, name);
+        if (v === null) {
+            return null;
+        }
+        if (name === "class") {
+            const token = firstClassToken(v);
+            if (!token) {
+                return null;
+            }
+            const xpath = "//" + tag + "[contains(concat(' ', normalize-space(@class), ' '), " + literal(" " + token + " ") + ")]";
+            return resolve(xpath, matches.get(tag + SEP + "class-token" + SEP + token), el);
+        }
+        return resolve("//" + tag + "[@" + name + "=" + literal(v) + "]", matches.get(tag + SEP + name + SEP + v), el);
+    };
+
+    const textXPath = (el, tag) => {
+        const parts = [];
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            parts.push(walker.currentNode.nodeValue);
+        }
+        const text = parts.join(" ").trim();
+        if (!text || text.length > 80 || text.includes("\n")) {
+            return null;
+        }
+        const xpath = "//" + tag + "[normalize-space(.)=" + literal(text) + "]";
+        return resolve(xpath, textIndexFor(tag).get(text), el);
+    };
+
+    const hierarchicalXPath = (el) => {
+        const path = [];
+        for (let cur = el; cur; cur = cur.parentElement) {
+            const parent = cur.parentElement;
+            let segment = "/" + cur.localName;
+            if (parent) {
+                const same = Array.from(parent.children).filter((c) => c.localName === cur.localName);
+                if (same.length > 1) {
+                    segment += "[" + (same.indexOf(cur) + 1) + "]";
+                }
+            }
+            path.unshift(segment);
+        }
+        return path.join("");
+    };
+
+    const uniqueXPath = (el) => {
+        const tag = el.localName;
+        for (const name of UNIQUE_ATTRS) {
+            const xpath = singleAttrXPath(el, tag, name);
+            if (xpath) {
+                return xpath;
+            }
+        }
+        for (let i = 0; i < PAIR_ATTRS.length; i++) {
+            for (let j = i + 1; j < PAIR_ATTRS.length; j++) {
+                const v1 = attrOf(el, PAIR_ATTRS[i]);
+                const v2 = attrOf(el, PAIR_ATTRS[j]);
+                if (v1 === null || v2 === null) {
+                    continue;
+                }
+                const xpath = "//" + tag + "[@" + PAIR_ATTRS[i] + "=" + literal(v1) + " and @" + PAIR_ATTRS[j] + "=" + literal(v2) + "]";
+                const resolved = resolve(xpath, matches.get(tag + SEP + PAIR_ATTRS[i] + SEP + v1 + SEP + PAIR_ATTRS[j] + SEP + v2), el);
+                if (resolved) {
+                    return resolved;
+                }
+            }
+        }
+        const byText = textXPath(el, tag);
+        if (byText) {
+            return byText;
+        }
+        for (const name of MAYBE_UNIQUE_ATTRS) {
+            const xpath = singleAttrXPath(el, tag, name);
+            if (xpath) {
+                return xpath;
+            }
+        }
+        return hierarchicalXPath(el);
+    };
+
+    const leadingText = (nodes) => {
+        let s = "";
+        for (const n of nodes) {
+            if (n.nodeType !== Node.TEXT_NODE && n.nodeType !== Node.CDATA_SECTION_NODE) {
+                break;
+            }
+            s += n.nodeValue;
+        }
+        return s.trim();
+    };
+    const followingText = (el) => {
+        const nodes = [];
+        for (let n = el.nextSibling; n; n = n.nextSibling) {
+            nodes.push(n);
+        }
+        return leadingText(nodes);
+    };
+
+    // Same priority as PlaywrightPageSource._extract_display_text.
+    const displayText = (el) => {
+        const own = leadingText(Array.from(el.childNodes));
+        if (own) {
+            return [own, "text"];
+        }
+        const tail = followingText(el);
+        if (tail) {
+            return [tail, "tail"];
+        }
+        for (const name of ["aria-label", "title", "alt", "placeholder"]) {
+            const v = (el.getAttribute(name) || "").trim();
+            if (v) {
+                return [v, name];
+            }
+        }
+        const inner = (typeof el.innerText === "string" ? el.innerText : el.textContent || "").trim();
+        if (inner) {
+            return [inner, "innerText"];
+        }
+        const id = (el.getAttribute("id") || "").trim();
+        if (id) {
+            return [id, "id"];
+        }
+        const token = firstClassToken(el.getAttribute("class") || "");
+        return token ? [token, "class"] : [null, null];
+    };
+
+    const results = [];
+    for (const el of all.slice(1)) {
+        if (el.getClientRects().length === 0) {
+            continue;
+        }
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        const attrs = {};
+        for (const attr of Array.from(el.attributes)) {
+            attrs[attr.name] = attr.value;
+        }
+        const [text, textKey] = displayText(el);
+        results.push({
+            tag: el.localName,
+            attrs: attrs,
+            bounds: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
+            visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden" && style.display !== "none",
+            text: text,
+            textKey: textKey,
+            xpath: uniqueXPath(el),
+        });
+    }
+    return results;
+}
+"""
+
+
+class _DomNode(NamedTuple):
+    """Tag and attributes of an element from the in-page payload (what the filter checks read)."""
+    tag: str
+    attrib: Dict[str, str]
+
 
 class PlaywrightPageSource(ElementSourceInterface):
     """
@@ -117,6 +393,10 @@ class PlaywrightPageSource(ElementSourceInterface):
         """
         Cross-platform element extraction for web pages.
 
+        The DOM is walked in the browser by a single ``page.evaluate`` call that
+        returns bounds, text and XPath for every element; the per-node locator
+        round trips are only used as a fallback if that script fails.
+
         Args:
             filter_config: Optional list of filter types. Valid values:
                 - "all": Show all elements (default when None or empty)
@@ -130,6 +410,58 @@ class PlaywrightPageSource(ElementSourceInterface):
         Returns:
             List of dictionaries with keys: text, bounds, xpath, extra
         """
+        page = self._require_page()
+        try:
+            payload = run_async(page.evaluate(_INTERACTIVE_ELEMENTS_JS))
+        except Exception as e:
+            internal_logger.warning(
+                f"[PlaywrightPageSource] In-page element extraction failed, falling back to per-node lookups: {e}"
+            )
+            return self._get_interactive_elements_from_tree(filter_config)
+        return self._elements_from_payload(payload or [], filter_config)
+
+    def _elements_from_payload(self, payload: List[Dict], filter_config: Optional[List[str]]) -> List[Dict]:
+        """
+        Convert the in-page extraction payload into get_interactive_elements results.
+
+        :param payload: Items returned by ``_INTERACTIVE_ELEMENTS_JS``
+        :param filter_config: Optional list of filter types
+        :return: List of dictionaries with keys: text, bounds, xpath, extra
+        """
+        results = []
+        for item in payload:
+            node = _DomNode(item.get("tag") or "", item.get("attrs") or {})
+            if not self._should_include_element(node, filter_config):
+                continue
+
+            rect = item.get("bounds") or {}
+            try:
+                x1, y1 = int(rect["x"]), int(rect["y"])
+                bounds = {
+                    "x1": x1,
+                    "y1": y1,
+                    "x2": int(rect["x"] + rect["width"]),
+                    "y2": int(rect["y"] + rect["height"]),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            text, used_key = item.get("text"), item.get("textKey")
+            if not text:
+                # If no text-like attribute, use tag name
+                text, used_key = node.tag, None
+
+            extra = self._build_extra_metadata(node.attrib, used_key, node.tag)
+            extra["visible"] = item.get("visible")
+            results.append(
+                {"text": text, "bounds": bounds, "xpath": item.get("xpath") or "", "extra": extra}
+            )
+        return results
+
+    def _get_interactive_elements_from_tree(self, filter_config: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Per-node extraction from the parsed page source (one locator round trip per node).
+        """
         # Ensure page source is fetched and parsed
         self.get_page_source()  # Returns (html, timestamp); updates self.tree
 
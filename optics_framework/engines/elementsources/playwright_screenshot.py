@@ -1,8 +1,9 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
 import numpy as np
 import cv2
 
 from playwright.sync_api import Page
+from optics_framework.common import utils
 from optics_framework.common.elementsource_interface import ElementSourceInterface
 from optics_framework.common.logging_config import internal_logger
 from optics_framework.common.async_utils import run_async
@@ -80,6 +81,32 @@ class PlaywrightScreenshot(ElementSourceInterface):
                 f"Error capturing Playwright screenshot: {e}"
             ) from e
 
+    def capture_region(
+        self, aoi_x: float, aoi_y: float, aoi_width: float, aoi_height: float
+    ) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+        """
+        Capture only an Area of Interest of the viewport using Playwright's ``clip``.
+
+        Returns:
+            Tuple of (region image, (x1, y1, x2, y2)) in full-screenshot pixels.
+        """
+        page = self._require_page()
+        width, height, scale = run_async(
+            page.evaluate("() => [window.innerWidth, window.innerHeight, window.devicePixelRatio || 1]")
+        )
+        (x, y, clip_width, clip_height), bounds = utils.aoi_clip_for_viewport(
+            width, height, scale, aoi_x, aoi_y, aoi_width, aoi_height
+        )
+        screenshot_bytes = run_async(page.screenshot(
+            full_page=False,
+            clip={"x": x, "y": y, "width": clip_width, "height": clip_height},
+        ))
+        region = cv2.imdecode(np.frombuffer(screenshot_bytes, np.uint8), cv2.IMREAD_COLOR)  # type: ignore
+        if region is None:
+            raise RuntimeError("Failed to decode Playwright region screenshot")
+        internal_logger.debug("Playwright region screenshot %s for AOI bounds %s", region.shape, bounds)
+        return utils.fit_region_to_bounds(region, bounds), bounds
+
     # --------------------------------------------------
     # Unsupported operations
     # --------------------------------------------------
@@ -1,8 +1,9 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
 import base64
 import cv2
 import numpy as np
 from selenium.common.exceptions import ScreenshotException
+from optics_framework.common import utils
 from optics_framework.common.elementsource_interface import ElementSourceInterface
 from optics_framework.common.logging_config import internal_logger
 
@@ -58,6 +59,41 @@ class SeleniumScreenshot(ElementSourceInterface):
             internal_logger.warning("Error capturing Selenium screenshot: %s. Using external camera.", e)
             raise RuntimeError("Error capturing Selenium screenshot.") from e
 
+    def capture_region(
+        self, aoi_x: float, aoi_y: float, aoi_width: float, aoi_height: float
+    ) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+        """
+        Capture only an Area of Interest of the viewport.
+
+        Uses the DevTools ``Page.captureScreenshot`` clip, so it needs a
+        Chromium-based driver; other browsers fail here and callers crop a full
+        screenshot instead.
+
+        Returns:
+            Tuple of (region image, (x1, y1, x2, y2)) in full-screenshot pixels.
+        """
+        driver = self._require_driver()
+        execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+        if execute_cdp_cmd is None:
+            raise RuntimeError("Region screenshots need a Chromium-based Selenium driver.")
+        width, height, scale, scroll_x, scroll_y = driver.execute_script(
+            "return [window.innerWidth, window.innerHeight, window.devicePixelRatio || 1,"
+            " window.scrollX, window.scrollY];"
+        )
+        (x, y, clip_width, clip_height), bounds = utils.aoi_clip_for_viewport(
+            width, height, scale, aoi_x, aoi_y, aoi_width, aoi_height
+        )
+        # DevTools clips in document coordinates, so offset the viewport clip by the scroll position.
+        result = execute_cdp_cmd("Page.captureScreenshot", {
+            "format": "png",
+            "clip": {"x": x + scroll_x, "y": y + scroll_y, "width": clip_width, "height": clip_height, "scale": 1},
+        })
+        region = cv2.imdecode(np.frombuffer(base64.b64decode(result["data"]), np.uint8), cv2.IMREAD_COLOR)
+        if region is None:
+            raise RuntimeError("Failed to decode Selenium region screenshot")
+        internal_logger.debug("Selenium region screenshot %s for AOI bounds %s", region.shape, bounds)
+        return utils.fit_region_to_bounds(region, bounds), bounds
+
     def assert_elements(self, elements, timeout=30, rule='any') -> None:
         internal_logger.exception("SeleniumScreenshot does not support asserting elements.")
         raise NotImplementedError("SeleniumScreenshot does not support asserting elements.")
@@ -3,17 +3,17 @@ import cv2
 from typing import Optional
 from optics_framework.common.models import TemplateData
 
-def load_template(element: str, template_data: Optional[TemplateData] = None) -> np.ndarray:
+def resolve_template_path(element: str, template_data: Optional[TemplateData] = None) -> str:
     """
-    Load a template image using dynamic template mapping.
+    Resolve a template name to its path on disk using dynamic template mapping.
 
     :param element: The name of the template image file.
     :type element: str
     :param template_data: TemplateData containing image mappings. Must be provided.
     :type template_data: Optional[TemplateData]
 
-    :return: The template image as a NumPy array.
-    :rtype: np.ndarray
+    :return: The filesystem path of the template image.
+    :rtype: str
 
     :raises ValueError: If the template is not found.
     """
@@ -23,7 +23,24 @@ def load_template(element: str, template_data: Optional[TemplateData] = None) ->
     template_path = template_data.get_template_path(element)
     if not template_path:
         raise ValueError(f"Template '{element}' not found in template data")
+    return template_path
+
 
+def load_template(element: str, template_data: Optional[TemplateData] = None) -> np.ndarray:
+    """
+    Load a template image using dynamic template mapping.
+
+    :param element: The name of the template image file.
+    :type element: str
+    :param template_data: TemplateData containing image mappings. Must be provided.
+    :type template_data: Optional[TemplateData]
+
+    :return: The template image as a NumPy array.
+    :rtype: np.ndarray
+
+    :raises ValueError: If the template is not found.
+    """
+    template_path = resolve_template_path(element, template_data)
     template = cv2.imread(template_path)
     if template is None:
         raise ValueError(f"Failed to load template from path: {template_path}")
@@ -0,0 +1,84 @@
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 8
+
+
+class PooledHTTPClient:
+    """
+    Keep-alive HTTP client shared by the remote vision engines.
+
+    Wraps one ``requests.Session`` whose adapters keep up to ``pool_size``
+    connections open per host, so consecutive frames reuse the TCP/TLS
+    connection instead of handshaking on every call. :meth:`submit` runs work
+    on a pool of the same size, letting several frames or templates be in
+    flight at once without opening more connections than the pool holds.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = 0):
+        self.pool_size = max(1, int(pool_size))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=max_retries,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST over a pooled connection; accepts the keyword arguments of ``requests.post``."""
+        return self.session.post(url, **kwargs)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Run ``fn`` (typically a method issuing requests through this client) in the background."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size, thread_name_prefix="optics-http"
+                )
+            return self._executor.submit(fn, *args, **kwargs)
+
+    def close(self) -> None:
+        """Wait for background requests and close all pooled connections."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.session.close()
+
+
+# Clients are process-wide rather than per session: GenericFactory caches the
+# remote engines holding them and hands the same instances to later sessions,
+# so no single session teardown may close a client. They are closed at exit.
+_clients: Dict[int, PooledHTTPClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_http_client(pool_size: int = DEFAULT_POOL_SIZE) -> PooledHTTPClient:
+    """Return the process-wide client for ``pool_size`` (engines on the same host share connections)."""
+    pool_size = max(1, int(pool_size))
+    with _clients_lock:
+        client = _clients.get(pool_size)
+        if client is None:
+            client = PooledHTTPClient(pool_size=pool_size)
+            _clients[pool_size] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """Close every process-wide client; a later :func:`get_http_client` opens a new one."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_http_clients)
@@ -1,5 +1,8 @@
-from typing import Dict, Any, Optional, List, Tuple, Literal
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, List, Tuple, Literal, Union
 import base64
+import os
+import threading
 import json
 import cv2
 import numpy as np
@@ -7,7 +10,9 @@ import requests
 from optics_framework.common.image_interface import ImageInterface
 from optics_framework.common import utils
 from optics_framework.common.logging_config import internal_logger
-from optics_framework.engines.vision_models.base_methods import load_template
+from optics_framework.engines.vision_models.base_methods import resolve_template_path
+from optics_framework.engines.vision_models.http_client import DEFAULT_POOL_SIZE, get_http_client
+from optics_framework.engines.vision_models.image_transport import EncodedImage, ImageTransport
 
 class RemoteImageDetection(ImageInterface):
     DEPENDENCY_TYPE = "image_detection"
@@ -27,14 +32,22 @@ class RemoteImageDetection(ImageInterface):
         self.capabilities: Dict[str, Any] = config.get("capabilities", {})
         self.timeout: int = self.capabilities.get("timeout", 30)
         self.method: str = self.capabilities.get("method", "template_matching")
-
-    def detect_images(self, image_base64: str, template_base64: str, detection_method: str) -> List[Dict[str, Any]]:
+        self.http = get_http_client(int(self.capabilities.get("pool_size", DEFAULT_POOL_SIZE)))
+        self.transport = ImageTransport.from_capabilities(self.capabilities)
+        # Opt-in: one request per frame for all templates, which are uploaded once and sent by hash.
+        self.batch_templates: bool = bool(self.capabilities.get("batch_templates", False))
+        self._encoded_templates: Dict[tuple, EncodedImage] = {}
+        self._uploaded_templates: set = set()
+        self._templates_lock = threading.Lock()
+
+    def detect_images(self, image_base64: Union[str, EncodedImage], template_base64: Union[str, EncodedImage], detection_method: str) -> List[Dict[str, Any]]:
         """
         Detect template images in a source image via REST API.
 
         Args:
-            image_base64 (str): Base64 encoded source image string
-            template_base64 (str): Base64 encoded template image string
+            image_base64 (str | EncodedImage): Base64 encoded source image string, or an image
+                already prepared by the transport (coordinates are mapped back by its scale)
+            template_base64 (str | EncodedImage): Base64 encoded template image string or prepared template
             detection_method (str): Name of the image detection method
 
         Returns:
@@ -45,27 +58,17 @@ class RemoteImageDetection(ImageInterface):
             RuntimeError: If API request fails
         """
         try:
-            payload = {
-                "method": detection_method,
-                "image": image_base64,
-                "template": template_base64
-            }
-            response = requests.post(
+            image = self.transport.encode(image_base64) if isinstance(image_base64, str) else image_base64
+            template = self.transport.encode(template_base64) if isinstance(template_base64, str) else template_base64
+            response = self.http.post(
                 f"{self.detection_url}/detect-image",
-                json=payload,
-                timeout=self.timeout
+                timeout=self.timeout,
+                **self.transport.request_kwargs({"method": detection_method}, {"image": image, "template": template})
             )
             response.raise_for_status()
             result = response.json()
 
-            formatted_results = []
-            for item in result.get("results", []):
-                formatted_results.append({
-                    "center": tuple(item.get("center", (0, 0))),
-                    # Expected: [(x1,y1), (x2,y2)]
-                    "bbox": item.get("bbox", []),
-                    "confidence": item.get("confidence", 0.0)
-                })
+            formatted_results = self._format_detections(result.get("results", []), image.scale)
 
             internal_logger.debug(
                 f"Successfully detected {len(formatted_results)} image instances")
@@ -80,13 +83,108 @@ class RemoteImageDetection(ImageInterface):
             raise RuntimeError(
                 "Invalid response format from image detection API") from e
 
+    @staticmethod
+    def _format_detections(items: List[Dict[str, Any]], scale: float) -> List[Dict[str, Any]]:
+        """Normalise service matches and map them back to the original frame's coordinates."""
+        formatted_results = []
+        for item in items:
+            center = item.get("center", (0, 0))
+            formatted_results.append({
+                "center": (int(center[0] / scale), int(center[1] / scale)),
+                # Expected: [(x1,y1), (x2,y2)]
+                "bbox": [(pt[0] / scale, pt[1] / scale) for pt in item.get("bbox", [])],
+                "confidence": item.get("confidence", 0.0)
+            })
+        return formatted_results
+
+    def detect_images_batch(self, image: EncodedImage, templates: Dict[str, EncodedImage], detection_method: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Detect several templates in one frame with a single request.
+
+        Templates are uploaded to ``{url}/templates`` the first time they are seen
+        and afterwards referenced by content hash in ``{url}/detect-images``,
+        whose response maps each hash to its matches. If the service answers 409
+        with the hashes it no longer holds, those are uploaded again and the
+        request is retried once.
+
+        Args:
+            image (EncodedImage): Frame prepared by the transport.
+            templates (Dict[str, EncodedImage]): Template name to prepared template.
+            detection_method (str): Name of the image detection method.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Matches per template name, in the format of :meth:`detect_images`.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        ids = {name: template.content_hash() for name, template in templates.items()}
+        by_id = {ids[name]: template for name, template in templates.items()}
+        try:
+            self._upload_templates(by_id)
+            response = self._post_batch(image, list(by_id), detection_method)
+            if response.status_code == 409:
+                missing = set(response.json().get("missing", [])) & set(by_id)
+                with self._templates_lock:
+                    self._uploaded_templates.difference_update(missing)
+                self._upload_templates(by_id)
+                response = self._post_batch(image, list(by_id), detection_method)
+            response.raise_for_status()
+            results = response.json().get("results", {})
+        except requests.exceptions.RequestException as e:
+            internal_logger.error(f"Failed to detect images via batch API: {str(e)}")
+            raise RuntimeError(f"Batch image detection API request failed: {str(e)}") from e
+        except json.JSONDecodeError as e:
+            internal_logger.error(f"Failed to parse batch API response: {str(e)}")
+            raise RuntimeError("Invalid response format from batch image detection API") from e
+        return {name: self._format_detections(results.get(ids[name], []), image.scale) for name in templates}
+
+    def _post_batch(self, image: EncodedImage, template_ids: List[str], detection_method: str) -> requests.Response:
+        return self.http.post(
+            f"{self.detection_url}/detect-images",
+            timeout=self.timeout,
+            **self.transport.request_kwargs(
+                {"method": detection_method, "templates": template_ids}, {"image": image})
+        )
+
+    def _upload_templates(self, templates: Dict[str, EncodedImage]) -> None:
+        """Upload templates the service has not received yet from this client."""
+        with self._templates_lock:
+            missing = {tid: t for tid, t in templates.items() if tid not in self._uploaded_templates}
+        for template_id, template in missing.items():
+            response = self.http.post(
+                f"{self.detection_url}/templates",
+                timeout=self.timeout,
+                **self.transport.request_kwargs({"id": template_id}, {"template": template})
+            )
+            response.raise_for_status()
+            with self._templates_lock:
+                self._uploaded_templates.add(template_id)
+            internal_logger.debug(f"Uploaded template {template_id} to {self.detection_url}")
+
+    def _encoded_template(self, name: str, scale: float) -> EncodedImage:
+        """Load, resize and encode a template once per file version and frame scale."""
+        template_path = resolve_template_path(name, self.templates)
+        stat = os.stat(template_path)
+        key = (template_path, stat.st_mtime_ns, stat.st_size, round(scale, 6))
+        with self._templates_lock:
+            encoded = self._encoded_templates.get(key)
+        if encoded is None:
+            image = cv2.imread(template_path)
+            if image is None:
+                raise ValueError(f"Failed to load template from path: {template_path}")
+            encoded = self.transport.encode(image, scale=scale)
+            with self._templates_lock:
+                self._encoded_templates[key] = encoded
+        return encoded
+
     def find_element(self, input_data: str, image: str, index: Optional[int] = None) -> Optional[Tuple[bool, Tuple[int, int], Tuple[Tuple[int, int], Tuple[int, int]]]]:
         """
         Locate multiple instances of a template image in the given source image using remote detection
         and return the center coordinates and bounding box of the match at the given index.
 
         Parameters:
-        - input_data (str): Base64 encoded source image string
+        - input_data (str | np.ndarray): Base64 encoded source image string or a BGR frame
         - image (str): Template image path or identifier
         - index (int): The index of the match to retrieve (default: None, returns first match)
 
@@ -95,9 +193,13 @@ class RemoteImageDetection(ImageInterface):
             Tuple of (success, center coordinates, bounding box) if found, None if not found or index out of bounds
         """
         try:
-            img_data = base64.b64decode(input_data)
-            nparr = np.frombuffer(img_data, np.uint8)
-            img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            if isinstance(input_data, np.ndarray):
+                img = input_data
+            else:
+                img_data = base64.b64decode(input_data)
+                nparr = np.frombuffer(img_data, np.uint8)
+                img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            frame = self.transport.encode(img)
         except Exception as e:
             internal_logger.error(f"Failed to decode input image: {str(e)}")
             return None
@@ -107,15 +209,14 @@ class RemoteImageDetection(ImageInterface):
             if image is None:
                 internal_logger.error("Template image path or identifier is None.")
                 return None
-            template_image = load_template(image)
-            template_base64 = utils.encode_numpy_to_base64(template_image)
+            template = self._encoded_template(image, frame.scale)
         except Exception as e:
             internal_logger.error(f"Failed to load or encode template image: {str(e)}")
             return None
 
         # Get all detected images
         try:
-            detected_images = self.detect_images(input_data, template_base64, self.method)
+            detected_images = self.detect_images(frame, template, self.method)
         except Exception as e:
             internal_logger.error(f"Remote detection failed: {str(e)}")
             raise RuntimeError(f"Remote detection failed: {str(e)}")
@@ -195,16 +296,31 @@ class RemoteImageDetection(ImageInterface):
         annotated_frame = input_data.copy()
         found_status = []
 
-        # encode frame to base64
-        frame_base64 = utils.encode_numpy_to_base64(input_data)
-        encoded_templates = self._prepare_encoded_templates(elements)
+        # resize and encode the frame once; templates follow the frame's scale
+        frame = self.transport.encode(input_data)
+        encoded_templates = self._prepare_encoded_templates(elements, frame.scale)
 
         found_status = []
 
-        for template_name, encoded_template in encoded_templates.items():
-            match_found = self._detect_and_match_template(
-                frame_base64, template_name, encoded_template, annotated_frame)
-            found_status.append(match_found)
+        batched = self._detect_batched(frame, encoded_templates) if self.batch_templates else None
+        if batched is not None:
+            for template_name, encoded_template in encoded_templates.items():
+                if not encoded_template:
+                    internal_logger.error(f"Template image '{template_name}' could not be loaded or encoded.")
+                    found_status.append(False)
+                    continue
+                found_status.append(self._annotate_detections(batched.get(template_name, []), annotated_frame))
+        else:
+            # Send every template at once over the pooled client; annotate in order as results arrive.
+            pending = {
+                template_name: self.http.submit(self.detect_images, frame, encoded_template, self.method)
+                for template_name, encoded_template in encoded_templates.items()
+                if encoded_template
+            }
+            for template_name, encoded_template in encoded_templates.items():
+                match_found = self._detect_and_match_template(
+                    frame, template_name, encoded_template, annotated_frame, pending.get(template_name))
+                found_status.append(match_found)
 
         match_rule = any(found_status) if rule == "any" else all(found_status)
 
@@ -213,7 +329,7 @@ class RemoteImageDetection(ImageInterface):
         internal_logger.warning("Remote template matching failed.")
         return False, annotated_frame
 
-    def _prepare_encoded_templates(self, templates: list) -> Dict[str, Optional[str]]:
+    def _prepare_encoded_templates(self, templates: list, scale: float = 1.0) -> Dict[str, Optional[EncodedImage]]:
         encoded = {}
         for template in templates:
             try:
@@ -221,24 +337,43 @@ class RemoteImageDetection(ImageInterface):
                     internal_logger.error("Template path or identifier is empty.")
                     encoded[template] = None
                     continue
-                img = load_template(template)
-                encoded[template] = utils.encode_numpy_to_base64(img)
+                encoded[template] = self._encoded_template(template, scale)
             except Exception as e:
                 internal_logger.error(f"Failed to load or encode template '{template}': {e}")
                 encoded[template] = None
         return encoded
 
-    def _detect_and_match_template(self, frame_base64: str, template_name: str, encoded_template: Optional[str], frame: np.ndarray) -> bool:
+    def _detect_batched(self, frame: EncodedImage, encoded_templates: Dict[str, Optional[EncodedImage]]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Run the batch request; ``None`` means fall back to one request per template."""
+        templates = {name: template for name, template in encoded_templates.items() if template}
+        if not templates:
+            return {}
+        try:
+            return self.detect_images_batch(frame, templates, self.method)
+        except Exception as e:
+            internal_logger.warning(f"Batch detection failed, falling back to per-template requests: {e}")
+            return None
+
+    def _detect_and_match_template(self, encoded_frame: EncodedImage, template_name: str, encoded_template: Optional[EncodedImage], frame: np.ndarray,
+                                   pending: Optional["Future[List[Dict[str, Any]]]"] = None) -> bool:
         if not encoded_template:
             internal_logger.error(f"Template image '{template_name}' could not be loaded or encoded.")
             return False
 
         try:
-            detections = self.detect_images(frame_base64, encoded_template, self.method)
+            if pending is not None:
+                detections = pending.result()
+            else:
+                detections = self.detect_images(encoded_frame, encoded_template, self.method)
         except Exception as e:
             internal_logger.error(f"Detection failed for '{template_name}': {e}")
             return False
 
+        return self._annotate_detections(detections, frame)
+
+    @staticmethod
+    def _annotate_detections(detections: List[Dict[str, Any]], frame: np.ndarray) -> bool:
+        """Draw every match on ``frame``; return True if at least one had a usable bbox."""
         match_found = False
         for detection in detections:
             center = detection["center"]
@@ -3,22 +3,34 @@ import cv2
 import numpy as np
 from optics_framework.common.image_interface import ImageInterface
 from optics_framework.common.logging_config import internal_logger
-from optics_framework.engines.vision_models.base_methods import load_template
+from optics_framework.engines.vision_models.base_methods import resolve_template_path
+from optics_framework.engines.vision_models.template_cache import (
+    FrameFeatures,
+    TemplateFeatures,
+    create_sift,
+    get_template_cache,
+)
 from optics_framework.common import utils
 
 class TemplateMatchingHelper(ImageInterface):
     """
     Template matching helper that detects a reference image inside an input image.
 
-    This class uses OpenCV's :func:`cv2.matchTemplate` function to locate instances
-    of a template (reference image) within a larger image.
+    This class uses SIFT features and FLANN-based matching to locate instances
+    of a template (reference image) within a larger image. Template features are
+    served from a process-wide :class:`TemplateDescriptorCache`, so each template
+    is read and described only once.
     """
 
+    FLANN_INDEX_KDTREE = 1
+
     def __init__(self, config=None):
         """
         Initialize TemplateMatchingHelper with config dict.
         Args:
             config: dict containing configuration, including project_path and templates.
+                Optional capabilities: ``sift_params`` (dict of cv2.SIFT_create arguments)
+                and ``descriptor_cache_dir`` (directory for the on-disk descriptor store).
         """
         self.config = config
         if config is None:
@@ -26,49 +38,53 @@ class TemplateMatchingHelper(ImageInterface):
         self.project_path = self.config.get("project_path", "")
         self.templates = self.config.get("templates", None)
         self.execution_output_dir = self.config.get("execution_output_path", "")
-
-    def find_element(
-        self, input_data, image, index=None, confidence_level=0.85, min_inliers=10
-    ):
-        """
-        Match a template image within a single frame image using SIFT and FLANN-based matching.
-        Returns the location of a specific match by index.
+        capabilities = self.config.get("capabilities") or {}
+        self.sift_params = dict(capabilities.get("sift_params") or {})
+        self.template_cache = get_template_cache(capabilities.get("descriptor_cache_dir"))
+        self.sift = create_sift(self.sift_params)
+        self.index_params = {"algorithm": self.FLANN_INDEX_KDTREE, "trees": 5}
+        self.search_params = {"checks": 50}
+
+    def _template_features(self, image) -> TemplateFeatures:
+        """Return cached SIFT features for a template name or an in-memory template image."""
+        if isinstance(image, np.ndarray):
+            return self.template_cache.get_for_image(image, self.sift, self.sift_params)
+        template_path = resolve_template_path(image, self.templates)
+        return self.template_cache.get(template_path, self.sift, self.sift_params)
+
+    def frame_features(self, input_data) -> FrameFeatures:
+        """Extract SIFT features of a BGR frame once so several templates can share them."""
+        return FrameFeatures(input_data, self.sift, self.index_params, self.search_params)
+
+    def _match_homography(self, template: TemplateFeatures, frame: FrameFeatures, confidence_level, min_inliers):
         """
-        image = load_template(image, self.templates)
-        sift = cv2.SIFT_create()
-        FLANN_INDEX_KDTREE = 1
-        index_params = {"algorithm": FLANN_INDEX_KDTREE, "trees": 5}
-        search_params = {"checks": 50}
-        flann = cv2.FlannBasedMatcher(index_params, search_params)
+        Match template features against frame features and compute the homography.
 
-        if image is None or input_data is None:
-            raise ValueError("Input data or template image is None.")
-
-        frame_gray = cv2.cvtColor(input_data, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        kp_frame, des_frame = sift.detectAndCompute(frame_gray, None)
-        kp_template, des_template = sift.detectAndCompute(template_gray, None)
-
-        if des_template is None or des_frame is None:
+        :return: (M, inliers) where M maps template coordinates into the frame.
+        :raises RuntimeError: If any matching stage fails.
+        """
+        if template.descriptors is None or frame.descriptors is None:
             raise RuntimeError("SIFT feature detection failed.")
 
         try:
-            matches = flann.knnMatch(des_template, des_frame, k=2)
-        except cv2.error:
-            raise RuntimeError("FLANN matching failed.")
+            matches = frame.knn_match(template.descriptors, k=2)
+        except cv2.error as e:
+            internal_logger.debug(f"Error in FLANN matching: {e}")
+            raise RuntimeError(f"FLANN matching failed: {str(e)}")
 
+        # Apply Lowe's ratio test to filter good matches
         good_matches = [
-            m for m, n in matches if m.distance < confidence_level * n.distance
+            pair[0] for pair in matches
+            if len(pair) == 2 and pair[0].distance < confidence_level * pair[1].distance
         ]
 
         if len(good_matches) < min_inliers:
             raise RuntimeError("Not enough good matches found.")
 
         src_pts = np.float32(
-            [kp_template[m.queryIdx].pt for m in good_matches]
+            [template.keypoints[m.queryIdx].pt for m in good_matches]
         ).reshape(-1, 1, 2)
-        dst_pts = np.float32([kp_frame[m.trainIdx].pt for m in good_matches]).reshape(
+        dst_pts = np.float32([frame.keypoints[m.trainIdx].pt for m in good_matches]).reshape(
             -1, 1, 2
         )
 
@@ -76,40 +92,50 @@ class TemplateMatchingHelper(ImageInterface):
         if M is None:
             raise RuntimeError("Homography computation failed.")
 
-        matches_mask = mask.ravel().tolist()
-        inliers = np.sum(matches_mask)
+        inliers = int(np.sum(mask.ravel()))
         if inliers < min_inliers:
             raise RuntimeError("Not enough inliers found.")
+        return M, inliers
+
+    def find_element(
+        self, input_data, image, index=None, confidence_level=0.85, min_inliers=10
+    ):
+        """
+        Match a template image within a single frame image using SIFT and FLANN-based matching.
+        Returns the location of a specific match by index.
+        """
+        if image is None or input_data is None:
+            raise ValueError("Input data or template image is None.")
+        return self._find_in_frame(
+            self.frame_features(input_data), image, index, confidence_level, min_inliers
+        )
+
+    def _find_in_frame(
+        self, frame: FrameFeatures, image, index=None, confidence_level=0.85, min_inliers=10
+    ):
+        """Locate a template in a frame whose features were already extracted."""
+        template = self._template_features(image)
+        M, inliers = self._match_homography(template, frame, confidence_level, min_inliers)
+
+        h, w = template.shape[:2]
+        center_template = np.float32([[w / 2, h / 2]]).reshape(-1, 1, 2)
+        center_frame = cv2.perspectiveTransform(center_template, M)
+        center = (int(center_frame[0][0][0]), int(center_frame[0][0][1]))
 
-        h, w = image.shape[:2]
-        centers = []
-        bboxes = []
-        for i in range(len(good_matches)):
-            if matches_mask[i]:
-                center_template = np.float32([[w / 2, h / 2]]).reshape(-1, 1, 2)
-                center_frame = cv2.perspectiveTransform(center_template, M)
-                center_x, center_y = (
-                    int(center_frame[0][0][0]),
-                    int(center_frame[0][0][1]),
-                )
-                centers.append((center_x, center_y))
-
-                # Bounding box
-                pts = np.float32([[0, 0], [w, 0], [w, h], [0, h]]).reshape(-1, 1, 2)
-                dst = cv2.perspectiveTransform(pts, M)
-                bbox = (tuple(np.int32(dst[0][0])), tuple(np.int32(dst[2][0])))
-                bboxes.append(bbox)
-
-        if not centers or not bboxes:
-            raise RuntimeError("No valid centers or bounding boxes found.")
+        # Bounding box
+        pts = np.float32([[0, 0], [w, 0], [w, h], [0, h]]).reshape(-1, 1, 2)
+        dst = cv2.perspectiveTransform(pts, M)
+        bbox = (tuple(np.int32(dst[0][0])), tuple(np.int32(dst[2][0])))
 
+        # Every inlier maps through the same homography, so each indexable
+        # match shares one center and bounding box.
         if index is not None:
-            if 0 <= index < len(centers):
-                return True, centers[index], bboxes[index]
+            if 0 <= index < inliers:
+                return True, center, bbox
             else:
                 raise IndexError("Index out of bounds for detected centers.")
 
-        return True, centers[0], bboxes[0]
+        return True, center, bbox
 
     def assert_elements(self, input_data, elements, rule="any"):
         """
@@ -125,15 +151,18 @@ class TemplateMatchingHelper(ImageInterface):
         """
         annotated_frame = input_data.copy()
         found_status = dict.fromkeys(elements, False)
+        # One SIFT pass and one FLANN index for the frame, shared by every template.
+        frame = self.frame_features(input_data)
 
         for template_path in elements:
             if found_status[template_path]:  # Skip if already found (for 'all' rule)
                 continue
 
-            result = self.find_element(
-                input_data.copy(),  # use a copy of the frame to avoid overwriting annotations across templates
-                image=template_path,
-            )
+            try:
+                result = self._find_in_frame(frame, template_path)
+            except (RuntimeError, ValueError, IndexError) as e:
+                internal_logger.debug(f"Template '{template_path}' not matched: {e}")
+                result = None
             if result is not None:
                 success, _, bbox = result
                 if success:
@@ -176,56 +205,13 @@ class TemplateMatchingHelper(ImageInterface):
         if offset is None:
             offset = [0, 0]
 
-        # Create SIFT object
-        sift = cv2.SIFT_create()
-
-        # Create FLANN object with parameters
-        FLANN_INDEX_KDTREE = 1
-        index_params = {"algorithm": FLANN_INDEX_KDTREE, "trees": 5}
-        search_params = {"checks": 50}
-        flann = cv2.FlannBasedMatcher(index_params, search_params)
-
         if reference_data is None or input_data is None:
             raise ValueError("Input image and reference image must be provided.")
 
-        frame_gray = cv2.cvtColor(input_data, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(reference_data, cv2.COLOR_BGR2GRAY)
-
-        # Detect keypoints and descriptors for both images
-        kp_frame, des_frame = sift.detectAndCompute(frame_gray, None)
-        kp_template, des_template = sift.detectAndCompute(template_gray, None)
-
-        if des_template is None or des_frame is None:
-            raise RuntimeError("Feature detection failed.")
-
-        try:
-            matches = flann.knnMatch(des_template, des_frame, k=2)
-        except cv2.error as e:
-            internal_logger.debug(f"Error in FLANN matching: {e}")
-            raise RuntimeError(f"FLANN matching failed: {str(e)}")
-
-        # Apply Lowe's ratio test to filter good matches
-        good_matches = [
-            m for m, n in matches if m.distance < confidence_level * n.distance
-        ]
-
-        if len(good_matches) < min_inliers:
-            raise RuntimeError("Not enough good matches found.")
-
-        # Extract matched keypoints
-        src_pts = np.float32([kp_template[m.queryIdx].pt for m in good_matches]).reshape(-1, 1, 2)
-        dst_pts = np.float32([kp_frame[m.trainIdx].pt for m in good_matches]).reshape(-1, 1, 2)
-
-        # Compute homography matrix
-        M, mask = cv2.findHomography(src_pts, dst_pts, cv2.RANSAC, 5.0)
-        if M is None:
-            raise RuntimeError("Homography computation failed.")
-
-        matches_mask = mask.ravel().tolist()
-        inliers = np.sum(matches_mask)
-
-        if inliers < min_inliers:
-            raise RuntimeError("Not enough inliers found.")
+        template = self._template_features(reference_data)
+        M, _ = self._match_homography(
+            template, self.frame_features(input_data), confidence_level, min_inliers
+        )
 
         # Find center of the template in the frame
         h, w = reference_data.shape[:2]
@@ -0,0 +1,133 @@
+import base64
+import hashlib
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+import cv2
+import numpy as np
+from optics_framework.common import utils
+
+TRANSPORTS = ("json", "multipart")
+_MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg", "webp": "image/webp"}
+
+
+class EncodedImage(NamedTuple):
+    """
+    An image ready to send to a remote vision service.
+
+    ``scale`` is the factor applied before encoding (1.0 when the image was not
+    resized); coordinates returned by the service are divided by it.
+    """
+    data: bytes
+    encoding: str
+    scale: float = 1.0
+
+    @property
+    def mime_type(self) -> str:
+        return _MIME_TYPES.get(self.encoding, "application/octet-stream")
+
+    def content_hash(self) -> str:
+        """Hex digest of the encoded bytes; identifies an uploaded template on the service."""
+        return hashlib.blake2b(self.data, digest_size=16).hexdigest()
+
+
+class ImageTransport:
+    """
+    How frames and templates travel to remote OCR / OIR services.
+
+    Frames are optionally shrunk so their longest side is at most
+    ``max_dimension`` (the service's working resolution), then encoded as PNG
+    (with a fast zlib level by default), JPEG or WebP. With the ``json``
+    transport the bytes are base64-encoded into the JSON body as before; with
+    ``multipart`` they are sent as binary form parts, avoiding base64's 33%
+    size overhead (the service must accept ``multipart/form-data``).
+    """
+
+    def __init__(
+        self,
+        encoding: str = "png",
+        quality: int = 90,
+        png_compression: int = 1,
+        transport: str = "json",
+        max_dimension: Optional[int] = None,
+    ):
+        encoding = encoding.lower()
+        if encoding not in utils.IMAGE_ENCODINGS:
+            raise ValueError(
+                f"Unsupported image encoding '{encoding}'. Available: {', '.join(utils.IMAGE_ENCODINGS)}")
+        transport = transport.lower()
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unsupported image transport '{transport}'. Available: {', '.join(TRANSPORTS)}")
+        self.encoding = encoding
+        self.quality = int(quality)
+        self.png_compression = int(png_compression)
+        self.transport = transport
+        self.max_dimension = int(max_dimension) if max_dimension else None
+
+    @classmethod
+    def from_capabilities(cls, capabilities: Optional[Dict[str, Any]]) -> "ImageTransport":
+        """Build a transport from the ``image_encoding``, ``image_quality``, ``png_compression``,
+        ``transport`` and ``max_image_dimension`` capabilities."""
+        capabilities = capabilities or {}
+        return cls(
+            encoding=str(capabilities.get("image_encoding", "png")),
+            quality=int(capabilities.get("image_quality", 90)),
+            png_compression=int(capabilities.get("png_compression", 1)),
+            transport=str(capabilities.get("transport", "json")),
+            max_dimension=capabilities.get("max_image_dimension"),
+        )
+
+    def key(self) -> Tuple[Any, ...]:
+        """Settings that can change what the service sees (used in result cache keys)."""
+        quality = None if self.encoding == "png" else self.quality
+        return self.encoding, quality, self.max_dimension
+
+    def scale_for(self, image: np.ndarray) -> float:
+        """Downscale factor that fits ``image`` within ``max_dimension`` (1.0 if it already fits)."""
+        if not self.max_dimension:
+            return 1.0
+        longest = max(image.shape[:2])
+        return min(1.0, self.max_dimension / float(longest))
+
+    def encode(self, image: Union[np.ndarray, bytes, bytearray, str], scale: Optional[float] = None) -> EncodedImage:
+        """
+        Resize and encode an image; already-encoded bytes or base64 strings are passed through.
+
+        :param image: BGR frame, encoded image bytes or a base64 string.
+        :param scale: Factor to apply instead of the one derived from ``max_dimension``;
+            templates use the frame's factor so both keep the same pixel scale.
+        """
+        if isinstance(image, np.ndarray):
+            factor = self.scale_for(image) if scale is None else scale
+            if factor < 1.0:
+                h, w = image.shape[:2]
+                size = (max(1, int(round(w * factor))), max(1, int(round(h * factor))))
+                image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+            data = utils.encode_numpy_image(image, self.encoding, self.quality, self.png_compression)
+            return EncodedImage(data, self.encoding, factor)
+        if isinstance(image, (bytes, bytearray)):
+            return EncodedImage(bytes(image), "png")
+        if isinstance(image, str):
+            return EncodedImage(base64.b64decode(image), "png")
+        raise TypeError(f"Unsupported image type {type(image).__name__}")
+
+    def request_kwargs(self, fields: Dict[str, Any], images: Dict[str, EncodedImage]) -> Dict[str, Any]:
+        """
+        Keyword arguments for ``session.post`` carrying ``fields`` and ``images``.
+
+        :param fields: Plain request fields (method, language, ...); lists become
+            comma-separated form values in ``multipart`` mode.
+        :param images: Field name to encoded image, e.g. ``{"image": ..., "template": ...}``.
+        """
+        if self.transport == "multipart":
+            files = {
+                name: (f"{name}.{image.encoding}", image.data, image.mime_type)
+                for name, image in images.items()
+            }
+            data = {
+                k: ",".join(map(str, v)) if isinstance(v, (list, tuple)) else str(v)
+                for k, v in fields.items()
+            }
+            return {"data": data, "files": files}
+        payload = dict(fields)
+        for name, image in images.items():
+            payload[name] = base64.b64encode(image.data).decode("ascii")
+        return {"json": payload}
@@ -0,0 +1,124 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+from optics_framework.common.logging_config import internal_logger
+
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 1
+
+
+class SharedModel:
+    """
+    One loaded model shared by every engine instance with the same model key.
+
+    The model is loaded lazily by the first :meth:`run` (concurrent first
+    callers wait for a single load) and at most ``max_concurrency``
+    inferences run on it at once; further callers block until a slot frees.
+    """
+
+    def __init__(self, key: Hashable, loader: Callable[[], Any], max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.key = key
+        self.loader = loader
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.refs = 0
+        self.loads = 0
+        self._model: Any = None
+        self._load_lock = threading.Lock()
+        self._slots = threading.Condition()
+        self._active = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def get(self) -> Any:
+        """The loaded model, loading it on first use."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    internal_logger.debug(f"Loading shared model {self.key}")
+                    self._model = self.loader()
+                    self.loads += 1
+        return self._model
+
+    def run(self, infer: Callable[[Any], R]) -> R:
+        """Call ``infer(model)`` once a concurrency slot is free."""
+        model = self.get()
+        with self._slots:
+            while self._active >= self.max_concurrency:
+                self._slots.wait()
+            self._active += 1
+        try:
+            return infer(model)
+        finally:
+            with self._slots:
+                self._active -= 1
+                self._slots.notify()
+
+    def raise_concurrency(self, max_concurrency: int) -> None:
+        """Raise (never lower) the inference limit, e.g. when a later engine asks for more."""
+        with self._slots:
+            if max_concurrency > self.max_concurrency:
+                self.max_concurrency = int(max_concurrency)
+                self._slots.notify_all()
+
+    def unload(self) -> None:
+        with self._load_lock:
+            self._model = None
+
+
+class ModelRegistry:
+    """
+    Process-wide, reference-counted registry of loaded models.
+
+    Engines :meth:`acquire` a :class:`SharedModel` by key (engine name plus
+    every setting that changes the weights, such as the language) instead
+    of loading their own copy, and :meth:`release` it when they are
+    discarded. The model is unloaded once the last reference is released,
+    so memory follows the number of distinct models in use rather than the
+    number of sessions.
+    """
+
+    def __init__(self):
+        self._models: Dict[Hashable, SharedModel] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, key: Hashable, loader: Callable[[], Any], max_concurrency: Optional[int] = None
+    ) -> SharedModel:
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = SharedModel(key, loader, max_concurrency or DEFAULT_MAX_CONCURRENCY)
+                self._models[key] = model
+            elif max_concurrency is not None:
+                model.raise_concurrency(max_concurrency)
+            model.refs += 1
+            return model
+
+    def release(self, model: SharedModel) -> None:
+        with self._lock:
+            model.refs -= 1
+            if model.refs > 0:
+                return
+            if self._models.get(model.key) is model:
+                del self._models[model.key]
+        if model.loaded:
+            internal_logger.debug(f"Unloading shared model {model.key}")
+        model.unload()
+
+    def find(self, key: Hashable) -> Optional[SharedModel]:
+        with self._lock:
+            return self._models.get(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
+
+
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the registry shared by every OCR engine in the process."""
+    return _registry
@@ -0,0 +1,169 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import numpy as np
+from optics_framework.common.logging_config import internal_logger
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def frame_fingerprint(input_data: Any) -> str:
+    """
+    Content fingerprint of an OCR input (numpy frame, encoded bytes or base64 string).
+
+    Arrays are hashed straight from their buffer together with shape and dtype,
+    so two frames share a fingerprint only if they are pixel-identical.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(input_data, np.ndarray):
+        hasher.update(f"{input_data.shape}|{input_data.dtype}".encode("utf-8"))
+        hasher.update(np.ascontiguousarray(input_data).data)
+    elif isinstance(input_data, (bytes, bytearray, memoryview)):
+        hasher.update(input_data)
+    elif isinstance(input_data, str):
+        hasher.update(input_data.encode("utf-8"))
+    else:
+        raise TypeError(f"Cannot fingerprint OCR input of type {type(input_data).__name__}")
+    return hasher.hexdigest()
+
+
+def _estimate_size(value: Any) -> int:
+    """Rough memory footprint of an OCR result, used for the byte budget."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return 64 + sum(_estimate_size(item) for item in value)
+    return 32
+
+
+class OCRResultCache:
+    """
+    Process-wide LRU cache of ``detect_text`` results.
+
+    Entries are keyed by the frame fingerprint plus an engine key that carries
+    the engine name and every setting that changes its output (language, OCR
+    method, tesseract flags, service URL), so an unchanged screen is read once
+    per engine configuration no matter which keyword or strategy asks. The cache
+    is bounded both by ``max_entries`` and by the estimated size of the stored
+    results (``max_bytes``). Failed detections are never cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _store(self, key: tuple, result: Any) -> None:
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    @staticmethod
+    def _copy(result: Any) -> Any:
+        # Hand out a fresh results list so callers filtering or sorting it in
+        # place cannot corrupt the cached entry.
+        if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], list):
+            return result[0], list(result[1])
+        return result
+
+    def get_or_compute(self, input_data: Any, engine_key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for ``input_data`` under ``engine_key`` or run ``compute``.
+
+        :param input_data: The frame passed to ``detect_text``; fingerprinted before OCR runs.
+        :param engine_key: Engine name followed by the settings that affect its output.
+        :param compute: Zero-argument callable performing the actual OCR.
+        """
+        try:
+            key = (frame_fingerprint(input_data),) + tuple(engine_key)
+        except TypeError as e:
+            internal_logger.debug(f"OCR result cache bypassed: {e}")
+            return compute()
+
+        cached = self._lookup(key)
+        if cached is not None:
+            internal_logger.debug(f"OCR result cache hit for {engine_key[0]} ({key[0][:12]})")
+            return self._copy(cached)
+
+        result = compute()
+        if result is not None:
+            self._store(key, result)
+        return self._copy(result)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache: Optional[OCRResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> OCRResultCache:
+    """Return the process-wide OCR result cache shared by every text detection engine."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = OCRResultCache()
+        return _cache
+
+
+def ocr_cache_from_capabilities(capabilities: Optional[Dict[str, Any]]) -> Optional[OCRResultCache]:
+    """
+    Resolve the cache an OCR engine should use from its ``capabilities``.
+
+    ``result_cache: false`` disables caching for that engine; ``result_cache_entries``
+    and ``result_cache_max_mb`` raise (never lower) the shared cache bounds.
+    """
+    capabilities = capabilities or {}
+    if capabilities.get("result_cache", True) is False:
+        return None
+    cache = get_ocr_cache()
+    entries = capabilities.get("result_cache_entries")
+    max_mb = capabilities.get("result_cache_max_mb")
+    with cache._lock:
+        if entries is not None:
+            cache.max_entries = max(cache.max_entries, int(entries))
+        if max_mb is not None:
+            cache.max_bytes = max(cache.max_bytes, int(float(max_mb) * 1024 * 1024))
+    return cache
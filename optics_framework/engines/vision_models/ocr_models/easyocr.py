@@ -1,9 +1,20 @@
+import threading
 from typing import List, Tuple, Optional
 import easyocr
 import cv2
 from optics_framework.common.text_interface import TextInterface
 from optics_framework.common import utils
 from optics_framework.common.logging_config import internal_logger
+from optics_framework.engines.vision_models.ocr_cache import ocr_cache_from_capabilities
+from optics_framework.engines.vision_models.model_registry import get_model_registry
+
+
+def _load_reader(language: str):
+    try:
+        return easyocr.Reader([language])
+    except Exception as e:
+        internal_logger.error(f"Failed to initialize EasyOCR: {e}")
+        raise RuntimeError("EasyOCR initialization failed.") from e
 
 
 class EasyOCRHelper(TextInterface):
@@ -11,28 +22,45 @@ class EasyOCRHelper(TextInterface):
     Helper class for Optical Character Recognition (OCR) using EasyOCR.
 
     This class uses EasyOCR to detect text in images and optionally locate
-    specific reference text.
+    specific reference text. The ``easyocr.Reader`` is taken from the
+    process-wide model registry, so every helper with the same language shares
+    one copy of the weights; it is loaded on the first detection. :meth:`close`
+    releases the helper's reference, and the last release unloads the reader.
     """
 
     def __init__(self, config=None):
         """
-        Initializes the EasyOCR reader.
+        Initializes the EasyOCR helper.
 
         :param config: Configuration dict containing language and execution_output_path.
+            ``capabilities.max_concurrent_inference`` limits how many detections run on
+            the shared reader at once (default 1).
         :type config: dict
-
-        :raises RuntimeError: If EasyOCR fails to initialize.
         """
         # Extract parameters from config or use defaults
         language = config.get("language", "en") if config else "en"
+        self.language = language
         self.execution_output_dir = config.get("execution_output_path", "") if config else ""
-
-        try:
-            self.reader = easyocr.Reader([language])
-            # internal_logger.debug(f"EasyOCR initialized with language: {language}")
-        except Exception as e:
-            internal_logger.error(f"Failed to initialize EasyOCR: {e}")
-            raise RuntimeError("EasyOCR initialization failed.") from e
+        capabilities = (config.get("capabilities") if config else None) or {}
+        self.result_cache = ocr_cache_from_capabilities(capabilities)
+
+        self.model = get_model_registry().acquire(
+            ("easyocr", language), lambda: _load_reader(language), capabilities.get("max_concurrent_inference"))
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Release this helper's reference to the shared reader; safe to call more than once."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        get_model_registry().release(self.model)
+
+    @property
+    def reader(self):
+        """The shared ``easyocr.Reader``, loaded on first use."""
+        return self.model.get()
 
     def find_element(
         self, input_data, text, index=None
@@ -107,11 +135,20 @@ class EasyOCRHelper(TextInterface):
         """
         Detects text in the given image using EasyOCR.
 
+        Results are served from the shared OCR result cache when the same frame
+        was already read with the same language.
+
         :param input_data: Image data (numpy array).
         :return: List of tuples (bounding box, text, confidence) or None.
         """
+        if self.result_cache is None:
+            return self._detect_text(input_data)
+        return self.result_cache.get_or_compute(
+            input_data, ("easyocr", self.language), lambda: self._detect_text(input_data))
+
+    def _detect_text(self, input_data) -> Optional[Tuple[str, List[Tuple[List[List[int]], str, float]]]]:
         gray_image = cv2.cvtColor(input_data, cv2.COLOR_BGR2GRAY)
-        raw_results = self.reader.readtext(gray_image)
+        raw_results = self.model.run(lambda reader: reader.readtext(gray_image))
         if not raw_results:
             raise ValueError("No text detected")
         # Ensure results are List[Tuple[List[List[int]], str, float]]
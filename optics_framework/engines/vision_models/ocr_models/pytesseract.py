@@ -1,6 +1,7 @@
 from optics_framework.common.text_interface import TextInterface
 from optics_framework.common import utils
 from optics_framework.common.logging_config import internal_logger
+from optics_framework.engines.vision_models.ocr_cache import ocr_cache_from_capabilities
 import pytesseract
 import cv2
 
@@ -26,6 +27,7 @@ class PytesseractHelper(TextInterface):
         self.execution_output_dir = config.get("execution_output_path", "") if config else ""
 
         self.pytesseract_config = "--oem 3 --psm 6"
+        self.result_cache = ocr_cache_from_capabilities(config.get("capabilities") if config else None)
         # internal_logger.debug(f"Pytesseract initialized with config: {self.pytesseract_config}")
 
 
@@ -75,6 +77,13 @@ class PytesseractHelper(TextInterface):
         return True, selected_center, selected_bbox
 
     def detect_text(self, image):
+        """Run Tesseract on a BGR frame, reusing the shared OCR result cache for identical frames."""
+        if self.result_cache is None:
+            return self._detect_text(image)
+        return self.result_cache.get_or_compute(
+            image, ("pytesseract", self.pytesseract_config), lambda: self._detect_text(image))
+
+    def _detect_text(self, image):
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         _, binary_image = cv2.threshold(image, 150, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         data = pytesseract.image_to_data(binary_image, config=self.pytesseract_config, output_type=pytesseract.Output.DICT)
@@ -8,6 +8,9 @@ from optics_framework.common.text_interface import TextInterface
 from optics_framework.common import utils
 from optics_framework.common.config_handler import Config
 from optics_framework.common.logging_config import internal_logger
+from optics_framework.engines.vision_models.ocr_cache import ocr_cache_from_capabilities
+from optics_framework.engines.vision_models.http_client import DEFAULT_POOL_SIZE, get_http_client
+from optics_framework.engines.vision_models.image_transport import EncodedImage, ImageTransport
 
 
 class RemoteOCR(TextInterface):
@@ -37,6 +40,9 @@ class RemoteOCR(TextInterface):
         self.timeout: int = int(self.capabilities.get("timeout", 30))
         self.method: str = str(self.capabilities.get("method", "easyocr"))
         self.language: str = str(self.capabilities.get("language", "en"))
+        self.result_cache = ocr_cache_from_capabilities(self.capabilities)
+        self.http = get_http_client(int(self.capabilities.get("pool_size", DEFAULT_POOL_SIZE)))
+        self.transport = ImageTransport.from_capabilities(self.capabilities)
 
     def detect_text(self, input_data: Union[str, "np.ndarray"]) -> Optional[Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]]:
         """
@@ -47,22 +53,33 @@ class RemoteOCR(TextInterface):
 
         Returns:
             Optional[Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]]: Detected text and bounding boxes.
+
+        Identical images sent to the same service, method and language are answered
+        from the shared OCR result cache without another request.
         """
+        if self.result_cache is None:
+            return self._detect_text(input_data)
+        return self.result_cache.get_or_compute(
+            input_data,
+            (self.NAME, self.ocr_url, self.method, self.language) + self.transport.key(),
+            lambda: self._detect_text(input_data),
+        )
+
+    def _detect_text(self, input_data: Union[str, "np.ndarray"]) -> Optional[Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]]:
         try:
-            image_b64 = self._encode_image(input_data)
-            payload = {
+            image = self._encode_image(input_data)
+            fields = {
                 "method": self.method,
-                "image": image_b64,
                 "language": self.language
             }
-            response = requests.post(
+            response = self.http.post(
                 f"{self.ocr_url}/detect-text",
-                json=payload,
-                timeout=self.timeout
+                timeout=self.timeout,
+                **self.transport.request_kwargs(fields, {"image": image})
             )
             response.raise_for_status()
             result = response.json()
-            detected_text, formatted_results = self._parse_ocr_results(result)
+            detected_text, formatted_results = self._parse_ocr_results(result, image.scale)
             return detected_text, formatted_results
         except requests.exceptions.RequestException as e:
             internal_logger.error(f"Failed to detect text via API: {str(e)}")
@@ -77,22 +94,19 @@ class RemoteOCR(TextInterface):
             raise RuntimeError(
                 "Unexpected error occurred during text detection") from e
 
-    def _encode_image(self, input_data: Union[str, "np.ndarray"]) -> str:
-        """Helper to encode image input to base64 string."""
-        if np is not None and isinstance(input_data, np.ndarray):
-            success, enc = cv2.imencode('.png', input_data)
-            if not success:
-                raise RuntimeError("Failed to encode numpy image to PNG")
-            return base64.b64encode(enc.tobytes()).decode()
-        elif isinstance(input_data, (bytes, bytearray)):
-            return base64.b64encode(bytes(input_data)).decode()
-        elif isinstance(input_data, str):
-            return input_data
-        else:
-            raise TypeError("Unsupported input_data type for detect_text")
+    def _encode_image(self, input_data: Union[str, "np.ndarray"]) -> EncodedImage:
+        """Helper to resize and encode image input with the configured transport."""
+        try:
+            return self.transport.encode(input_data)
+        except TypeError as e:
+            raise TypeError("Unsupported input_data type for detect_text") from e
+
+    def _parse_ocr_results(self, result: Dict[str, Any], scale: float = 1.0) -> Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]:
+        """Helper to parse OCR API results into expected format.
 
-    def _parse_ocr_results(self, result: Dict[str, Any]) -> Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]:
-        """Helper to parse OCR API results into expected format."""
+        ``scale`` is the factor the image was resized by before upload; points are
+        mapped back to the original frame's coordinates.
+        """
         formatted_results: List[Tuple[List[Tuple[int, int]], str, float]] = []
         texts: List[str] = []
         for item in result.get("results", []):
@@ -105,8 +119,8 @@ class RemoteOCR(TextInterface):
                 clean_bbox: List[Tuple[int, int]] = []
                 for pt in bbox:
                     try:
-                        x = int(float(pt[0]))
-                        y = int(float(pt[1]))
+                        x = int(float(pt[0]) / scale)
+                        y = int(float(pt[1]) / scale)
                         clean_bbox.append((x, y))
                     except (TypeError, ValueError, IndexError) as ex:
                         internal_logger.debug("Skipping malformed bbox point %r: %s", pt, ex)
@@ -0,0 +1,246 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+import cv2
+import numpy as np
+from optics_framework.common.logging_config import internal_logger
+
+# Defaults of cv2.SIFT_create(); part of every cache key so that changing a
+# detector parameter never serves descriptors computed with another setting.
+DEFAULT_SIFT_PARAMS: Dict[str, float] = {
+    "nfeatures": 0,
+    "nOctaveLayers": 3,
+    "contrastThreshold": 0.04,
+    "edgeThreshold": 10,
+    "sigma": 1.6,
+}
+
+
+class TemplateFeatures(NamedTuple):
+    """SIFT features of a template image plus the image shape needed for homography."""
+    shape: Tuple[int, ...]
+    keypoints: Tuple[cv2.KeyPoint, ...]
+    descriptors: Optional[np.ndarray]
+
+
+def create_sift(sift_params: Optional[Dict[str, float]] = None):
+    """Create a SIFT detector from a parameter dict (missing keys use OpenCV defaults)."""
+    params = dict(DEFAULT_SIFT_PARAMS)
+    if sift_params:
+        params.update(sift_params)
+    return cv2.SIFT_create(
+        nfeatures=int(params["nfeatures"]),
+        nOctaveLayers=int(params["nOctaveLayers"]),
+        contrastThreshold=float(params["contrastThreshold"]),
+        edgeThreshold=float(params["edgeThreshold"]),
+        sigma=float(params["sigma"]),
+    )
+
+
+def compute_features(image: np.ndarray, sift) -> TemplateFeatures:
+    """Run SIFT on a BGR (or already grayscale) image."""
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    keypoints, descriptors = sift.detectAndCompute(gray, None)
+    return TemplateFeatures(tuple(image.shape), tuple(keypoints), descriptors)
+
+
+def _keypoints_to_array(keypoints) -> np.ndarray:
+    return np.array(
+        [(kp.pt[0], kp.pt[1], kp.size, kp.angle, kp.response, kp.octave, kp.class_id) for kp in keypoints],
+        dtype=np.float64,
+    ).reshape(-1, 7)
+
+
+def _array_to_keypoints(arr: np.ndarray) -> Tuple[cv2.KeyPoint, ...]:
+    return tuple(
+        cv2.KeyPoint(x=float(x), y=float(y), size=float(size), angle=float(angle),
+                     response=float(response), octave=int(octave), class_id=int(class_id))
+        for x, y, size, angle, response, octave, class_id in arr
+    )
+
+
+class TemplateDescriptorCache:
+    """
+    Process-wide cache of SIFT template features.
+
+    Entries are keyed by the template's absolute path, its modification time and
+    size, and the SIFT parameters, so an edited template or a different detector
+    configuration is recomputed automatically. Features are held in memory (LRU,
+    bounded by ``max_entries``) and, when ``cache_dir`` is set, also persisted as
+    ``.npz`` files so later processes skip ``cv2.imread`` and ``detectAndCompute``.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 512):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, TemplateFeatures]" = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _params_key(sift_params: Optional[Dict[str, float]]) -> tuple:
+        params = dict(DEFAULT_SIFT_PARAMS)
+        if sift_params:
+            params.update(sift_params)
+        return tuple(sorted(params.items()))
+
+    def _make_key(self, template_path: str, sift_params: Optional[Dict[str, float]]) -> tuple:
+        abs_path = os.path.abspath(template_path)
+        stat = os.stat(abs_path)
+        return (abs_path, stat.st_mtime_ns, stat.st_size, self._params_key(sift_params))
+
+    def _lookup(self, key: tuple) -> Optional[TemplateFeatures]:
+        with self._lock:
+            features = self._entries.get(key)
+            if features is not None:
+                self._entries.move_to_end(key)
+            return features
+
+    def _store(self, key: tuple, features: TemplateFeatures) -> None:
+        with self._lock:
+            self._entries[key] = features
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _disk_path(self, key: tuple) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(repr(key).encode("utf-8"), usedforsecurity=False).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npz")
+
+    def _load_from_disk(self, key: tuple) -> Optional[TemplateFeatures]:
+        path = self._disk_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                descriptors = data["descriptors"] if data["has_descriptors"] else None
+                return TemplateFeatures(
+                    tuple(int(v) for v in data["shape"]),
+                    _array_to_keypoints(data["keypoints"]),
+                    descriptors,
+                )
+        except (OSError, ValueError, KeyError) as e:
+            internal_logger.debug(f"Ignoring unreadable template descriptor cache file {path}: {e}")
+            return None
+
+    def _save_to_disk(self, key: tuple, features: TemplateFeatures) -> None:
+        path = self._disk_path(key)
+        if not path:
+            return
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    shape=np.array(features.shape, dtype=np.int64),
+                    keypoints=_keypoints_to_array(features.keypoints),
+                    descriptors=features.descriptors if features.descriptors is not None else np.empty((0, 128), np.float32),
+                    has_descriptors=np.array(features.descriptors is not None),
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            internal_logger.debug(f"Failed to persist template descriptors to {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, template_path: str, sift, sift_params: Optional[Dict[str, float]] = None) -> TemplateFeatures:
+        """
+        Return the SIFT features for a template file, computing them at most once.
+
+        :param template_path: Path of the template image on disk.
+        :param sift: SIFT detector built with ``sift_params``.
+        :param sift_params: Parameters used to build ``sift``; part of the cache key.
+        :raises ValueError: If the template cannot be read.
+        """
+        try:
+            key = self._make_key(template_path, sift_params)
+        except OSError as e:
+            raise ValueError(f"Failed to load template from path: {template_path}") from e
+
+        features = self._lookup(key)
+        if features is not None:
+            return features
+
+        features = self._load_from_disk(key)
+        if features is None:
+            image = cv2.imread(template_path)
+            if image is None:
+                raise ValueError(f"Failed to load template from path: {template_path}")
+            features = compute_features(image, sift)
+            self._save_to_disk(key, features)
+            internal_logger.debug(f"Computed SIFT descriptors for template {template_path}")
+        self._store(key, features)
+        return features
+
+    def get_for_image(self, image: np.ndarray, sift, sift_params: Optional[Dict[str, float]] = None) -> TemplateFeatures:
+        """Return SIFT features for an in-memory template, keyed by its pixel content."""
+        digest = hashlib.blake2b(np.ascontiguousarray(image).tobytes(), digest_size=16).hexdigest()
+        key = ("<array>", digest, tuple(image.shape), self._params_key(sift_params))
+        features = self._lookup(key)
+        if features is None:
+            features = compute_features(image, sift)
+            self._store(key, features)
+        return features
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the on-disk store is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_caches: Dict[Optional[str], TemplateDescriptorCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_template_cache(cache_dir: Optional[str] = None) -> TemplateDescriptorCache:
+    """Return the process-wide cache for ``cache_dir`` (``None`` means memory only)."""
+    key = os.path.abspath(cache_dir) if cache_dir else None
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = TemplateDescriptorCache(cache_dir=key)
+            _caches[key] = cache
+        return cache
+
+
+class FrameFeatures:
+    """
+    SIFT features of one screenshot, shared by every template matched against it.
+
+    Keypoints and descriptors are extracted once on construction. The FLANN
+    index over the frame descriptors is built lazily on the first match and then
+    queried by each template, so asserting N templates costs one SIFT pass and
+    one index build instead of N of each.
+    """
+
+    def __init__(self, frame: np.ndarray, sift, index_params: dict, search_params: dict):
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self.shape = tuple(frame.shape)
+        self.keypoints, self.descriptors = sift.detectAndCompute(gray, None)
+        self._index_params = index_params
+        self._search_params = search_params
+        self._matcher = None
+        self._lock = threading.Lock()
+
+    def knn_match(self, query_descriptors: np.ndarray, k: int = 2):
+        """Match template descriptors against the frame's trained FLANN index."""
+        if self.descriptors is None:
+            raise ValueError("Frame has no SIFT descriptors.")
+        with self._lock:
+            if self._matcher is None:
+                matcher = cv2.FlannBasedMatcher(self._index_params, self._search_params)
+                matcher.add([self.descriptors])
+                matcher.train()
+                self._matcher = matcher
+            return self._matcher.knnMatch(query_descriptors, k=k)
@@ -112,6 +112,7 @@ class ServerArgs(BaseModel):
     host: str = "127.0.0.1"
     port: int = 8000
     workers: int = 1
+    session_pool_size: Optional[int] = None
 
 class ServerCommand(Command):
     def register(self, subparsers: argparse._SubParsersAction):
@@ -127,18 +128,24 @@ class ServerCommand(Command):
         parser.add_argument(
             "--workers", type=int, default=1, help="Number of worker processes (default: 1)"
         )
+        parser.add_argument(
+            "--session-pool-size", type=int, default=None,
+            help="Idle OCR engines / LLM clients kept per engine config for new sessions (default: 2, 0 disables)"
+        )
         parser.set_defaults(func=self.execute)
 
     def execute(self, args):
         server_args = ServerArgs(
             host=args.host,
             port=args.port,
-            workers=args.workers
+            workers=args.workers,
+            session_pool_size=args.session_pool_size
         )
         run_uvicorn_server(
             host=server_args.host,
             port=server_args.port,
-            workers=server_args.workers
+            workers=server_args.workers,
+            session_pool_size=server_args.session_pool_size
         )
 
 class ConfigCommand(Command):
@@ -4,7 +4,6 @@ import asyncio
 from typing import Optional, Tuple, List, Dict, Set, Any
 import yaml
 from pydantic import BaseModel, field_validator
-from pathlib import Path
 from optics_framework.common.config_handler import Config
 from optics_framework.common.logging_config import internal_logger, initialize_handlers
 from optics_framework.common.runner.data_reader import (
@@ -13,8 +12,10 @@ from optics_framework.common.runner.data_reader import (
     merge_dicts,
 )
 from optics_framework.common.session_manager import SessionManager
+from optics_framework.common.template_index import get_template_index
 from optics_framework.common.error import OpticsError, Code
 from optics_framework.common.execution import ExecutionEngine, ExecutionParams
+from optics_framework.common.runner.scheduler import device_config
 from optics_framework.common.models import (
     TestCaseNode,
     ModuleNode,
@@ -37,17 +38,9 @@ def discover_templates(project_path: str) -> TemplateData:
     :return: TemplateData containing image name to path mappings.
     :rtype: TemplateData
     """
-    template_data = TemplateData()
-    project_dir = Path(project_path)
-
-    # Common image extensions
-    image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'}
-
-    # Recursively find all image files
-    for image_file in project_dir.rglob('*'):
-        if image_file.is_file() and image_file.suffix.lower() in image_extensions:
-            template_data.add_template(image_file.name, str(image_file))
-    return template_data
+    # The process-wide index walks the tree once and afterwards only rescans
+    # directories whose mtime changed
+    return TemplateData(templates=get_template_index(project_path).templates())
 
 
 def find_files(folder_path: str) -> tuple[list[Any], list[Any], list[Any], list[Any], Config | None]:
@@ -604,15 +597,36 @@ class BaseRunner:
 
     def _setup_session(self):
         self.manager: SessionManager = SessionManager()
-        self.session_id: str = self.manager.create_session(
-            self.config,
-            self.execution_queue,
-            self.modules_data,
-            self.elements_data,
-            self.api_data,
-            self.templates_data,
-        )
+        self.device_sessions: Dict[str, str] = {}
+        devices = self.config.get("devices") or []
+        if not devices:
+            self.session_id: str = self.manager.create_session(
+                self.config,
+                self.execution_queue,
+                self.modules_data,
+                self.elements_data,
+                self.api_data,
+                self.templates_data,
+            )
+        else:
+            # One session per device; the first one carries the run's events and JUnit output.
+            # Each gets its own copy of the element and API data, since runtime
+            # variables are written into them while its test cases run.
+            for index, device in enumerate(devices):
+                config = device_config(self.config, device, primary=index == 0)
+                if device["name"] in self.device_sessions:
+                    raise OpticsError(Code.E0501, message=f"Duplicate device name: {device['name']}")
+                self.device_sessions[device["name"]] = self.manager.create_session(
+                    config,
+                    self.execution_queue,
+                    self.modules_data,
+                    self.elements_data.model_copy(deep=True),
+                    self.api_data.model_copy(deep=True),
+                    self.templates_data,
+                )
+            self.session_id = next(iter(self.device_sessions.values()))
         self.engine: ExecutionEngine = ExecutionEngine(self.manager)
+
     async def run(self, mode: str):
         """Run the specified mode using ExecutionEngine."""
         try:
@@ -621,6 +635,7 @@ class BaseRunner:
                 mode=mode,
                 runner_type=self.runner,
                 use_printer=self.use_printer,
+                device_sessions=self.device_sessions,
             )
             internal_logger.debug(
                 f"Executing with runner_type: {self.runner}, use_printer: {self.use_printer}"
@@ -634,10 +649,11 @@ class BaseRunner:
 
     def cleanup(self):
         """Clean up session resources."""
-        try:
-            self.manager.terminate_session(self.session_id)
-        except Exception as e:
-            internal_logger.error(f"Failed to terminate session {self.session_id}: {e}")
+        for session_id in list(self.device_sessions.values()) or [self.session_id]:
+            try:
+                self.manager.terminate_session(session_id)
+            except Exception as e:
+                internal_logger.error(f"Failed to terminate session {session_id}: {e}")
 
 
 class ExecuteRunner(BaseRunner):
@@ -1,4 +1,6 @@
 import logging
+import os
+from typing import Optional
 import uvicorn
 
 from optics_framework.common.logging_config import internal_logger
@@ -55,7 +57,9 @@ def _apply_optics_logging_to_uvicorn() -> None:
             print("Error applying optics logging to uvicorn, and internal_logger is unavailable.")
 
 
-def run_uvicorn_server(host: str = "127.0.0.1", port: int = 8000, workers: int = 1):
+def run_uvicorn_server(
+    host: str = "127.0.0.1", port: int = 8000, workers: int = 1, session_pool_size: Optional[int] = None
+):
     """
     Run the Optics Framework API server using uvicorn.
 
@@ -63,7 +67,12 @@ def run_uvicorn_server(host: str = "127.0.0.1", port: int = 8000, workers: int =
         host (str, optional): Host address. Defaults to "127.0.0.1".
         port (int, optional): Port number. Defaults to 8000.
         workers (int, optional): Number of worker processes. Defaults to 1.
+        session_pool_size (int, optional): Idle OCR engines / LLM clients kept per
+            engine config for new sessions. Defaults to OPTICS_SESSION_POOL_SIZE or 2.
     """
+    if session_pool_size is not None:
+        # Passed through the environment so that every worker process sees it
+        os.environ["OPTICS_SESSION_POOL_SIZE"] = str(session_pool_size)
     # Apply Optics logging handlers to uvicorn so access/error logs match
     _apply_optics_logging_to_uvicorn()
 
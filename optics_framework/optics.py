@@ -15,7 +15,6 @@ from functools import wraps
 import inspect
 import json
 import os
-from pathlib import Path
 from itertools import product
 import yaml
 from optics_framework.common.logging_config import internal_logger
@@ -26,6 +25,7 @@ from optics_framework.common.config_handler import (
     Config,
 )
 from optics_framework.common.session_manager import SessionManager
+from optics_framework.common.template_index import get_template_index
 from optics_framework.api.app_management import AppManagement
 from optics_framework.api.action_keyword import ActionKeyword
 from optics_framework.api.verifier import Verifier
@@ -339,17 +339,7 @@ class Optics:
         :return: TemplateData containing image name to path mappings.
         :rtype: TemplateData
         """
-        project_dir = Path(project_path)
-        template_data = TemplateData()
-
-        # Common image extensions
-        image_extensions = {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif"}
-
-        # Recursively find all image files
-        for image_file in project_dir.rglob("*"):
-            if image_file.is_file() and image_file.suffix.lower() in image_extensions:
-                template_data.add_template(image_file.name, str(image_file))
-        return template_data
+        return TemplateData(templates=get_template_index(project_path).templates())
 
     def _initialize_session_and_keywords(self) -> None:
         """
@@ -1058,6 +1048,13 @@ class Optics:
             raise ValueError(INVALID_SETUP)
         return self.flow_control.invoke_api(cast(str, api))
 
+    @keyword("Invoke APIs")
+    def invoke_apis(self, *apis: str) -> Any:
+        """Invoke several REST API endpoints, in parallel where they do not depend on each other."""
+        if not self.flow_control:
+            raise ValueError(INVALID_SETUP)
+        return self.flow_control.invoke_apis(*apis)
+
     @keyword("Read Data")
     @fallback_params
     def read_data(
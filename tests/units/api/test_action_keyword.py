@@ -6,6 +6,7 @@ from optics_framework.common.error import OpticsError, Code
 
 from optics_framework.api.action_keyword import ActionKeyword
 from optics_framework.common.optics_builder import OpticsBuilder
+from optics_framework.common.screenshot_stream import ScreenshotCaptureService
 from optics_framework.common.strategies import LocateResult
 
 class MockOpticsBuilder(OpticsBuilder):
@@ -34,6 +35,9 @@ class MockOpticsBuilder(OpticsBuilder):
     def get_image_detection(self):
         return self.mock_image_detection
 
+    def get_screenshot_service(self):
+        return ScreenshotCaptureService()
+
     @property
     def event_sdk(self):
         return MagicMock()
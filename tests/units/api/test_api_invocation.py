@@ -1,4 +1,5 @@
 import pytest
+import requests
 from optics_framework.api.flow_control import FlowControl
 from optics_framework.common.models import ApiData, ApiCollection, ApiDefinition, RequestDefinition, ExpectedResultDefinition
 from optics_framework.common.error import OpticsError
@@ -52,6 +53,8 @@ def live_servers():
 def flow_control(mock_runner, api_test_data):
     mock_runner.apis = api_test_data
     mock_runner.modules = {}
+    http_session = requests.Session()
+    mock_runner.get_http_session = lambda: http_session
     keyword_map = {}
     flow_control = FlowControl(mock_runner, keyword_map)
     flow_control.session = mock_runner
@@ -1,5 +1,6 @@
 import json
 import pytest
+import requests
 from unittest.mock import MagicMock
 from optics_framework.api.flow_control import FlowControl
 from optics_framework.common.models import ElementData, ApiData
@@ -28,6 +29,10 @@ class DummySession:
         self.apis.collections = {}
 
         self.config_handler = MagicMock() # Add config_handler attribute
+        self.http_session = requests.Session()
+
+    def get_http_session(self):
+        return self.http_session
 
 # ---- Fixtures ----
 @pytest.fixture
@@ -150,7 +155,7 @@ def test_invoke_api_extract(monkeypatch, flow_control):
                 def total_seconds(self):
                     return 0.01
             return E()
-    monkeypatch.setattr('requests.request', lambda *a, **kw: DummyResp())
+    monkeypatch.setattr('requests.Session.request', lambda *a, **kw: DummyResp())
     flow_control.invoke_api('testcol.bar')
     assert flow_control.session.elements.get_first('result') == '42'
 
@@ -173,7 +178,7 @@ def test_invoke_api_jsonpath_assertion_pass(monkeypatch, flow_control):
                 def total_seconds(self):
                     return 0.01
             return E()
-    monkeypatch.setattr('requests.request', lambda *a, **kw: DummyResp())
+    monkeypatch.setattr('requests.Session.request', lambda *a, **kw: DummyResp())
     flow_control.invoke_api('testcol.bar')
     assert flow_control.session.elements.get_first('result') == '42'
 
@@ -196,7 +201,7 @@ def test_invoke_api_jsonpath_assertion_fail(monkeypatch, flow_control):
                 def total_seconds(self):
                     return 0.01
             return E()
-    monkeypatch.setattr('requests.request', lambda *a, **kw: DummyResp())
+    monkeypatch.setattr('requests.Session.request', lambda *a, **kw: DummyResp())
     with pytest.raises(AssertionError):
         flow_control.invoke_api('testcol.bar')
 
@@ -218,7 +223,7 @@ def test_invoke_api_no_extract(monkeypatch, flow_control):
                 def total_seconds(self):
                     return 0.01
             return E()
-    monkeypatch.setattr('requests.request', lambda *a, **kw: DummyResp())
+    monkeypatch.setattr('requests.Session.request', lambda *a, **kw: DummyResp())
     flow_control.invoke_api('testcol.bar')
     # Should not raise, nothing extracted
 
@@ -240,7 +245,7 @@ def test_invoke_api_non_json_response(monkeypatch, flow_control):
                 def total_seconds(self):
                     return 0.01
             return E()
-    monkeypatch.setattr('requests.request', lambda *a, **kw: DummyResp())
+    monkeypatch.setattr('requests.Session.request', lambda *a, **kw: DummyResp())
     with pytest.raises(OpticsError) as excinfo:
         flow_control.invoke_api('testcol.bar')
     assert "API response is not valid JSON" in str(excinfo.value)
@@ -390,3 +395,86 @@ def test_run_loop_invalid_args(flow_control):
         flow_control.run_loop('mod', '${foo}', '[1,2]', '${bar}')
     with pytest.raises(OpticsError):
         flow_control.run_loop('mod', '${foo}', 'notalist')
+
+
+# ---- invoke_apis Tests ----
+def _json_response(payload):
+    class Resp:
+        status_code = 200
+        reason = 'OK'
+        headers = {'Content-Type': 'application/json'}
+        content = json.dumps(payload).encode()
+        text = json.dumps(payload)
+
+        def json(self):
+            return payload
+
+        @property
+        def elapsed(self):
+            class E:
+                def total_seconds(self):
+                    return 0.01
+            return E()
+    return Resp()
+
+
+def _batch_collection(flow_control, output_dir=None):
+    if output_dir is not None:
+        flow_control.config_handler.config.execution_output_path = str(output_dir)
+    apis = {
+        'token': DummyApiDef(endpoint='/token', method='POST', extract={'tok': 'token'}),
+        'alice': DummyApiDef(endpoint='/users', method='POST', headers={'Authorization': '${tok}'}, body={'name': 'alice'}),
+        'bob': DummyApiDef(endpoint='/users', method='POST', headers={'Authorization': '${tok}'}, body={'name': 'bob'}),
+        'health': DummyApiDef(endpoint='/health'),
+    }
+    flow_control.session.apis.collections['seed'] = DummyApiCollection('seed', 'http://dummy', apis)
+
+
+def test_invoke_apis_plans_waves_from_extract_dependencies(flow_control):
+    _batch_collection(flow_control)
+    definitions = {
+        i: (flow_control.session.apis.collections['seed'], flow_control.session.apis.collections['seed'].apis[i.split('.')[1]])
+        for i in ['seed.alice', 'seed.token', 'seed.health', 'seed.bob']
+    }
+    assert flow_control._plan_api_waves(definitions) == [['seed.token', 'seed.health'], ['seed.alice', 'seed.bob']]
+
+
+def test_invoke_apis_runs_independent_calls_concurrently(monkeypatch, flow_control, tmp_path):
+    import threading
+    _batch_collection(flow_control, tmp_path)
+    both_users_in_flight = threading.Barrier(2, timeout=2)
+    seen = []
+
+    def fake_request(self, method, url, headers=None, json=None, timeout=None):
+        seen.append((url, headers.get('Authorization')))
+        if url.endswith('/token'):
+            return _json_response({'token': 'abc'})
+        if url.endswith('/users'):
+            both_users_in_flight.wait()
+        return _json_response({})
+
+    monkeypatch.setattr('requests.Session.request', fake_request)
+    flow_control.invoke_apis('seed.alice', 'seed.bob', 'seed.token', 'seed.health')
+    assert ('http://dummy/users', 'abc') in seen
+    assert sorted(url for url, _ in seen) == ['http://dummy/health', 'http://dummy/token', 'http://dummy/users', 'http://dummy/users']
+
+
+def test_invoke_apis_rejects_circular_dependencies(flow_control):
+    apis = {
+        'a': DummyApiDef(endpoint='/a/${b_id}', extract={'a_id': 'id'}),
+        'b': DummyApiDef(endpoint='/b/${a_id}', extract={'b_id': 'id'}),
+    }
+    flow_control.session.apis.collections['loop'] = DummyApiCollection('loop', 'http://dummy', apis)
+    with pytest.raises(OpticsError, match="Circular"):
+        flow_control.invoke_apis('loop.a', 'loop.b')
+
+
+def test_invoke_apis_raises_first_failure(monkeypatch, flow_control, tmp_path):
+    _batch_collection(flow_control, tmp_path)
+
+    def fake_request(self, method, url, **kwargs):
+        raise requests.ConnectionError("down")
+
+    monkeypatch.setattr('requests.Session.request', fake_request)
+    with pytest.raises(OpticsError, match="failed"):
+        flow_control.invoke_apis('seed.health', 'seed.token')
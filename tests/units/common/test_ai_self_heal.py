@@ -203,6 +203,7 @@ import tempfile  # noqa: E402
 
 from optics_framework.api.action_keyword import ActionKeyword  # noqa: E402
 from optics_framework.common.optics_builder import OpticsBuilder  # noqa: E402
+from optics_framework.common.screenshot_stream import ScreenshotCaptureService  # noqa: E402
 
 
 class _Builder(OpticsBuilder):
@@ -226,6 +227,9 @@ class _Builder(OpticsBuilder):
     def get_image_detection(self):
         return None
 
+    def get_screenshot_service(self):
+        return ScreenshotCaptureService()
+
     def get_llm(self):
         return self._llm
 
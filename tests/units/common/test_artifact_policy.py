@@ -0,0 +1,137 @@
+import asyncio
+import os
+import cv2
+import numpy as np
+import pytest
+from optics_framework.common import utils
+from optics_framework.common.artifact_policy import (
+    ArtifactFailureSubscriber,
+    ArtifactPolicy,
+    close_artifact_policy,
+    get_artifact_policy,
+    open_artifact_policy,
+    record_step_failure,
+    set_artifact_policy,
+)
+from optics_framework.common.events import Event, EventStatus
+
+
+def _frame(value=120):
+    return np.full((10, 10, 3), value, dtype=np.uint8)
+
+
+def _jpgs(directory):
+    return sorted(f for f in os.listdir(directory) if f.endswith(".jpg"))
+
+
+@pytest.fixture
+def policy_dir(tmp_path):
+    def _install(level, **kwargs):
+        set_artifact_policy(str(tmp_path), ArtifactPolicy(level, **kwargs))
+        return str(tmp_path)
+    yield _install
+    set_artifact_policy(str(tmp_path), None)
+
+
+def test_none_writes_nothing(policy_dir):
+    output_dir = policy_dir("none")
+    utils.save_screenshot(_frame(), "pre", output_dir=output_dir, time_stamp="t1")
+    utils.save_page_source("<a/>", "t1", output_dir)
+    assert os.listdir(output_dir) == []
+    assert record_step_failure(output_dir) == 0
+
+
+def test_on_failure_writes_ring_only_after_failure(policy_dir):
+    output_dir = policy_dir("on_failure", ring_size=2)
+    for i in range(3):
+        utils.save_screenshot(_frame(), "pre", output_dir=output_dir, time_stamp=f"t{i}")
+    assert _jpgs(output_dir) == []
+
+    assert record_step_failure(output_dir, "Press Element") == 2
+    assert _jpgs(output_dir) == ["t1-pre.jpg", "t2-pre.jpg"]
+    assert record_step_failure(output_dir) == 0
+
+
+def test_buffered_frame_is_detached_from_caller(policy_dir):
+    output_dir = policy_dir("on_failure")
+    frame = _frame(200)
+    utils.save_screenshot(frame, "pre", output_dir=output_dir, time_stamp="t1")
+    frame[:] = 0
+    record_step_failure(output_dir)
+    assert cv2.imread(os.path.join(output_dir, "t1-pre.jpg")).mean() > 150
+
+
+def test_sampled_writes_every_nth_per_kind(policy_dir):
+    output_dir = policy_dir("sampled", sample_every=3)
+    for i in range(6):
+        utils.save_screenshot(_frame(), "pre", output_dir=output_dir, time_stamp=f"t{i}")
+    assert _jpgs(output_dir) == ["t0-pre.jpg", "t3-pre.jpg"]
+    utils.save_page_source("<a/>", "p0", output_dir)
+    assert os.path.exists(os.path.join(output_dir, "page_sources_log.xml"))
+
+
+def test_keyword_fail_event_flushes_ring(policy_dir):
+    output_dir = policy_dir("on_failure")
+    utils.save_screenshot(_frame(), "pre", output_dir=output_dir, time_stamp="t1")
+    subscriber = ArtifactFailureSubscriber(output_dir)
+
+    passed = Event(entity_type="keyword", entity_id="k1", name="Press Element", status=EventStatus.PASS)
+    asyncio.run(subscriber.on_event(passed))
+    assert _jpgs(output_dir) == []
+
+    failed = Event(entity_type="keyword", entity_id="k2", name="Press Element", status=EventStatus.FAIL)
+    asyncio.run(subscriber.on_event(failed))
+    assert _jpgs(output_dir) == ["t1-pre.jpg"]
+
+
+def test_subscriber_ignores_other_sessions_failures(tmp_path):
+    device_a, device_b = str(tmp_path / "a"), str(tmp_path / "b")
+    subscribers = {}
+    for session_id, output_dir in (("a", device_a), ("b", device_b)):
+        os.makedirs(output_dir)
+        set_artifact_policy(output_dir, ArtifactPolicy("on_failure"))
+        utils.save_screenshot(_frame(), "pre", output_dir=output_dir, time_stamp="t1")
+        subscribers[session_id] = ArtifactFailureSubscriber(output_dir, session_id=session_id)
+    try:
+        failed_on_b = Event(entity_type="keyword", entity_id="k1", name="Press Element",
+                            status=EventStatus.FAIL, extra={"session_id": "b"})
+        for subscriber in subscribers.values():
+            asyncio.run(subscriber.on_event(failed_on_b))
+        assert _jpgs(device_a) == []
+        assert _jpgs(device_b) == ["t1-pre.jpg"]
+    finally:
+        set_artifact_policy(device_a, None)
+        set_artifact_policy(device_b, None)
+
+
+def test_unknown_level_is_rejected():
+    with pytest.raises(ValueError):
+        ArtifactPolicy("sometimes")
+
+
+class _UncopyableFrame(np.ndarray):
+    def copy(self, *args, **kwargs):
+        pytest.fail("frame copied")
+
+
+def test_annotated_frame_is_not_copied_when_discarded(policy_dir):
+    output_dir = policy_dir("none")
+    frame = _frame().view(_UncopyableFrame)
+    utils.save_annotated_screenshot(frame, [((1, 1), (5, 5))], "hit", output_dir=output_dir, time_stamp="t1")
+
+
+def test_annotation_never_draws_on_caller_frame(tmp_path):
+    frame = _frame(0)
+    utils.save_annotated_screenshot(frame, [((1, 1), (8, 8))], "hit", output_dir=str(tmp_path), time_stamp="t1")
+    assert frame.max() == 0
+    assert cv2.imread(os.path.join(str(tmp_path), "t1-hit.jpg")).max() > 0
+
+
+def test_shared_output_dir_keeps_policy_until_last_session(tmp_path):
+    output_dir = str(tmp_path)
+    first = open_artifact_policy(output_dir, ArtifactPolicy("on_failure"))
+    assert open_artifact_policy(output_dir, ArtifactPolicy("none")) is first
+    close_artifact_policy(output_dir)
+    assert get_artifact_policy(output_dir) is first
+    close_artifact_policy(output_dir)
+    assert get_artifact_policy(output_dir) is None
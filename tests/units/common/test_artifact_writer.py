@@ -0,0 +1,146 @@
+import os
+import threading
+import cv2
+import numpy as np
+import pytest
+from optics_framework.common import utils
+from optics_framework.common.artifact_writer import (
+    ArtifactWriter,
+    close_artifact_writer,
+    get_artifact_writer,
+    open_artifact_writer,
+)
+from optics_framework.common.config_handler import Config
+from optics_framework.common.session_manager import Session
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    open_artifact_writer(str(tmp_path))
+    yield str(tmp_path)
+    close_artifact_writer(str(tmp_path))
+
+
+def _blocked_writer(tmp_path, **kwargs):
+    """Writer with one worker that is stuck on a job until the returned event is set."""
+    writer = ArtifactWriter(str(tmp_path), workers=1, **kwargs)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _wait():
+        started.set()
+        release.wait(5)
+
+    writer.submit("blocker", _wait, droppable=False)
+    started.wait(5)
+    return writer, release
+
+
+def test_screenshot_is_copied_before_background_write(output_dir):
+    frame = np.full((20, 30, 3), 200, dtype=np.uint8)
+    utils.save_screenshot(frame, "shot", output_dir=output_dir, time_stamp="t1")
+    frame[:] = 0
+    get_artifact_writer(output_dir).flush()
+
+    saved = cv2.imread(os.path.join(output_dir, "t1-shot.jpg"))
+    assert saved is not None
+    assert saved.mean() > 150
+
+
+def test_annotated_screenshot_leaves_original_untouched(output_dir):
+    frame = np.zeros((40, 40, 3), dtype=np.uint8)
+    utils.save_annotated_screenshot(frame, [((5, 5), (30, 30))], "boxed", output_dir, time_stamp="t2")
+    get_artifact_writer(output_dir).flush()
+    assert not frame.any()
+    assert cv2.imread(os.path.join(output_dir, "t2-boxed.jpg")).any()
+
+
+def test_page_source_appends_keep_submission_order(output_dir):
+    for i in range(20):
+        utils.save_page_source(f"<node id='{i}'/>", f"ts{i}", output_dir)
+    utils.save_interactable_elements([{"text": "Login"}], output_dir)
+    get_artifact_writer(output_dir).flush()
+
+    with open(os.path.join(output_dir, "page_sources_log.xml"), encoding="utf-8") as f:
+        content = f.read()
+    positions = [content.index(f'timestamp="ts{i}"') for i in range(20)]
+    assert positions == sorted(positions)
+    assert content.rstrip().endswith("</logs>")
+    assert os.path.exists(os.path.join(output_dir, "interactable_elements.json"))
+
+
+def test_without_writer_files_are_written_immediately(tmp_path):
+    frame = np.full((10, 10, 3), 100, dtype=np.uint8)
+    utils.save_screenshot(frame, "sync", output_dir=str(tmp_path), time_stamp="t3")
+    assert os.path.exists(tmp_path / "t3-sync.jpg")
+
+
+def test_drop_newest_discards_screenshots_when_full(tmp_path):
+    writer, release = _blocked_writer(tmp_path, queue_size=2, drop_policy="drop_newest")
+    written = []
+    results = [writer.submit("shot", written.append, i) for i in range(4)]
+    release.set()
+    writer.close()
+    assert results == [True, True, False, False]
+    assert written == [0, 1]
+    assert writer.dropped == 2
+
+
+def test_drop_oldest_keeps_logs_and_latest_screenshots(tmp_path):
+    writer, release = _blocked_writer(tmp_path, queue_size=2, drop_policy="drop_oldest")
+    written = []
+    writer.submit("log", written.append, "log", droppable=False)
+    for i in range(3):
+        assert writer.submit("shot", written.append, i)
+    release.set()
+    writer.close()
+    assert written == ["log", 2]
+    assert writer.dropped == 2
+
+
+def test_writer_is_shared_and_closed_by_last_session(tmp_path):
+    first = open_artifact_writer(str(tmp_path))
+    second = open_artifact_writer(str(tmp_path))
+    assert first is second
+    close_artifact_writer(str(tmp_path))
+    assert get_artifact_writer(str(tmp_path)) is first
+    close_artifact_writer(str(tmp_path))
+    assert get_artifact_writer(str(tmp_path)) is None
+
+
+def test_failed_write_is_counted_and_does_not_stop_worker(tmp_path):
+    writer = ArtifactWriter(str(tmp_path), workers=1)
+
+    def _fail():
+        raise OSError("disk full")
+
+    done = []
+    writer.submit("a", _fail)
+    writer.submit("a", done.append, 1)
+    writer.close()
+    assert writer.failed == 1
+    assert done == [1]
+
+
+def test_submission_racing_close_is_not_lost(tmp_path):
+    writer, release = _blocked_writer(tmp_path, queue_size=1)
+    written = []
+    writer.submit("filler", written.append, "filler", droppable=False)
+    # The queue is full, so this submission is still waiting for room when close starts.
+    submitter = threading.Thread(target=writer.submit, args=("late", written.append, "late"), kwargs={"droppable": False})
+    submitter.start()
+    closer = threading.Thread(target=writer.close)
+    closer.start()
+    release.set()
+    submitter.join(5)
+    closer.join(5)
+    assert written == ["filler", "late"]
+    writer.submit("after", written.append, "after")
+    assert written == ["filler", "late", "after"]
+
+
+def test_unknown_writer_mode_is_rejected(tmp_path):
+    config = Config(execution_output_path=str(tmp_path), artifact_writer="batch")
+    with pytest.raises(ValueError):
+        Session("s", config, None, None, None, None)
+    assert get_artifact_writer(str(tmp_path)) is None
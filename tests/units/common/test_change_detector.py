@@ -0,0 +1,92 @@
+"""Unit tests for screenshot change detectors."""
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from optics_framework.common import change_detector as cd
+from optics_framework.common.change_detector import (
+    SSIMChangeDetector,
+    TieredChangeDetector,
+    create_change_detector,
+)
+from optics_framework.common.screenshot_stream import ScreenshotStream
+
+
+def _screen(seed=0, shape=(2400, 1080, 3)):
+    rng = np.random.default_rng(seed)
+    small = rng.integers(0, 256, (shape[0] // 40, shape[1] // 40, 3), dtype=np.uint8)
+    return cv2.resize(small, (shape[1], shape[0]), interpolation=cv2.INTER_NEAREST)
+
+
+@pytest.mark.parametrize("detector_cls", [TieredChangeDetector, SSIMChangeDetector])
+def test_identical_and_changed_frames(detector_cls):
+    detector = detector_cls()
+    frame = _screen(0)
+    assert detector.is_duplicate(frame) is False
+    assert detector.is_duplicate(frame.copy()) is True
+    assert detector.is_duplicate(_screen(1)) is False
+    assert detector.is_duplicate(_screen(1)) is True
+
+
+def test_tiered_ignores_sensor_noise():
+    detector = TieredChangeDetector()
+    frame = _screen(0)
+    noisy = np.clip(frame.astype(np.int16) + np.random.default_rng(5).integers(-2, 3, frame.shape), 0, 255).astype(np.uint8)
+    detector.is_duplicate(frame)
+    assert detector.is_duplicate(noisy) is True
+
+
+def test_tiered_reference_only_advances_on_change():
+    detector = TieredChangeDetector()
+    first = _screen(0)
+    detector.is_duplicate(first)
+    reference = detector._reference
+    detector.is_duplicate(first.copy())
+    assert detector._reference is reference
+
+
+def test_tiered_skips_ssim_when_prefilter_decides():
+    detector = TieredChangeDetector()
+    with patch.object(cd, "_ssim", wraps=cd._ssim) as ssim_spy:
+        detector.is_duplicate(_screen(0))
+        detector.is_duplicate(_screen(0))
+        detector.is_duplicate(_screen(7))
+    ssim_spy.assert_not_called()
+
+
+def test_tiered_ssim_runs_on_thumbnail_only():
+    detector = TieredChangeDetector(mad_same=0.0, mad_changed=255.0, hash_distance=64)
+    frame = _screen(0)
+    shapes = []
+    with patch.object(cd, "ssim", side_effect=lambda a, b, **kw: shapes.append(a.shape) or 1.0):
+        detector.is_duplicate(frame)
+        changed = frame.copy()
+        changed[:200] = 0
+        detector.is_duplicate(changed)
+    assert shapes and max(shapes[0]) <= detector.thumbnail_size
+
+
+def test_resolution_change_is_a_new_reference():
+    detector = TieredChangeDetector()
+    detector.is_duplicate(_screen(0))
+    assert detector.is_duplicate(_screen(0, shape=(1200, 540, 3))) is False
+
+
+def test_create_change_detector_by_name_and_instance():
+    assert isinstance(create_change_detector(), TieredChangeDetector)
+    assert isinstance(create_change_detector("ssim", threshold=0.9), SSIMChangeDetector)
+    custom = SSIMChangeDetector()
+    assert create_change_detector(custom) is custom
+    with pytest.raises(ValueError):
+        create_change_detector("nope")
+
+
+def test_screenshot_stream_uses_pluggable_detector():
+    stream = ScreenshotStream(lambda: None, change_detector="ssim")
+    assert isinstance(stream.change_detector, SSIMChangeDetector)
+    frame = _screen(0, shape=(200, 100, 3))
+    kept = stream._process_frame_for_deduplication(frame, "t0", None)
+    assert stream._process_frame_for_deduplication(frame.copy(), "t1", kept) is kept
+    assert stream.filtered_queue.qsize() == 1
@@ -0,0 +1,87 @@
+import json
+import os
+from optics_framework.common.har_writer import (
+    HarWriter,
+    append_har_entry,
+    close_har_writer,
+    get_har_writer,
+    journal_path_for,
+    recover_har,
+)
+
+
+def _entry(i):
+    return {"startedDateTime": f"2024-01-01T00:00:{i:02d}.000Z", "request": {"url": f"http://api.test/{i}"}}
+
+
+def _urls(har_path):
+    with open(har_path, encoding="utf-8") as f:
+        har = json.load(f)
+    assert har["log"]["version"] == "1.2"
+    return [e["request"]["url"] for e in har["log"]["entries"]]
+
+
+def test_entries_stream_to_journal_and_finalize_into_valid_har(tmp_path):
+    har_path = str(tmp_path / "api_details.har")
+    writer = HarWriter(har_path)
+    for i in range(50):
+        writer.append(_entry(i))
+    writer.flush()
+    with open(journal_path_for(har_path), encoding="utf-8") as f:
+        assert len(f.readlines()) == 50
+
+    assert writer.finalize() == 50
+    assert _urls(har_path) == [f"http://api.test/{i}" for i in range(50)]
+
+    writer.append(_entry(50))
+    assert writer.close() == 51
+    assert len(_urls(har_path)) == 51
+    assert not os.path.exists(journal_path_for(har_path))
+
+
+def test_existing_har_entries_are_kept(tmp_path):
+    har_path = str(tmp_path / "api_details.har")
+    first = HarWriter(har_path)
+    first.append(_entry(1))
+    first.close()
+
+    second = HarWriter(har_path)
+    second.append(_entry(2))
+    second.close()
+    assert _urls(har_path) == ["http://api.test/1", "http://api.test/2"]
+
+
+def test_crashed_journal_is_recovered(tmp_path):
+    har_path = str(tmp_path / "api_details.har")
+    with open(journal_path_for(har_path), "w", encoding="utf-8") as journal:
+        journal.write(json.dumps(_entry(1)) + "\n")
+        journal.write('{"startedDateTime": "torn')  # interrupted mid-write
+    assert recover_har(har_path) == 1
+    assert _urls(har_path) == ["http://api.test/1"]
+    assert not os.path.exists(journal_path_for(har_path))
+
+
+def test_writer_is_shared_per_path(tmp_path):
+    har_path = str(tmp_path / "api_details.har")
+    writer = get_har_writer(har_path)
+    assert get_har_writer(har_path) is writer
+    writer.close()
+    assert get_har_writer(har_path) is not writer
+    get_har_writer(har_path).close()
+
+
+def test_close_har_writer_only_closes_that_path(tmp_path):
+    ended = str(tmp_path / "ended" / "api_details.har")
+    running = str(tmp_path / "running" / "api_details.har")
+    os.makedirs(os.path.dirname(ended))
+    os.makedirs(os.path.dirname(running))
+    append_har_entry(ended, _entry(1))
+    append_har_entry(running, _entry(2))
+    other = get_har_writer(running)
+
+    close_har_writer(ended)
+    assert _urls(ended) == ["http://api.test/1"]
+    assert not os.path.exists(journal_path_for(ended))
+    assert not os.path.exists(running)
+    assert get_har_writer(running) is other
+    close_har_writer(running)
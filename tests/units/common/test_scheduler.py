@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from optics_framework.common.config_handler import Config, DependencyConfig
+from optics_framework.common.logging_config import execution_logger
+from optics_framework.common.models import ElementData, KeywordNode, ModuleNode, TestCaseNode
+from optics_framework.common.runner.printers import NullResultPrinter
+from optics_framework.common.runner.scheduler import ParallelTestRunner, device_config
+from optics_framework.common.runner.test_runnner import TestRunner
+
+
+class _Events:
+    def __init__(self):
+        self.events = []
+
+    async def publish_event(self, event):
+        self.events.append(event)
+
+    async def get_command(self):
+        return None
+
+
+def _suite(names, keyword="Wait"):
+    head = None
+    for name in reversed(names):
+        module = ModuleNode(name=f"{name} module")
+        module.add_keyword(KeywordNode(name=keyword, params=[name]))
+        node = TestCaseNode(name=name)
+        node.add_module(module)
+        node.next = head
+        head = node
+    return head
+
+
+def _runners(devices, test_cases, keyword_map, printer, events):
+    runners = {}
+    for device in devices:
+        session = SimpleNamespace(
+            session_id=f"session-{device}", test_cases=test_cases, modules=None,
+            elements=ElementData(), apis=None, config=Config(halt_duration=0),
+        )
+        runners[device] = TestRunner(session, keyword_map, printer, event_manager=events)
+    return runners
+
+
+@pytest.fixture
+def suite():
+    def _build(names, durations=None, devices=("a", "b"), **kwargs):
+        durations = durations or {}
+
+        def wait(name):
+            time.sleep(durations.get(name, 0.01))
+
+        printer = NullResultPrinter()
+        events = _Events()
+        runners = _runners(devices, _suite(names), {"wait": wait}, printer, events)
+        return ParallelTestRunner(runners, printer, **kwargs), printer, events
+    return _build
+
+
+def test_test_cases_run_concurrently_and_results_merge(suite):
+    names = [f"tc{i}" for i in range(4)]
+    runner, printer, events = suite(names, durations={n: 0.2 for n in names})
+    start = time.monotonic()
+    asyncio.run(runner.run_all())
+    assert time.monotonic() - start < 0.7
+    assert {tc.status for tc in printer.test_state.values()} == {"PASS"}
+    assert set(runner.assignments.values()) == {"a", "b"}
+    sessions = {e.extra["session_id"] for e in events.events if e.entity_type == "test_case"}
+    assert sessions == {"session-a", "session-b"}
+
+
+def test_affinity_pins_test_cases_to_device(suite):
+    names = ["tc0", "tc1", "tc2", "tc3"]
+    runner, _, _ = suite(names, affinity={"tc1": "b", "tc3": "b"}, work_stealing=False)
+    asyncio.run(runner.run_all())
+    assert runner.assignments["tc1"] == "b"
+    assert runner.assignments["tc3"] == "b"
+    assert runner.assignments["tc0"] == "a"
+
+
+def test_idle_device_steals_unpinned_work(suite):
+    names = ["slow", "fast0", "fast1", "fast2", "fast3", "fast4"]
+    runner, _, _ = suite(names, durations={"slow": 0.3}, affinity={"slow": "a"})
+    runner._plan()
+    assert [name for name, _ in runner.workers[0].queue] == ["slow", "fast0", "fast2", "fast4"]
+    asyncio.run(runner.run_all())
+    assert runner.assignments["slow"] == "a"
+    assert sum(1 for device in runner.assignments.values() if device == "b") >= 4
+    assert runner.workers[1].stolen >= 2
+
+
+def test_failing_device_is_retired_and_work_moves(suite, monkeypatch):
+    names = ["tc0", "tc1", "tc2", "tc3"]
+    runner, printer, _ = suite(names)
+    broken = runner.workers[0].runner
+
+    async def _crash(test_case):
+        raise ConnectionError("driver gone")
+
+    monkeypatch.setattr(broken, "execute_test_case", _crash)
+    asyncio.run(runner.run_all())
+    assert runner.workers[0].retired
+    assert printer.test_state["tc0"].status == "FAIL"
+    assert [printer.test_state[n].status for n in ("tc1", "tc2", "tc3")] == ["PASS"] * 3
+
+
+def test_device_config_merges_capabilities_into_enabled_drivers():
+    config = Config(json_log=True, driver_sources=[
+        {"appium": DependencyConfig(enabled=True, url="http://hub:4723", capabilities={"platformName": "Android"})},
+        {"selenium": DependencyConfig(enabled=False, capabilities={})},
+    ])
+    device = {"name": "pixel", "url": "http://farm:4723", "capabilities": {"udid": "emulator-5554"}}
+    secondary = device_config(config, device, primary=False)
+    appium = secondary.driver_sources[0]["appium"]
+    assert appium.url == "http://farm:4723"
+    assert appium.capabilities == {"platformName": "Android", "udid": "emulator-5554"}
+    assert secondary.driver_sources[1]["selenium"].capabilities == {}
+    assert secondary.json_log is False
+    assert config.driver_sources[0]["appium"].capabilities == {"platformName": "Android"}
+
+
+def test_retired_device_hands_off_work_without_stealing(suite, monkeypatch):
+    names = ["tc0", "tc1", "tc2", "tc3", "tc4"]
+    runner, printer, events = suite(names, affinity={"tc4": "a"}, work_stealing=False)
+    broken = runner.workers[0].runner
+
+    async def _crash(test_case):
+        raise ConnectionError("driver gone")
+
+    monkeypatch.setattr(broken, "execute_test_case", _crash)
+    asyncio.run(runner.run_all())
+    assert printer.test_state["tc0"].status == "FAIL"
+    assert [printer.test_state[n].status for n in ("tc1", "tc2", "tc3")] == ["PASS"] * 3
+    assert printer.test_state["tc4"].status == "SKIPPED"
+    skipped = [e for e in events.events if e.entity_type == "test_case" and e.name == "tc4"]
+    assert [e.status.value for e in skipped] == ["RUNNING", "SKIPPED"]
+
+
+def test_device_config_writes_to_per_device_directory(tmp_path):
+    config = Config(execution_output_path=str(tmp_path))
+    pixel = device_config(config, {"name": "pixel"})
+    galaxy = device_config(config, {"name": "galaxy"}, primary=False)
+    assert pixel.execution_output_path == str(tmp_path / "pixel")
+    assert galaxy.execution_output_path == str(tmp_path / "galaxy")
+    assert (tmp_path / "pixel").is_dir()
+    assert config.execution_output_path == str(tmp_path)
+
+
+def test_keyword_logs_stay_with_their_device(suite, monkeypatch):
+    runner, _, events = suite(["tc0", "tc1"])
+    handlers_before = list(execution_logger.handlers)
+    both_running = threading.Barrier(2, timeout=2)
+
+    def wait(name):
+        both_running.wait()
+        execution_logger.warning(f"log from {name}")
+        both_running.wait()
+
+    monkeypatch.setitem(runner.keyword_map, "wait", wait)
+    asyncio.run(runner.run_all())
+    keyword_logs = [e.logs for e in events.events if e.entity_type == "keyword" and e.status.value == "PASS"]
+    assert sorted(tuple(entry) for entry in keyword_logs) == [("log from tc0",), ("log from tc1",)]
+    assert execution_logger.handlers == handlers_before
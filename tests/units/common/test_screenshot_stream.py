@@ -0,0 +1,138 @@
+"""Unit tests for the shared, paced ScreenshotCaptureService."""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from optics_framework.common.base_factory import InstanceFallback
+from optics_framework.common.screenshot_stream import ScreenshotCaptureService
+from optics_framework.common.strategies import StrategyManager
+
+
+class _Frames:
+    """Capture callable returning a new random frame (or the same one) per call."""
+
+    def __init__(self, changing=True, fail=False):
+        self.calls = 0
+        self.changing = changing
+        self.fail = fail
+        self._rng = np.random.default_rng(0)
+        self._static = self._rng.integers(0, 256, (64, 48, 3), dtype=np.uint8)
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        if self.fail:
+            raise RuntimeError("device busy")
+        if not self.changing:
+            return self._static
+        return self._rng.integers(0, 256, (64, 48, 3), dtype=np.uint8)
+
+
+def _wait_until(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def services():
+    created = []
+    yield created
+    for service in created:
+        service.stop()
+
+
+def _service(services, frames, **kwargs):
+    service = ScreenshotCaptureService(frames, **kwargs)
+    services.append(service)
+    return service
+
+
+def test_subscribers_share_one_capture_per_tick(services):
+    frames = _Frames()
+    service = _service(services, frames, target_fps=20)
+    first = service.subscribe(deduplication=False)
+    second = service.subscribe(deduplication=False)
+    time.sleep(0.5)
+    a = first.get_all_available_screenshots()
+    b = second.get_all_available_screenshots()
+    assert a and b
+    assert frames.calls <= 13  # paced at ~20 fps, not one capture per subscriber
+    assert {ts for _, ts in a} & {ts for _, ts in b}
+
+
+def test_capture_is_paced_to_target_fps(services):
+    frames = _Frames()
+    service = _service(services, frames, target_fps=10)
+    service.subscribe(deduplication=False)
+    time.sleep(0.55)
+    assert 3 <= frames.calls <= 7
+
+
+def test_failures_back_off(services):
+    frames = _Frames(fail=True)
+    service = _service(services, frames, target_fps=100, max_backoff=0.2)
+    service.subscribe()
+    time.sleep(0.6)
+    assert frames.calls <= 8
+    assert service.consecutive_failures == frames.calls
+
+
+def test_thread_stops_after_last_unsubscribe(services):
+    service = _service(services, _Frames(), target_fps=50)
+    first = service.subscribe()
+    second = service.subscribe()
+    first.stop_capture()
+    assert service.is_running()
+    second.stop_capture()
+    assert _wait_until(lambda: not service.is_running())
+    assert service.subscriber_count() == 0
+
+
+def test_subscription_timeout_unsubscribes(services):
+    service = _service(services, _Frames(), target_fps=50)
+    subscription = service.subscribe(timeout=0.1)
+    assert _wait_until(lambda: subscription.closed)
+    assert _wait_until(lambda: not service.is_running())
+
+
+def test_unchanged_frames_are_deduplicated_per_subscriber(services):
+    frames = _Frames(changing=False)
+    service = _service(services, frames, target_fps=50)
+    dedup = service.subscribe(deduplication=True)
+    raw = service.subscribe(deduplication=False)
+    assert _wait_until(lambda: frames.calls >= 5)
+    assert len(dedup.get_all_available_screenshots()) == 1
+    assert len(raw.get_all_available_screenshots()) >= 4
+
+
+def test_slow_consumer_drops_oldest_frames(services):
+    service = _service(services, _Frames(), target_fps=100)
+    subscription = service.subscribe(max_queue_size=2, deduplication=False)
+    assert _wait_until(lambda: subscription.dropped_frames > 0)
+    assert len(subscription.get_all_available_screenshots()) <= 2
+
+
+def test_strategy_managers_share_the_session_service(services):
+    source = MagicMock()
+    source.capture.return_value = np.zeros((10, 10, 3), dtype=np.uint8)
+    service = ScreenshotCaptureService(target_fps=20)
+    services.append(service)
+    fallback = InstanceFallback([source])
+    first = StrategyManager(fallback, None, None, capture_service=service)
+    second = StrategyManager(fallback, None, None, capture_service=service)
+    a = first.capture_screenshot_stream(timeout=5)
+    b = second.capture_screenshot_stream(timeout=5)
+    assert a.service is b.service is service
+    assert service.subscriber_count() == 2
+    assert _wait_until(lambda: source.capture.call_count > 0)
+    first.stop_screenshot_stream()
+    second.stop_screenshot_stream()
+    assert service.subscriber_count() == 0
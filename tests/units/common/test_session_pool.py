@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+import pytest
+from optics_framework.common import optics_builder
+from optics_framework.common.base_factory import InstanceFallback
+from optics_framework.common.config_handler import Config
+from optics_framework.common.optics_builder import OpticsBuilder
+from optics_framework.common.session_pool import ComponentPool, config_fingerprint, get_component_pool
+
+
+class _Engine:
+    def __init__(self, config):
+        self.execution_output_dir = config.get("execution_output_path", "")
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def built(monkeypatch):
+    get_component_pool().clear()
+    engines = []
+
+    def _get_driver(config):
+        engine = _Engine(next(iter(config[0].values())))
+        engines.append(engine)
+        return InstanceFallback([engine])
+
+    monkeypatch.setattr(optics_builder.TextFactory, "get_driver", _get_driver)
+    yield engines
+    get_component_pool().clear()
+
+
+def _builder(output_path, language="en", pool_size=1):
+    config = Config(execution_output_path=output_path, session_pool_size=pool_size)
+    builder = OpticsBuilder(SimpleNamespace(event_sdk=None, config=config))
+    builder.add_text_detection([{"easyocr": {"language": language}}])
+    return builder
+
+
+def test_fingerprint_ignores_session_output_path():
+    a = config_fingerprint("text_detection", [{"easyocr": {"language": "en", "execution_output_path": "/a"}}])
+    b = config_fingerprint("text_detection", [{"easyocr": {"language": "en", "execution_output_path": "/b"}}])
+    c = config_fingerprint("text_detection", [{"easyocr": {"language": "de", "execution_output_path": "/a"}}])
+    assert a == b != c
+    assert a != config_fingerprint("llm", [{"easyocr": {"language": "en"}}])
+
+
+def test_released_component_is_reused_by_next_session(built, monkeypatch):
+    monkeypatch.setattr(ComponentPool, "prewarm", lambda self, key, build, capacity: None)
+    first = _builder("/out/one", pool_size=1)
+    component = first.get_text_detection()
+    first.release_components()
+    assert first._instances.get("text_detection") is None
+
+    second = _builder("/out/two", pool_size=1)
+    assert second.get_text_detection() is component
+    assert component.instances[0].execution_output_dir == "/out/two"
+    assert len(built) == 1
+    assert not component.instances[0].closed
+
+
+def test_component_not_parked_is_closed(built, monkeypatch):
+    monkeypatch.setattr(ComponentPool, "prewarm", lambda self, key, build, capacity: None)
+    first, second = _builder("/a"), _builder("/b")
+    first.get_text_detection()
+    second.get_text_detection()
+    first.release_components()
+    second.release_components()
+    assert [engine.closed for engine in built] == [False, True]
+
+
+def test_pool_disabled_builds_per_session(built):
+    for output in ("/a", "/b"):
+        builder = _builder(output, pool_size=0)
+        builder.get_text_detection()
+        builder.release_components()
+    assert len(built) == 2
+    assert all(engine.closed for engine in built)
+    assert get_component_pool().idle_count(config_fingerprint("text_detection", [{"easyocr": {"language": "en"}}])) == 0
+
+
+def test_prewarm_fills_pool_in_background():
+    pool = ComponentPool()
+    thread = pool.prewarm("k", object, capacity=2)
+    assert pool.prewarm("k", object, capacity=2) is None
+    thread.join(2)
+    assert pool.idle_count("k") == 2
+    assert pool.acquire("k") is not None
+    assert pool.hits == 1
+    assert pool.prewarm("x", object, capacity=0) is None
+
+
+def test_release_is_bounded_per_key():
+    pool = ComponentPool()
+    parked = object()
+    assert pool.release("k", parked, capacity=1)
+    assert not pool.release("k", object(), capacity=1)
+    assert pool.acquire("k") is parked
+    assert pool.acquire("k") is None
+    assert pool.misses == 1
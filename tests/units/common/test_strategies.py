@@ -1,13 +1,23 @@
 """Unit tests for TEXT_ONLY prefix feature and strategy selection."""
+import threading
+import time
+
 import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
 from optics_framework.common import utils
+from optics_framework.common.error import OpticsError
 from optics_framework.common.strategies import (
+    LocatorStrategy,
     StrategyManager,
     TextDetectionStrategy,
     LocateResult,
+    RaceContext,
+    _run_in_race,
+    capture_aoi,
+    capture_frame,
+    race_cancelled,
 )
 from optics_framework.common.base_factory import InstanceFallback
 
@@ -182,3 +192,249 @@ class TestStrategyManagerAssertPresenceTextOnly:
             assert "Submit" in seen_elements
             assert "Login" in seen_elements
             assert "TEXT_ONLY:Login" not in seen_elements
+
+
+# --- Opt-in strategy racing ---
+
+
+class _FakeStrategy:
+    """Minimal locator strategy for racing tests."""
+
+    observes_race_cancellation = False
+
+    def __init__(self, name, locate_delay=0.0, found_after=None, observes=False):
+        self.name = name
+        self.element_source = MagicMock()
+        self.locate_delay = locate_delay
+        self.found_after = found_after
+        self.observes_race_cancellation = observes
+        self.assert_calls = 0
+        self.started = time.monotonic()
+        self.finished = threading.Event()
+
+    def supports(self, element_type, element_source):
+        return True
+
+    def locate(self, element, index=0):
+        time.sleep(self.locate_delay)
+        return (1, 1) if self.found_after is not None else None
+
+    def assert_elements(self, elements, timeout=30, rule="any"):
+        self.assert_calls += 1
+        end = time.monotonic() + timeout
+        while time.monotonic() < end and not race_cancelled():
+            if self.found_after is not None and time.monotonic() - self.started >= self.found_after:
+                return True, self.name, None
+            time.sleep(0.02)
+        self.finished.set()
+        return False, None, None
+
+
+def _racing_manager(strategies, racing=True):
+    manager = StrategyManager(InstanceFallback([MagicMock()]), None, None, racing=racing)
+    manager.locator_strategies = strategies
+    return manager
+
+
+class TestStrategyRacing:
+    def test_racing_is_off_by_default(self, strategy_manager):
+        assert strategy_manager.racing is False
+
+    def test_assert_presence_returns_first_hit_without_waiting_for_slow_strategy(self):
+        slow = _FakeStrategy("xpath")  # never finds, polls in slices
+        fast = _FakeStrategy("ocr", found_after=0.2, observes=True)
+        manager = _racing_manager([slow, fast])
+        start = time.monotonic()
+        result, timestamp, _ = manager.assert_presence(["Login"], "Text", timeout=10)
+        assert result is True and timestamp == "ocr"
+        assert time.monotonic() - start < 2
+
+    def test_losing_racers_are_cancelled(self):
+        loser = _FakeStrategy("ocr", observes=True)
+        winner = _FakeStrategy("xpath", found_after=0.1)
+        manager = _racing_manager([loser, winner])
+        manager.assert_presence(["Login"], "Text", timeout=10)
+        assert loser.finished.wait(1)
+
+    def test_assert_presence_race_raises_when_nobody_finds(self):
+        manager = _racing_manager([_FakeStrategy("a"), _FakeStrategy("b", observes=True)])
+        with pytest.raises(OpticsError):
+            manager.assert_presence(["Login"], "Text", timeout=1)
+
+    def test_locate_yields_fastest_hit_first(self):
+        slow = _FakeStrategy("xpath", locate_delay=0.5, found_after=0)
+        fast = _FakeStrategy("ocr", locate_delay=0.0, found_after=0)
+        manager = _racing_manager([slow, fast])
+        first = next(manager.locate("Login"))
+        assert first.strategy is fast
+
+    def test_locate_race_raises_when_nobody_finds(self):
+        manager = _racing_manager([_FakeStrategy("a"), _FakeStrategy("b")])
+        with pytest.raises(OpticsError):
+            list(manager.locate("Login"))
+
+    def test_racers_share_one_screenshot_per_source(self):
+        source = MagicMock()
+        source.capture.return_value = np.zeros((4, 4, 3), dtype=np.uint8)
+        race = RaceContext()
+        frames = [_run_in_race(race, capture_frame, source) for _ in range(3)]
+        assert source.capture.call_count == 1
+        assert all(f is frames[0] for f in frames)
+        assert capture_frame(source) is not None  # outside a race: fresh capture
+        assert source.capture.call_count == 2
+
+
+# --- capability table and per-element-type strategy lists ---
+
+
+class _StubSource:
+    def locate(self, element, index=None):
+        return element
+
+    def capture(self):
+        raise NotImplementedError("no screenshots")
+
+
+class TestCapabilityTable:
+    def test_source_is_inspected_once_per_class_and_method(self):
+        with patch("optics_framework.common.strategies.inspect.getsource", wraps=__import__("inspect").getsource) as getsource:
+            for _ in range(5):
+                assert LocatorStrategy._is_method_implemented(_StubSource(), "locate") is True
+                assert LocatorStrategy._is_method_implemented(_StubSource(), "capture") is False
+        assert getsource.call_count <= 2
+
+    def test_source_capabilities_reports_every_known_method(self):
+        capabilities = LocatorStrategy.source_capabilities(_StubSource())
+        assert capabilities["locate"] is True
+        assert capabilities["capture"] is False
+        assert capabilities["get_page_source"] is False
+
+    def test_strategy_lists_are_prebuilt_per_element_type(self, strategy_manager):
+        text = strategy_manager.strategies_for("Text")
+        assert [type(s).__name__ for s in text] == ["TextElementStrategy", "TextDetectionStrategy"]
+        assert [type(s).__name__ for s in strategy_manager.strategies_for("XPath")] == ["XPathStrategy"]
+        assert strategy_manager.strategies_for("Text") is text
+
+    def test_replacing_locator_strategies_rebuilds_the_lists(self, strategy_manager):
+        fake = _FakeStrategy("only")
+        strategy_manager.locator_strategies = [fake]
+        assert strategy_manager.strategies_for("Image") == [fake]
+
+
+# --- per-step frame reuse ---
+
+
+class TestStepFrame:
+    @pytest.fixture(autouse=True)
+    def _visible_frames(self, mock_element_source):
+        # capture_screenshot rejects all-black frames.
+        mock_element_source.capture.return_value = np.full((100, 100, 3), 120, dtype=np.uint8)
+
+    def test_vision_locate_reuses_pre_action_frame(self, strategy_manager, mock_element_source):
+        frame = strategy_manager.capture_screenshot()
+        assert mock_element_source.capture.call_count == 1
+        with strategy_manager.step_frame(frame) as step:
+            assert step is not None
+            result = next(strategy_manager.locate("TEXT_ONLY:Login"))
+        assert type(result.strategy).__name__ == "TextDetectionStrategy"
+        assert mock_element_source.capture.call_count == 1
+        # Strategies get a copy, so engines drawing on it cannot alter the caller's frame.
+        handed = result.strategy.text_detection.find_element.call_args[0][0]
+        assert handed is not frame
+
+    def test_stale_or_foreign_frames_are_not_reused(self, strategy_manager, mock_element_source):
+        strategy_manager.frame_max_age = 0.05
+        frame = strategy_manager.capture_screenshot()
+        with strategy_manager.step_frame(frame):
+            time.sleep(0.1)
+            capture_frame(mock_element_source)
+        assert mock_element_source.capture.call_count == 2
+
+        with strategy_manager.step_frame(np.zeros((5, 5, 3), dtype=np.uint8)) as step:
+            assert step is None
+        other_source = MagicMock()
+        strategy_manager.frame_max_age = 5
+        with strategy_manager.step_frame(strategy_manager.capture_screenshot()):
+            capture_frame(other_source)
+        assert other_source.capture.call_count == 1
+
+    def test_frame_ages_from_capture_not_from_step_start(self, strategy_manager, mock_element_source):
+        strategy_manager.frame_max_age = 0.05
+        frame = strategy_manager.capture_screenshot()
+        time.sleep(0.1)  # e.g. a blocked pre-action save between capture and step_frame
+        with strategy_manager.step_frame(frame) as step:
+            assert step.frame_for(mock_element_source) is None
+
+    def test_race_is_seeded_with_step_frame(self, strategy_manager, mock_element_source):
+        frame = strategy_manager.capture_screenshot()
+        with strategy_manager.step_frame(frame) as step:
+            race = RaceContext(step)
+            _run_in_race(race, capture_frame, mock_element_source)
+        assert mock_element_source.capture.call_count == 1
+
+
+# --- AOI region capture ---
+
+
+class _FullFrameSource:
+    def __init__(self):
+        self.frame = np.arange(200 * 100 * 3, dtype=np.uint32).reshape(200, 100, 3).astype(np.uint8)
+        self.captures = 0
+
+    def capture(self):
+        self.captures += 1
+        return self.frame
+
+
+class _RegionSource(_FullFrameSource):
+    def __init__(self, fail=False):
+        super().__init__()
+        self.fail = fail
+        self.regions = 0
+
+    def capture_region(self, aoi_x, aoi_y, aoi_width, aoi_height):
+        self.regions += 1
+        if self.fail:
+            raise RuntimeError("clip unsupported")
+        x1, y1, x2, y2 = utils.calculate_aoi_bounds(self.frame.shape, aoi_x, aoi_y, aoi_width, aoi_height)
+        return self.frame[y1:y2, x1:x2].copy(), (x1, y1, x2, y2)
+
+
+class TestAoiCapture:
+    def test_native_region_capture_skips_full_screenshot(self):
+        source = _RegionSource()
+        region, bounds, full = capture_aoi(source, 0, 50, 100, 50)
+        assert full is None and source.captures == 0 and source.regions == 1
+        assert bounds == (0, 100, 100, 200)
+        np.testing.assert_array_equal(region, source.frame[100:200, 0:100])
+
+    def test_sources_without_region_support_crop_a_full_capture(self):
+        source = _FullFrameSource()
+        region, bounds, full = capture_aoi(source, 0, 50, 100, 50)
+        assert full is source.frame and source.captures == 1
+        assert region.shape[:2] == (100, 100) and bounds == (0, 100, 100, 200)
+
+    def test_failed_region_capture_falls_back_and_invalid_aoi_raises(self):
+        source = _RegionSource(fail=True)
+        _, _, full = capture_aoi(source, 10, 10, 50, 50)
+        assert full is not None and source.captures == 1
+        with pytest.raises(ValueError):
+            capture_aoi(_RegionSource(), 60, 0, 50, 10)
+
+    def test_text_locate_with_aoi_maps_region_hits_to_screen(self):
+        source = _RegionSource()
+        text_detection = MagicMock()
+        text_detection.find_element.return_value = (True, (10, 5), ((0, 0), (20, 10)))
+        strategy = TextDetectionStrategy(source, text_detection, MagicMock())
+        result = strategy.locate_with_aoi("Login", 0, 50, 100, 50)
+        assert result.value == (10, 105)
+        assert result.annotated_frame.shape[:2] == (100, 100)
+        assert source.captures == 0
+
+    def test_viewport_clip_matches_crop_bounds(self):
+        clip, bounds = utils.aoi_clip_for_viewport(400, 300, 2, 25, 10, 50, 20)
+        _, crop_bounds = utils.crop_screenshot_to_aoi(np.zeros((600, 800, 3), dtype=np.uint8), 25, 10, 50, 20)
+        assert bounds == crop_bounds
+        assert clip == (100.0, 30.0, 200.0, 60.0)
+        resized = utils.fit_region_to_bounds(np.zeros((61, 399, 3), dtype=np.uint8), bounds)
+        assert resized.shape[:2] == (120, 400)
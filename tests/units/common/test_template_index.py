@@ -0,0 +1,88 @@
+import asyncio
+import os
+import pytest
+from optics_framework.common import expose_api, template_index
+from optics_framework.common.template_index import TemplateIndex
+from optics_framework.helper.execute import discover_templates
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes(monkeypatch):
+    # Tests index throwaway directories; keep them out of the process-wide registry
+    monkeypatch.setattr(template_index, "_indexes", {})
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"")
+
+
+def _bump(directory):
+    # Force a new mtime so the test does not depend on filesystem timestamp resolution
+    stat = os.stat(directory)
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_matches_recursive_walk(tmp_path):
+    _touch(tmp_path / "login.png")
+    _touch(tmp_path / "images" / "Logo.JPG")
+    _touch(tmp_path / "images" / "notes.txt")
+    _touch(tmp_path / "images" / "deep" / "icon.tiff")
+    templates = discover_templates(str(tmp_path)).templates
+    assert templates == {
+        "login.png": str(tmp_path / "login.png"),
+        "Logo.JPG": str(tmp_path / "images" / "Logo.JPG"),
+        "icon.tiff": str(tmp_path / "images" / "deep" / "icon.tiff"),
+    }
+
+
+def test_only_changed_directories_are_rescanned(tmp_path):
+    for name in ("a", "b", "c"):
+        _touch(tmp_path / name / f"{name}.png")
+    index = TemplateIndex(str(tmp_path))
+    assert len(index.templates()) == 3
+    assert index.rescans == 4
+
+    assert len(index.templates()) == 3
+    assert index.rescans == 4
+
+    _touch(tmp_path / "b" / "new.png")
+    _bump(tmp_path / "b")
+    assert index.templates()["new.png"] == str(tmp_path / "b" / "new.png")
+    assert index.rescans == 5
+
+
+def test_removed_directories_drop_their_templates(tmp_path):
+    _touch(tmp_path / "old" / "gone.png")
+    _touch(tmp_path / "kept.png")
+    index = TemplateIndex(str(tmp_path))
+    assert "gone.png" in index.templates()
+    os.remove(tmp_path / "old" / "gone.png")
+    os.rmdir(tmp_path / "old")
+    _bump(tmp_path)
+    assert index.templates() == {"kept.png": str(tmp_path / "kept.png")}
+
+
+def test_sessions_get_independent_template_data(tmp_path):
+    _touch(tmp_path / "btn.png")
+    first = discover_templates(str(tmp_path))
+    first.remove_template("btn.png")
+    assert discover_templates(str(tmp_path)).get_template_path("btn.png") == str(tmp_path / "btn.png")
+
+
+def test_keyword_catalog_is_built_once(monkeypatch):
+    calls = []
+    original = expose_api.discover_keywords
+
+    def _discover():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(expose_api, "discover_keywords", _discover)
+    monkeypatch.setattr(expose_api, "_keyword_catalog", None)
+    first = asyncio.run(expose_api.list_keywords())
+    second = asyncio.run(expose_api.list_keywords())
+    assert first is second
+    assert any(k.keyword_slug == "press_element" for k in first)
+    assert len(calls) == 1
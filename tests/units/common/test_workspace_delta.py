@@ -0,0 +1,122 @@
+import asyncio
+import json
+import cv2
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from optics_framework.common import expose_api
+from optics_framework.common.workspace_delta import (
+    WorkspaceDelta,
+    WorkspaceImages,
+    diff_elements,
+    discard_workspace_images,
+    frame_fingerprint,
+    index_elements,
+)
+
+
+def _frame(value):
+    return np.full((20, 30, 3), value, dtype=np.uint8)
+
+
+def _delta(images=None):
+    return WorkspaceDelta(images if images is not None else WorkspaceImages(), lambda image_id: f"/img/{image_id}")
+
+
+def test_frame_fingerprint_depends_on_pixels_and_shape():
+    assert frame_fingerprint(_frame(10)) == frame_fingerprint(_frame(10))
+    assert frame_fingerprint(_frame(10)) != frame_fingerprint(_frame(11))
+    assert frame_fingerprint(_frame(10)) != frame_fingerprint(np.full((30, 20, 3), 10, dtype=np.uint8))
+    assert frame_fingerprint(_frame(10)[:, ::2]) == frame_fingerprint(np.ascontiguousarray(_frame(10)[:, ::2]))
+
+
+def test_element_ids_are_stable_and_patches_minimal():
+    before = index_elements([
+        {"text": "Login", "xpath": "//button[1]"},
+        {"text": "Help", "xpath": "//a[1]"},
+        {"text": "Row", "bounds": [0, 0, 1, 1]},
+        {"text": "Row", "bounds": [0, 0, 1, 1]},
+    ])
+    after = index_elements([
+        {"text": "Sign in", "xpath": "//button[1]"},
+        {"text": "Row", "bounds": [0, 0, 1, 1]},
+        {"text": "Cancel", "xpath": "//button[2]"},
+    ])
+    assert len(before) == 4
+    patch = diff_elements(before, after)
+    assert [e["text"] for e in patch["added"]] == ["Cancel"]
+    assert [e["text"] for e in patch["modified"]] == ["Sign in"]
+    assert len(patch["removed"]) == 2
+    assert all(key in before for key in patch["removed"])
+
+
+def test_delta_sends_snapshot_then_only_changes():
+    images = WorkspaceImages()
+    delta = _delta(images)
+    elements = [{"text": "Login", "xpath": "//button[1]"}]
+
+    first = delta.update(_frame(50), elements)
+    assert first["type"] == "snapshot" and first["seq"] == 0
+    assert first["screenshot"]["url"] == f"/img/{first['screenshot']['id']}"
+    assert [e["text"] for e in first["elements"]["added"]] == ["Login"]
+    assert cv2.imdecode(np.frombuffer(images.get(first["screenshot"]["id"]), np.uint8), cv2.IMREAD_COLOR).shape == (20, 30, 3)
+
+    assert delta.update(_frame(50), list(elements)) is None
+
+    second = delta.update(_frame(60), elements)
+    assert second["type"] == "delta" and second["seq"] == 1
+    assert "screenshot" in second
+    assert second["elements"] == {"added": [], "removed": [], "modified": []}
+
+    third = delta.update(None, [])
+    assert third["screenshotFailed"] is True
+    assert "screenshot" not in third
+    assert len(third["elements"]["removed"]) == 1
+
+
+def test_source_is_resent_only_when_text_changes():
+    delta = _delta()
+    assert "source" in delta.update(_frame(1), [], {"page_source": "<a/>", "timestamp": 1})
+    assert delta.update(_frame(1), [], {"page_source": "<a/>", "timestamp": 2}) is None
+    assert delta.update(_frame(1), [], {"page_source": "<b/>", "timestamp": 3})["source"]["page_source"] == "<b/>"
+
+
+def test_image_cache_is_bounded_and_skips_reencoding(monkeypatch):
+    images = WorkspaceImages(capacity=2)
+    ids = [images.put(_frame(v)) for v in (1, 2, 3)]
+    assert images.get(ids[0]) is None
+    assert images.get(ids[2]) is not None
+
+    monkeypatch.setattr("optics_framework.common.workspace_delta.encode_numpy_to_png_bytes",
+                        lambda frame: pytest.fail("frame encoded twice"))
+    assert images.put(_frame(3)) == ids[2]
+
+
+def test_image_endpoint_serves_streamed_frames(monkeypatch):
+    session = type("S", (), {"session_id": "ws-1"})()
+    captures = iter([
+        expose_api._WorkspaceCapture(_frame(80), [{"text": "OK", "xpath": "//b"}], None),
+    ])
+
+    async def _capture(*_args):
+        return next(captures)
+
+    monkeypatch.setattr(expose_api, "_capture_workspace", _capture)
+    monkeypatch.setattr(expose_api.session_manager, "get_session", lambda sid: session)
+
+    async def _first_message():
+        stream = expose_api.workspace_delta_generator(session, 0.5)
+        message = await stream.__anext__()
+        await stream.aclose()
+        return json.loads(message["data"])
+
+    message = asyncio.run(_first_message())
+    image_id = message["screenshot"]["id"]
+    response = asyncio.run(expose_api.get_workspace_image("ws-1", image_id))
+    assert response.media_type == "image/png"
+    assert response.headers["etag"] == f'"{image_id}"'
+
+    discard_workspace_images("ws-1")
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(expose_api.get_workspace_image("ws-1", image_id))
+    assert exc.value.status_code == 404
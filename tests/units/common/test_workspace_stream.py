@@ -0,0 +1,100 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import numpy as np
+from optics_framework.common import expose_api, workspace_stream
+from optics_framework.common.workspace_stream import (
+    STREAM_CLOSED,
+    WorkspaceProducer,
+    WorkspaceSubscriber,
+    close_workspace_producers,
+    get_workspace_producer,
+)
+
+
+def _producer(key, captures, alive=lambda: True):
+    calls = []
+
+    async def _capture():
+        calls.append(1)
+        return captures[min(len(calls), len(captures)) - 1]
+
+    producer = get_workspace_producer(key, lambda: WorkspaceProducer(key, _capture, str, alive))
+    return producer, calls
+
+
+def test_clients_share_one_capture_loop():
+    async def _scenario():
+        producer, calls = _producer(("s1", False, ()), ["a", "a", "b"])
+        first = producer.subscribe(0.01)
+        second = get_workspace_producer(("s1", False, ()), lambda: None).subscribe(0.01)
+        assert producer.subscriber_count == 2
+        received = [await first.get(1), await first.get(1)]
+        assert [await second.get(1), await second.get(1)] == received == ["a", "b"]
+        producer.unsubscribe(first)
+        producer.unsubscribe(second)
+        # One capture per tick however many clients are connected
+        assert producer.captures == len(calls)
+
+    asyncio.run(_scenario())
+    assert ("s1", False, ()) not in workspace_stream._producers
+
+
+def test_late_subscriber_gets_latest_capture_immediately():
+    async def _scenario():
+        producer, _ = _producer(("s2", False, ()), ["only"])
+        first = producer.subscribe(0.01)
+        assert await first.get(1) == "only"
+        late = producer.subscribe(0.01)
+        assert late.queue.get_nowait() == "only"
+        close_workspace_producers("s2")
+        assert await first.get(1) is STREAM_CLOSED
+
+    asyncio.run(_scenario())
+
+
+def test_slow_subscriber_drops_oldest_captures():
+    async def _scenario():
+        subscriber = WorkspaceSubscriber(0.5, buffer_size=2)
+        for item in ("a", "b", "c"):
+            subscriber.offer(item)
+        return subscriber.dropped, [await subscriber.get(1), await subscriber.get(1)]
+
+    assert asyncio.run(_scenario()) == (1, ["b", "c"])
+
+
+def test_stream_ends_when_session_is_gone():
+    async def _scenario():
+        producer, _ = _producer(("s3", False, ()), ["x"], alive=lambda: False)
+        subscriber = producer.subscribe(0.01)
+        return await subscriber.get(1)
+
+    assert asyncio.run(_scenario()) is STREAM_CLOSED
+
+
+def test_full_stream_encodes_each_capture_once_for_all_clients(monkeypatch):
+    session = SimpleNamespace(session_id="ws-shared")
+    frame = np.full((8, 8, 3), 90, dtype=np.uint8)
+    encoded = []
+
+    async def _capture(*_args):
+        return expose_api._WorkspaceCapture(frame, [{"text": "OK"}], None)
+
+    def _encode(image):
+        encoded.append(1)
+        return "png"
+
+    monkeypatch.setattr(expose_api, "_capture_workspace", _capture)
+    monkeypatch.setattr(expose_api, "encode_numpy_to_base64", _encode)
+    monkeypatch.setattr(expose_api.session_manager, "get_session", lambda sid: session)
+
+    async def _scenario():
+        streams = [expose_api.workspace_generator(session, 0.5) for _ in range(3)]
+        messages = [json.loads((await stream.__anext__())["data"]) for stream in streams]
+        for stream in streams:
+            await stream.aclose()
+        return messages
+
+    messages = asyncio.run(_scenario())
+    assert [m["screenshot"] for m in messages] == ["png"] * 3
+    assert len(encoded) == 1
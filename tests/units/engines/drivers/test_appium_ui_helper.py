@@ -0,0 +1,113 @@
+"""Unit tests for page-source snapshots in the Appium UIHelper."""
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from optics_framework.common.page_source_snapshot import PageSourceSnapshot
+from optics_framework.engines.drivers.appium_UI_helper import UIHelper
+
+PAGE_SOURCE = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy>
+  <android.widget.FrameLayout resource-id="com.app:id/root" bounds="[0,0][1080,2400]">
+    <android.widget.Button text="Login" resource-id="com.app:id/login" bounds="[10,10][200,80]"/>
+    <android.widget.TextView text="Welcome" bounds="[10,100][400,160]"/>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+
+@pytest.fixture
+def page_source_prop():
+    return PropertyMock(return_value=PAGE_SOURCE)
+
+
+@pytest.fixture
+def ui_helper(page_source_prop):
+    appium = MagicMock()
+    appium.event_sdk.config_handler.config.execution_output_path = None
+    type(appium.driver).page_source = page_source_prop
+    return UIHelper(appium)
+
+
+def test_snapshot_holds_parsed_tree_and_hash():
+    snapshot = PageSourceSnapshot(PAGE_SOURCE, "ts")
+    assert snapshot.root.tag == "hierarchy"
+    assert snapshot.tree.xpath("//*[@text='Login']")
+    assert snapshot.content_hash == PageSourceSnapshot(PAGE_SOURCE).content_hash
+    assert snapshot.time_stamp == "ts"
+
+
+def test_text_locate_fetches_page_source_once(ui_helper, page_source_prop):
+    xpath = ui_helper.find_xpath_from_text("Login")
+    assert xpath
+    assert ui_helper.root.xpath(xpath)
+    assert page_source_prop.call_count == 1
+
+
+def test_explicit_snapshot_is_reused_across_lookups(ui_helper, page_source_prop):
+    snapshot = ui_helper.capture_snapshot()
+    locators = ui_helper.get_locator_and_strategy("Welcome", snapshot=snapshot)
+    ui_helper.get_view_locator(locators["strategy"], locators["locator"], snapshot=snapshot)
+    ui_helper.get_locator_and_strategy_using_index("Login", 0, snapshot=snapshot)
+    ui_helper.get_interactive_elements(snapshot=snapshot)
+    assert page_source_prop.call_count == 1
+
+
+def test_lookups_without_snapshot_still_refresh(ui_helper, page_source_prop):
+    ui_helper.find_xpath("//android.widget.Button")
+    ui_helper.find_xpath("//android.widget.Button")
+    assert page_source_prop.call_count == 2
+
+
+DUPLICATE_SOURCE = """<hierarchy>
+  <android.widget.LinearLayout>
+    <android.widget.Button text="OK" resource-id="com.app:id/ok"/>
+    <android.widget.Button text="OK" resource-id="com.app:id/ok"/>
+    <android.widget.Button text="OK" content-desc="confirm"/>
+    <android.widget.TextView text='say "hi" it&apos;s'/>
+  </android.widget.LinearLayout>
+  <android.widget.LinearLayout>
+    <android.view.View/>
+    <android.view.View/>
+  </android.widget.LinearLayout>
+</hierarchy>"""
+
+
+def test_get_xpath_locates_each_node_exactly(ui_helper):
+    snapshot = PageSourceSnapshot(DUPLICATE_SOURCE)
+    for node in snapshot.root.iter():
+        xpath = ui_helper.get_xpath(node)
+        assert snapshot.tree.xpath(xpath) == [node] or snapshot.tree.xpath(xpath)[0] is node, xpath
+
+
+def test_get_xpath_prefers_unique_then_semi_unique(ui_helper):
+    snapshot = PageSourceSnapshot(DUPLICATE_SOURCE)
+    buttons = snapshot.root.findall(".//android.widget.Button")
+    assert ui_helper.get_xpath(buttons[2]) == '//android.widget.Button[@content-desc="confirm"]'
+    assert ui_helper.get_xpath(buttons[1]) == '(//android.widget.Button[@resource-id="com.app:id/ok"])[2]'
+    views = snapshot.root.findall(".//android.view.View")
+    assert ui_helper.get_xpath(views[1]).endswith("/android.widget.LinearLayout[2]/android.view.View[2]")
+
+
+def test_xpath_index_built_once_per_tree(ui_helper):
+    from optics_framework.engines.drivers import appium_UI_helper
+
+    with patch.object(appium_UI_helper, "XPathIndex", wraps=appium_UI_helper.XPathIndex) as index_cls:
+        elements = ui_helper.get_interactive_elements(snapshot=PageSourceSnapshot(DUPLICATE_SOURCE))
+        assert len(elements) == 0  # no bounds in this fixture
+        snapshot = PageSourceSnapshot(DUPLICATE_SOURCE)
+        for node in snapshot.root.iter():
+            ui_helper.get_xpath(node)
+    assert index_cls.call_count == 2
+
+
+def test_xpath_index_counts_and_siblings():
+    from optics_framework.engines.drivers.xpath_index import XPathIndex
+
+    snapshot = PageSourceSnapshot(DUPLICATE_SOURCE)
+    index = XPathIndex(snapshot.root, ["text", "resource-id"], [("text", "resource-id")])
+    buttons = snapshot.root.findall(".//android.widget.Button")
+    assert index.tag_count("android.widget.Button") == 3
+    assert index.match(buttons[2], (("text", "OK"),)) == (3, 2)
+    assert index.match(buttons[1], (("text", "OK"), ("resource-id", "com.app:id/ok"))) == (2, 1)
+    assert index.sibling_position(buttons[1]) == (2, 3)
+    assert index.tag_count("{urn:x}tag") == 0
@@ -0,0 +1,83 @@
+"""Unit tests for batched interactive element extraction in PlaywrightPageSource."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from optics_framework.engines.elementsources.playwright_page_source import (
+    PlaywrightPageSource,
+    _INTERACTIVE_ELEMENTS_JS,
+)
+
+PAYLOAD = [
+    {
+        "tag": "button",
+        "attrs": {"id": "login", "class": "btn primary"},
+        "bounds": {"x": 10.4, "y": 20.6, "width": 100.0, "height": 30.0},
+        "visible": True,
+        "text": "Log in",
+        "textKey": "text",
+        "xpath": '//button[@id="login"]',
+    },
+    {
+        "tag": "div",
+        "attrs": {},
+        "bounds": {"x": 0, "y": 0, "width": 500, "height": 400},
+        "visible": True,
+        "text": None,
+        "textKey": None,
+        "xpath": "/html/body/div",
+    },
+    {
+        "tag": "input",
+        "attrs": {"placeholder": "Email", "type": "text"},
+        "bounds": {"x": 5, "y": 60, "width": 200, "height": 24},
+        "visible": False,
+        "text": "Email",
+        "textKey": "placeholder",
+        "xpath": '//input[@placeholder="Email"]',
+    },
+]
+
+
+@pytest.fixture
+def page():
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=PAYLOAD)
+    page.content = AsyncMock(return_value="<html><body><button id='login'>Log in</button></body></html>")
+    return page
+
+
+@pytest.fixture
+def source(page):
+    return PlaywrightPageSource(driver=MagicMock(page=page))
+
+
+def test_single_evaluate_round_trip(source, page):
+    elements = source.get_interactive_elements()
+    page.evaluate.assert_awaited_once_with(_INTERACTIVE_ELEMENTS_JS)
+    page.locator.assert_not_called()
+    page.content.assert_not_awaited()
+    assert len(elements) == 3
+
+
+def test_payload_is_shaped_like_tree_extraction(source):
+    button, div, field = source.get_interactive_elements()
+    assert button["text"] == "Log in"
+    assert button["bounds"] == {"x1": 10, "y1": 20, "x2": 110, "y2": 50}
+    assert button["xpath"] == '//button[@id="login"]'
+    assert button["extra"]["id"] == "login" and button["extra"]["tag"] == "button"
+    assert div["text"] == "div"
+    assert "placeholder" not in field["extra"]
+    assert field["extra"]["visible"] is False
+
+
+def test_filter_config_applies_to_payload(source):
+    elements = source.get_interactive_elements(["inputs"])
+    assert [e["extra"]["tag"] for e in elements] == ["input"]
+
+
+def test_falls_back_to_tree_extraction_when_script_fails(source, page):
+    page.evaluate = AsyncMock(side_effect=RuntimeError("navigated"))
+    with patch.object(PlaywrightPageSource, "_get_interactive_elements_from_tree", return_value=["fallback"]) as tree:
+        assert source.get_interactive_elements(["buttons"]) == ["fallback"]
+    tree.assert_called_once_with(["buttons"])
@@ -0,0 +1,142 @@
+import base64
+import threading
+from unittest.mock import MagicMock, patch
+import cv2
+import numpy as np
+import pytest
+import requests
+from optics_framework.engines.vision_models.http_client import (
+    PooledHTTPClient,
+    close_http_clients,
+    get_http_client,
+)
+from optics_framework.engines.vision_models.image_models.remote_oir import RemoteImageDetection
+
+
+def _response(results):
+    response = MagicMock()
+    response.json.return_value = {"results": results}
+    return response
+
+
+def test_http_client_is_shared_and_pools_connections():
+    client = get_http_client(3)
+    assert get_http_client(3) is client
+    assert get_http_client(4) is not client
+    adapter = client.session.get_adapter("https://ocr.example")
+    assert adapter._pool_maxsize == 3
+
+
+def test_close_http_clients_closes_and_forgets_shared_clients():
+    client = get_http_client(5)
+    with patch.object(client.session, "close") as close:
+        close_http_clients()
+    close.assert_called_once()
+    assert get_http_client(5) is not client
+
+
+def test_submit_runs_requests_concurrently():
+    client = PooledHTTPClient(pool_size=2)
+    barrier = threading.Barrier(2, timeout=2)
+    futures = [client.submit(barrier.wait) for _ in range(2)]
+    assert sorted(f.result(timeout=2) for f in futures) == [0, 1]
+    client.close()
+
+
+@pytest.fixture
+def templates(tmp_path):
+    """Template mapping with a few distinct icons on disk."""
+    paths = {}
+    for i, name in enumerate(["a.png", "b.png", "icon.png"]):
+        image = np.full((40, 40, 3), 60 * (i + 1), dtype=np.uint8)
+        path = tmp_path / name
+        cv2.imwrite(str(path), image)
+        paths[name] = str(path)
+    mapping = MagicMock()
+    mapping.get_template_path.side_effect = paths.get
+    return mapping
+
+
+def _detector(templates, tmp_path, **capabilities):
+    return RemoteImageDetection({
+        "url": "http://oir.test", "templates": templates,
+        "execution_output_path": str(tmp_path), "capabilities": capabilities,
+    })
+
+
+def test_assert_elements_sends_all_templates_over_pooled_session(templates, tmp_path):
+    detector = _detector(templates, tmp_path, pool_size=2)
+    hit = {"center": [5, 5], "bbox": [[0, 0], [10, 10]], "confidence": 0.9}
+    with patch.object(detector.http.session, "post", side_effect=[_response([hit]), _response([])]) as post:
+        found, _ = detector.assert_elements(np.zeros((20, 20, 3), dtype=np.uint8), ["a.png", "b.png"], rule="any")
+    assert found is True
+    assert post.call_count == 2
+    assert all(call.args[0] == "http://oir.test/detect-image" for call in post.call_args_list)
+
+
+def test_find_element_scales_template_with_frame_and_maps_result_back(templates, tmp_path):
+    detector = _detector(templates, tmp_path, max_image_dimension=100)
+    hit = {"center": [25, 25], "bbox": [[20, 20], [30, 30]], "confidence": 0.9}
+    with patch.object(detector.http.session, "post", return_value=_response([hit])) as post:
+        found = detector.find_element(np.zeros((100, 200, 3), dtype=np.uint8), "icon.png")
+    assert found == (True, (50, 50), ((40, 40), (60, 60)))
+    template_b64 = post.call_args.kwargs["json"]["template"]
+    template = cv2.imdecode(np.frombuffer(base64.b64decode(template_b64), np.uint8), cv2.IMREAD_COLOR)
+    assert template.shape[:2] == (20, 20)
+
+
+def _batch_response(results, status=200):
+    response = _response(results)
+    response.status_code = status
+    return response
+
+
+def test_batch_mode_uploads_templates_once_and_sends_one_request_per_frame(templates, tmp_path):
+    detector = _detector(templates, tmp_path, batch_templates=True)
+    frame = np.zeros((20, 20, 3), dtype=np.uint8)
+    hit = {"center": [5, 5], "bbox": [[0, 0], [10, 10]], "confidence": 0.9}
+
+    def post(url, **kwargs):
+        if url.endswith("/templates"):
+            return _batch_response([])
+        ids = kwargs["json"]["templates"]
+        return _batch_response({ids[0]: [hit]})
+
+    with patch.object(detector.http.session, "post", side_effect=post) as mock_post:
+        found, _ = detector.assert_elements(frame, ["a.png", "b.png"], rule="any")
+        assert found is True
+        found, _ = detector.assert_elements(frame, ["a.png", "b.png"], rule="all")
+        assert found is False
+    urls = [call.args[0] for call in mock_post.call_args_list]
+    assert urls.count("http://oir.test/templates") == 2
+    assert urls.count("http://oir.test/detect-images") == 2
+
+
+def test_batch_mode_reuploads_templates_the_service_evicted(templates, tmp_path):
+    detector = _detector(templates, tmp_path, batch_templates=True)
+    frame = np.zeros((20, 20, 3), dtype=np.uint8)
+    template_id = detector._encoded_template("a.png", 1.0).content_hash()
+    detector._uploaded_templates.add(template_id)
+    evicted = _batch_response([], status=409)
+    evicted.json.return_value = {"missing": [template_id]}
+    responses = [evicted, _batch_response([]), _batch_response({template_id: []})]
+    with patch.object(detector.http.session, "post", side_effect=responses) as mock_post:
+        result = detector.detect_images_batch(
+            detector.transport.encode(frame), {"a.png": detector._encoded_template("a.png", 1.0)}, "template_matching")
+    assert result == {"a.png": []}
+    assert [call.args[0].rsplit("/", 1)[1] for call in mock_post.call_args_list] == [
+        "detect-images", "templates", "detect-images"]
+
+
+def test_batch_failure_falls_back_to_per_template_requests(templates, tmp_path):
+    detector = _detector(templates, tmp_path, batch_templates=True)
+    hit = {"center": [5, 5], "bbox": [[0, 0], [10, 10]], "confidence": 0.9}
+
+    def post(url, **kwargs):
+        if url.endswith("/detect-image"):
+            return _response([hit])
+        raise requests.exceptions.ConnectionError("no batch endpoint")
+
+    with patch.object(detector.http.session, "post", side_effect=post):
+        found, _ = detector.assert_elements(np.zeros((20, 20, 3), dtype=np.uint8), ["a.png"], rule="all")
+    assert found is True
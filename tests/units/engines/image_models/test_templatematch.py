@@ -0,0 +1,130 @@
+"""Unit tests for SIFT template matching and the template descriptor cache."""
+import os
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from optics_framework.common.models import TemplateData
+from optics_framework.engines.vision_models import template_cache
+from optics_framework.engines.vision_models.image_models.templatematch import TemplateMatchingHelper
+from optics_framework.engines.vision_models.template_cache import TemplateDescriptorCache, create_sift
+
+
+def _textured_image(seed, shape):
+    """Blurred random noise gives SIFT plenty of stable keypoints."""
+    rng = np.random.default_rng(seed)
+    img = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    return cv2.GaussianBlur(img, (5, 5), 0)
+
+
+@pytest.fixture
+def template_image():
+    return _textured_image(1, (80, 80, 3))
+
+
+@pytest.fixture
+def frame(template_image):
+    frame = _textured_image(2, (400, 300, 3))
+    frame[150:230, 100:180] = template_image
+    return frame
+
+
+@pytest.fixture
+def template_file(tmp_path, template_image):
+    path = tmp_path / "icon.png"
+    cv2.imwrite(str(path), template_image)
+    return str(path)
+
+
+@pytest.fixture
+def helper(template_file):
+    templates = TemplateData()
+    templates.add_template("icon.png", template_file)
+    return TemplateMatchingHelper(config={"templates": templates, "capabilities": {}})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_caches():
+    template_cache._caches.clear()
+    yield
+    template_cache._caches.clear()
+
+
+def test_find_element_locates_template(helper, frame):
+    found, center, bbox = helper.find_element(frame, "icon.png")
+    assert found is True
+    assert abs(center[0] - 140) <= 3 and abs(center[1] - 190) <= 3
+    assert abs(int(bbox[0][0]) - 100) <= 3 and abs(int(bbox[0][1]) - 150) <= 3
+
+
+def test_template_is_read_and_described_once(helper, frame):
+    with patch("optics_framework.engines.vision_models.template_cache.cv2.imread", wraps=cv2.imread) as imread:
+        helper.find_element(frame, "icon.png")
+        helper.assert_elements(frame, ["icon.png"])
+        helper.find_element(frame, "icon.png")
+    assert imread.call_count == 1
+
+
+def test_cache_invalidates_when_template_changes(template_file):
+    cache = TemplateDescriptorCache()
+    sift = create_sift()
+    first = cache.get(template_file, sift)
+    cv2.imwrite(template_file, _textured_image(3, (60, 90, 3)))
+    stat = os.stat(template_file)
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = cache.get(template_file, sift)
+    assert first.shape == (80, 80, 3)
+    assert second.shape == (60, 90, 3)
+
+
+def test_cache_key_includes_sift_params(template_file):
+    cache = TemplateDescriptorCache()
+    default = cache.get(template_file, create_sift())
+    limited = cache.get(template_file, create_sift({"nfeatures": 5}), {"nfeatures": 5})
+    assert len(cache) == 2
+    assert len(limited.keypoints) < len(default.keypoints)
+
+
+def test_disk_store_survives_new_cache_instance(tmp_path, template_file):
+    cache_dir = str(tmp_path / "descriptors")
+    sift = create_sift()
+    original = TemplateDescriptorCache(cache_dir=cache_dir).get(template_file, sift)
+
+    with patch("optics_framework.engines.vision_models.template_cache.cv2.imread") as imread:
+        restored = TemplateDescriptorCache(cache_dir=cache_dir).get(template_file, sift)
+    imread.assert_not_called()
+    assert restored.shape == original.shape
+    assert len(restored.keypoints) == len(original.keypoints)
+    np.testing.assert_array_equal(restored.descriptors, original.descriptors)
+    assert restored.keypoints[0].pt == pytest.approx(original.keypoints[0].pt)
+
+
+def test_assert_elements_runs_one_frame_sift_pass(tmp_path, helper, frame):
+    for i in range(3):
+        path = tmp_path / f"other_{i}.png"
+        cv2.imwrite(str(path), _textured_image(10 + i, (60, 60, 3)))
+        helper.templates.add_template(path.name, str(path))
+    names = ["other_0.png", "other_1.png", "other_2.png", "icon.png"]
+    for name in names:
+        helper._template_features(name)  # warm the template cache
+
+    helper.sift = MagicMock(wraps=helper.sift)
+    found, annotated = helper.assert_elements(frame, names, rule="any")
+
+    assert found is True
+    assert annotated.shape == frame.shape
+    assert helper.sift.detectAndCompute.call_count == 1
+
+
+def test_frame_features_shared_across_templates(helper, frame, template_image):
+    features = helper.frame_features(frame)
+    first = helper._find_in_frame(features, "icon.png")
+    second = helper._find_in_frame(features, template_image)
+    assert first[1] == second[1]
+
+
+def test_missing_template_raises_value_error(helper, frame):
+    with pytest.raises(ValueError):
+        helper.find_element(frame, "unknown.png")
@@ -0,0 +1,86 @@
+import threading
+import time
+import pytest
+from optics_framework.engines.vision_models.model_registry import ModelRegistry
+
+
+def _loader(loads):
+    def _load():
+        loads.append(1)
+        return object()
+    return _load
+
+
+def test_model_is_loaded_lazily_and_shared():
+    registry = ModelRegistry()
+    loads = []
+    first = registry.acquire(("easyocr", "en"), _loader(loads))
+    second = registry.acquire(("easyocr", "en"), _loader(loads))
+    assert first is second
+    assert first.refs == 2
+    assert loads == []
+    assert first.run(lambda model: model) is second.get()
+    assert len(loads) == 1
+    assert registry.acquire(("easyocr", "de"), _loader(loads)) is not first
+
+
+def test_last_release_unloads_the_model():
+    registry = ModelRegistry()
+    model = registry.acquire("k", object)
+    registry.acquire("k", object)
+    model.get()
+    registry.release(model)
+    assert model.loaded and registry.find("k") is model
+    registry.release(model)
+    assert not model.loaded
+    assert registry.find("k") is None
+    assert registry.acquire("k", object) is not model
+
+
+def test_concurrent_first_use_loads_once():
+    registry = ModelRegistry()
+    loads = []
+
+    def _slow_load():
+        time.sleep(0.05)
+        return _loader(loads)()
+
+    model = registry.acquire("k", _slow_load, max_concurrency=8)
+    threads = [threading.Thread(target=model.get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+
+
+@pytest.mark.parametrize("limit", [1, 2])
+def test_inference_concurrency_is_limited(limit):
+    registry = ModelRegistry()
+    model = registry.acquire("k", object, max_concurrency=limit)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def _infer(_model):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    threads = [threading.Thread(target=model.run, args=(_infer,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == limit
+
+
+def test_later_engine_can_only_raise_the_limit():
+    registry = ModelRegistry()
+    model = registry.acquire("k", object, max_concurrency=2)
+    registry.acquire("k", object, max_concurrency=1)
+    assert model.max_concurrency == 2
+    registry.acquire("k", object, max_concurrency=4)
+    assert model.max_concurrency == 4
@@ -0,0 +1,114 @@
+from unittest.mock import MagicMock, patch
+import numpy as np
+import pytest
+from optics_framework.engines.vision_models.ocr_cache import (
+    OCRResultCache,
+    frame_fingerprint,
+    get_ocr_cache,
+    ocr_cache_from_capabilities,
+)
+from optics_framework.engines.vision_models.ocr_models.remote_ocr import RemoteOCR
+
+
+def _frame(value=0, shape=(40, 60, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def _result(text="Login"):
+    return text, [([(0, 0), (10, 0), (10, 10), (0, 10)], text, 0.9)]
+
+
+def test_fingerprint_depends_on_pixels_and_shape():
+    assert frame_fingerprint(_frame(1)) == frame_fingerprint(_frame(1))
+    assert frame_fingerprint(_frame(1)) != frame_fingerprint(_frame(2))
+    assert frame_fingerprint(_frame(0, (40, 60, 3))) != frame_fingerprint(_frame(0, (60, 40, 3)))
+    assert frame_fingerprint("abc") == frame_fingerprint("abc")
+    with pytest.raises(TypeError):
+        frame_fingerprint(object())
+
+
+def test_identical_frame_is_computed_once_per_engine_key():
+    cache = OCRResultCache()
+    compute = MagicMock(return_value=_result())
+
+    first = cache.get_or_compute(_frame(5), ("easyocr", "en"), compute)
+    second = cache.get_or_compute(_frame(5), ("easyocr", "en"), compute)
+    assert first == second
+    assert compute.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get_or_compute(_frame(5), ("easyocr", "fr"), compute)
+    cache.get_or_compute(_frame(6), ("easyocr", "en"), compute)
+    assert compute.call_count == 3
+
+
+def test_cached_results_list_is_not_shared_with_callers():
+    cache = OCRResultCache()
+    compute = MagicMock(return_value=_result())
+    _, results = cache.get_or_compute(_frame(), ("e",), compute)
+    results.clear()
+    _, again = cache.get_or_compute(_frame(), ("e",), compute)
+    assert len(again) == 1
+
+
+def test_failures_and_none_are_not_cached():
+    cache = OCRResultCache()
+    failing = MagicMock(side_effect=ValueError("No text detected"))
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.get_or_compute(_frame(), ("e",), failing)
+    assert failing.call_count == 2
+
+    empty = MagicMock(return_value=None)
+    cache.get_or_compute(_frame(), ("e",), empty)
+    cache.get_or_compute(_frame(), ("e",), empty)
+    assert empty.call_count == 2
+    assert len(cache) == 0
+
+
+def test_entry_and_byte_bounds_evict_least_recently_used():
+    cache = OCRResultCache(max_entries=2)
+    for value in (1, 2, 3):
+        cache.get_or_compute(_frame(value), ("e",), lambda: _result())
+    assert len(cache) == 2
+
+    big = (np.zeros(1000, dtype=np.uint8), [])
+    cache = OCRResultCache(max_bytes=2500)
+    for value in (1, 2, 3):
+        cache.get_or_compute(_frame(value), ("pytesseract",), lambda: big)
+    assert len(cache) == 2
+    assert cache.size_bytes <= 2500
+
+
+def test_capabilities_can_disable_or_grow_the_shared_cache():
+    assert ocr_cache_from_capabilities({"result_cache": False}) is None
+    shared = get_ocr_cache()
+    original = shared.max_entries
+    try:
+        cache = ocr_cache_from_capabilities({"result_cache_entries": original + 10})
+        assert cache is shared
+        assert cache.max_entries == original + 10
+        ocr_cache_from_capabilities({"result_cache_entries": 1})
+        assert cache.max_entries == original + 10
+    finally:
+        shared.max_entries = original
+
+
+@patch("requests.Session.post")
+def test_remote_ocr_reuses_result_for_unchanged_frame(mock_post):
+    get_ocr_cache().clear()
+    response = MagicMock()
+    response.json.return_value = {
+        "results": [{"text": "Submit", "bbox": [[0, 0], [10, 0], [10, 5], [0, 5]], "confidence": 0.8}]
+    }
+    mock_post.return_value = response
+    ocr = RemoteOCR({"url": "http://ocr.test", "capabilities": {}})
+
+    first = ocr.detect_text(_frame(9))
+    second = ocr.detect_text(_frame(9))
+    assert first == second == ("Submit", [([(0, 0), (10, 0), (10, 5), (0, 5)], "Submit", 0.8)])
+    assert mock_post.call_count == 1
+
+    uncached = RemoteOCR({"url": "http://ocr.test", "capabilities": {"result_cache": False}})
+    uncached.detect_text(_frame(9))
+    assert mock_post.call_count == 2
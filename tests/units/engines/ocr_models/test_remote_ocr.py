@@ -0,0 +1,68 @@
+import base64
+from unittest.mock import MagicMock, patch
+import cv2
+import numpy as np
+import pytest
+from optics_framework.engines.vision_models.image_transport import ImageTransport
+from optics_framework.engines.vision_models.ocr_models.remote_ocr import RemoteOCR
+
+
+def _frame(width=400, height=200):
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    cv2.putText(frame, "Hi", (20, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+    return frame
+
+
+def _response():
+    response = MagicMock()
+    response.json.return_value = {
+        "results": [{"text": "Hi", "bbox": [[10, 10], [50, 10], [50, 30], [10, 30]], "confidence": 0.9}]
+    }
+    return response
+
+
+@pytest.mark.parametrize("encoding, magic", [("png", b"\x89PNG"), ("jpeg", b"\xff\xd8"), ("webp", b"RIFF")])
+def test_transport_encodings(encoding, magic):
+    encoded = ImageTransport(encoding=encoding).encode(_frame())
+    assert encoded.data.startswith(magic)
+    assert encoded.scale == 1.0
+
+
+def test_transport_downscales_to_max_dimension():
+    encoded = ImageTransport(max_dimension=100).encode(_frame())
+    decoded = cv2.imdecode(np.frombuffer(encoded.data, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape[:2] == (50, 100)
+    assert encoded.scale == pytest.approx(0.25)
+
+
+def test_transport_rejects_unknown_settings():
+    with pytest.raises(ValueError):
+        ImageTransport(encoding="bmp")
+    with pytest.raises(ValueError):
+        ImageTransport(transport="grpc")
+
+
+@patch("requests.Session.post")
+def test_json_transport_keeps_base64_payload(mock_post):
+    mock_post.return_value = _response()
+    ocr = RemoteOCR({"url": "http://ocr.test", "capabilities": {"result_cache": False}})
+    ocr.detect_text(_frame())
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["method"] == "easyocr"
+    assert base64.b64decode(payload["image"]).startswith(b"\x89PNG")
+
+
+@patch("requests.Session.post")
+def test_multipart_transport_sends_binary_and_rescales_boxes(mock_post):
+    mock_post.return_value = _response()
+    ocr = RemoteOCR({"url": "http://ocr.test", "capabilities": {
+        "result_cache": False, "transport": "multipart", "image_encoding": "jpeg", "max_image_dimension": 200,
+    }})
+    _, results = ocr.detect_text(_frame())
+    kwargs = mock_post.call_args.kwargs
+    assert "json" not in kwargs
+    name, data, mime = kwargs["files"]["image"]
+    assert mime == "image/jpeg" and data.startswith(b"\xff\xd8")
+    assert kwargs["data"] == {"method": "easyocr", "language": "en"}
+    # The frame was halved before upload, so boxes are doubled back.
+    assert results[0][0] == [(20, 20), (100, 20), (100, 60), (20, 60)]